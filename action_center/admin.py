@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Message, ForumTopic, Deadline
+from .models import Broadcast, Message, ForumTopic, Deadline, UserCounters
 
 
 @admin.register(Message)
@@ -55,3 +55,46 @@ class DeadlineAdmin(admin.ModelAdmin):
     search_fields = ["title", "description"]
     date_hierarchy = "due_date"
     readonly_fields = ["created_at", "updated_at", "completed_at"]
+
+
+@admin.register(UserCounters)
+class UserCountersAdmin(admin.ModelAdmin):
+    """Admin configuration for UserCounters model (read-only badge counts)."""
+
+    list_display = [
+        "user",
+        "unread_messages",
+        "urgent_unread",
+        "overdue_deadlines",
+        "active_topics",
+        "updated_at",
+    ]
+    search_fields = ["user__email"]
+    readonly_fields = UserCounters.COUNTER_FIELDS + ["overdue_as_of", "updated_at"]
+
+
+@admin.register(Broadcast)
+class BroadcastAdmin(admin.ModelAdmin):
+    """Admin configuration for Broadcast model."""
+
+    list_display = [
+        "subject",
+        "sender",
+        "target_type",
+        "status",
+        "recipients_count",
+        "emailed_count",
+        "created_at",
+    ]
+    list_filter = ["status", "target_type", "created_at"]
+    search_fields = ["subject", "body", "sender__email"]
+    readonly_fields = [
+        "status",
+        "recipients_count",
+        "emailed_count",
+        "error",
+        "email_error",
+        "created_at",
+        "claimed_at",
+        "completed_at",
+    ]
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class ActionCenterConfig(AppConfig):
     name = 'action_center'
+
+    def ready(self):
+        from . import checks, signals  # noqa: F401
@@ -0,0 +1,219 @@
+"""
+Broadcast delivery for SilabusLMS.
+
+A Broadcast is created once (subject/body stored a single time) and then
+delivered in two steps:
+1. Fan-out: BroadcastRecipient rows are bulk_created in chunks of
+   BROADCAST_CHUNK_SIZE (ignore_conflicts makes a retried run idempotent).
+2. Email: copies go out over ONE SMTP connection that is opened before the
+   first batch and closed after the last, instead of a connect/login per
+   message.
+
+Small audiences are delivered inside the request; larger ones are handed to
+a background thread after the transaction commits. The send_broadcasts
+command picks up anything left pending (e.g. after a worker restart) and
+takes over broadcasts stuck in SENDING for longer than
+BROADCAST_STALE_SECONDS (the worker died mid-delivery); both steps are
+idempotent, so a takeover only completes what is missing.
+
+The status reflects the fan-out: once every recipient row exists the
+broadcast is SENT, even if some emails could not be sent; those errors are
+kept in email_error. That includes email not being configured at all
+(settings.EMAIL_CONFIGURED), in which case no copy is attempted.
+"""
+
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Broadcast, BroadcastRecipient
+
+logger = logging.getLogger(__name__)
+
+EMAIL_NOT_CONFIGURED = "Email is not configured (EMAIL_HOST is not set)"
+
+
+def _chunk_size():
+    return getattr(settings, "BROADCAST_CHUNK_SIZE", 500)
+
+
+def _claimable(now):
+    """
+    Pending broadcasts, plus SENDING ones whose worker has gone quiet
+    (claimed before BROADCAST_STALE_SECONDS, or before claims were dated).
+    """
+    stale_before = now - timedelta(
+        seconds=getattr(settings, "BROADCAST_STALE_SECONDS", 1800)
+    )
+    return Q(status=Broadcast.STATUS_PENDING) | (
+        Q(status=Broadcast.STATUS_SENDING)
+        & (Q(claimed_at__lt=stale_before) | Q(claimed_at__isnull=True))
+    )
+
+
+def _chunks(queryset, key, size):
+    """
+    Yield lists of `size` rows from a values_list queryset, seeking on `key`
+    (first column) so rows can be written to between chunks.
+    """
+    last = None
+    while True:
+        page = queryset.order_by(key)
+        if last is not None:
+            page = page.filter(**{f"{key}__gt": last})
+        chunk = list(page[:size])
+        if not chunk:
+            return
+        yield chunk
+        last = chunk[-1][0] if isinstance(chunk[-1], tuple) else chunk[-1]
+
+
+def create_broadcast(
+    sender,
+    subject,
+    body,
+    target_type,
+    group=None,
+    course=None,
+    student_ids=None,
+    send_email=True,
+):
+    """
+    Create a broadcast and deliver it now or in the background depending on
+    the audience size.
+    """
+    broadcast = Broadcast.objects.create(
+        sender=sender,
+        subject=subject,
+        body=body,
+        target_type=target_type,
+        group=group,
+        course=course,
+        student_ids=student_ids or [],
+        send_email=send_email,
+    )
+    if broadcast.audience().count() <= getattr(settings, "BROADCAST_SYNC_LIMIT", 200):
+        deliver_broadcast(broadcast.pk)
+        broadcast.refresh_from_db()
+    else:
+        transaction.on_commit(lambda: deliver_in_background(broadcast.pk))
+    return broadcast
+
+
+def deliver_in_background(broadcast_id):
+    def run():
+        try:
+            deliver_broadcast(broadcast_id)
+        finally:
+            connections.close_all()
+
+    threading.Thread(
+        target=run, name=f"broadcast-{broadcast_id}", daemon=True
+    ).start()
+
+
+def deliver_broadcast(broadcast_id):
+    """
+    Fan out and email one pending (or stale SENDING) broadcast. Returns
+    False if another worker holds it.
+    """
+    now = timezone.now()
+    claimed = Broadcast.objects.filter(_claimable(now), pk=broadcast_id).update(
+        status=Broadcast.STATUS_SENDING, claimed_at=now
+    )
+    if not claimed:
+        return False
+
+    broadcast = Broadcast.objects.get(pk=broadcast_id)
+    try:
+        _fan_out(broadcast)
+    except Exception as e:
+        logger.exception("Broadcast %s fan-out failed", broadcast_id)
+        Broadcast.objects.filter(pk=broadcast_id).update(
+            status=Broadcast.STATUS_FAILED, error=str(e), completed_at=timezone.now()
+        )
+        return True
+
+    email_error = ""
+    if broadcast.send_email and not getattr(settings, "EMAIL_CONFIGURED", True):
+        logger.warning("Broadcast %s: email is not configured", broadcast_id)
+        email_error = EMAIL_NOT_CONFIGURED
+    elif broadcast.send_email:
+        try:
+            _send_emails(broadcast)
+        except Exception as e:
+            # Recipients already have the broadcast in-app; unsent copies
+            # keep emailed_at NULL
+            logger.exception("Broadcast %s email delivery failed", broadcast_id)
+            email_error = str(e)
+
+    Broadcast.objects.filter(pk=broadcast_id).update(
+        status=Broadcast.STATUS_SENT,
+        email_error=email_error,
+        completed_at=timezone.now(),
+    )
+    return True
+
+
+def _fan_out(broadcast):
+    audience = broadcast.audience()
+    key = "student_id" if broadcast.target_type == "course" else "pk"
+    for chunk in _chunks(audience, key, _chunk_size()):
+        BroadcastRecipient.objects.bulk_create(
+            [
+                BroadcastRecipient(broadcast=broadcast, student_id=student_id)
+                for student_id in chunk
+            ],
+            ignore_conflicts=True,
+        )
+    Broadcast.objects.filter(pk=broadcast.pk).update(
+        recipients_count=broadcast.recipients.count()
+    )
+
+
+def _send_emails(broadcast):
+    pending = (
+        BroadcastRecipient.objects.filter(broadcast=broadcast, emailed_at__isnull=True)
+        .exclude(student__email__isnull=True)
+        .exclude(student__email="")
+        .values_list("pk", "student__email")
+    )
+    connection = get_connection(fail_silently=False)
+    connection.open()
+    try:
+        for chunk in _chunks(pending, "pk", _chunk_size()):
+            messages = [
+                EmailMessage(
+                    subject=broadcast.subject,
+                    body=broadcast.body,
+                    from_email=settings.DEFAULT_FROM_EMAIL,
+                    to=[email],
+                    connection=connection,
+                )
+                for _, email in chunk
+            ]
+            sent = connection.send_messages(messages)
+            BroadcastRecipient.objects.filter(pk__in=[pk for pk, _ in chunk]).update(
+                emailed_at=timezone.now()
+            )
+            Broadcast.objects.filter(pk=broadcast.pk).update(
+                emailed_count=F("emailed_count") + sent
+            )
+    finally:
+        connection.close()
+
+
+def pending_broadcast_ids():
+    """Broadcasts to deliver: pending ones and stale SENDING claims."""
+    return list(
+        Broadcast.objects.filter(_claimable(timezone.now()))
+        .order_by("created_at")
+        .values_list("pk", flat=True)
+    )
+
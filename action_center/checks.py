@@ -0,0 +1,18 @@
+"""System checks for the Action Center."""
+
+from django.conf import settings
+from django.core.checks import Warning, register
+
+
+@register()
+def email_configured(app_configs, **kwargs):
+    if getattr(settings, "EMAIL_CONFIGURED", True):
+        return []
+    return [
+        Warning(
+            "EMAIL_HOST is not set, so broadcast emails are not sent.",
+            hint="Set EMAIL_HOST (and EMAIL_HOST_USER / EMAIL_HOST_PASSWORD), "
+            "or EMAIL_BACKEND to a non-SMTP backend.",
+            id="action_center.W001",
+        )
+    ]
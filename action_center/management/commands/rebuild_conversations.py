@@ -0,0 +1,47 @@
+"""
+Rebuild the denormalized inbox (Conversation rows) from Message.
+
+Needed once after deploying conversations, and to repair rows after
+messages are deleted or bulk-inserted without Conversation.record().
+
+Usage:
+    python manage.py rebuild_conversations
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from action_center.models import Conversation, Message
+
+
+class Command(BaseCommand):
+    help = "Rebuild inbox conversation rows from all messages"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        total = 0
+        with transaction.atomic():
+            Conversation.objects.all().delete()
+            batch = []
+            messages = Message.objects.only(
+                "id", "sender_id", "recipient_id", "course_id", "subject", "body",
+                "created_at",
+            ).order_by("created_at", "id")
+            for message in messages.iterator(chunk_size=batch_size):
+                batch.append(message)
+                if len(batch) >= batch_size:
+                    Conversation.record(batch)
+                    total += len(batch)
+                    batch = []
+            Conversation.record(batch)
+            total += len(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {Conversation.objects.count()} conversations "
+                f"from {total} messages"
+            )
+        )
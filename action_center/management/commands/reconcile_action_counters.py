@@ -0,0 +1,41 @@
+"""
+Reconcile Action Center badge counters.
+
+Run periodically (cron / PythonAnywhere scheduled task):
+- every few minutes with --sweep-only to count deadlines that became
+  overdue since the last run (one UPDATE)
+- hourly or nightly without flags to recompute every row from the source
+  tables, repairing drift from bulk updates or lost signals
+
+Usage:
+    python manage.py reconcile_action_counters
+    python manage.py reconcile_action_counters --sweep-only
+"""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from action_center.models import UserCounters
+
+
+class Command(BaseCommand):
+    help = "Sweep overdue deadlines into UserCounters and repair drifted rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sweep-only",
+            action="store_true",
+            help="Only add deadlines that crossed their due date since the last run",
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        if options["sweep_only"]:
+            swept = UserCounters.sweep_overdue(now=now)
+            self.stdout.write(self.style.SUCCESS(f"Swept overdue deadlines for {swept} users"))
+            return
+
+        drifted = UserCounters.rebuild(now=now)
+        total = UserCounters.objects.count()
+        style = self.style.WARNING if drifted else self.style.SUCCESS
+        self.stdout.write(style(f"Reconciled {total} counter rows ({drifted} had drifted)"))
@@ -0,0 +1,27 @@
+"""
+Deliver pending broadcasts.
+
+Large broadcasts are delivered by a background thread in the web process;
+schedule this command (cron / PythonAnywhere task) to finish any that were
+left pending, e.g. because the worker was recycled before the thread ran, or
+stuck in SENDING for longer than BROADCAST_STALE_SECONDS because it died
+mid-delivery.
+
+Usage:
+    python manage.py send_broadcasts
+"""
+
+from django.core.management.base import BaseCommand
+
+from action_center.broadcasts import deliver_broadcast, pending_broadcast_ids
+
+
+class Command(BaseCommand):
+    help = "Fan out and email every pending broadcast"
+
+    def handle(self, *args, **options):
+        delivered = 0
+        for broadcast_id in pending_broadcast_ids():
+            if deliver_broadcast(broadcast_id):
+                delivered += 1
+        self.stdout.write(self.style.SUCCESS(f"Delivered {delivered} broadcasts"))
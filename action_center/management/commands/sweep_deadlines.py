@@ -0,0 +1,31 @@
+"""
+Deadline state sweeper.
+
+Deadlines change state just because time passes (upcoming -> due_soon ->
+overdue). This moves the stored Deadline.status with set-based UPDATEs and
+adds the newly overdue ones to the teachers' badge counters (see
+action_center.sweeper).
+
+Schedule it every minute or few (cron / PythonAnywhere scheduled task);
+lists filtering on status are at most one interval behind the clock.
+
+Usage:
+    python manage.py sweep_deadlines
+"""
+
+from django.core.management.base import BaseCommand
+
+from action_center.sweeper import run_sweep
+
+
+class Command(BaseCommand):
+    help = "Move deadlines between upcoming, due-soon and overdue states"
+
+    def handle(self, *args, **options):
+        moved, newly_overdue = run_sweep()
+        summary = ", ".join(f"{count} {status}" for status, count in moved.items())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Swept deadlines: {summary} ({len(newly_overdue)} newly overdue)"
+            )
+        )
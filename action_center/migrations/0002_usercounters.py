@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-19 02:45
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('action_center', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserCounters',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='action_counters', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('unread_messages', models.IntegerField(default=0)),
+                ('urgent_unread', models.IntegerField(default=0)),
+                ('overdue_deadlines', models.IntegerField(default=0)),
+                ('active_topics', models.IntegerField(default=0)),
+                ('overdue_as_of', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'User Counters',
+                'verbose_name_plural': 'User Counters',
+            },
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.30 on 2026-10-19 02:50
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0003_interest_student_interests_json_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('dashboard', '0005_course_enrollment_code_alter_course_room'),
+        ('action_center', '0003_conversations'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Broadcast',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=200)),
+                ('body', models.TextField()),
+                ('target_type', models.CharField(choices=[('group', 'Group'), ('course', 'Course'), ('students', 'Selected students')], max_length=10)),
+                ('student_ids', models.JSONField(blank=True, default=list, help_text='Used when target_type is "students"')),
+                ('send_email', models.BooleanField(default=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed')], db_index=True, default='pending', max_length=10)),
+                ('recipients_count', models.PositiveIntegerField(default=0)),
+                ('emailed_count', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('course', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='broadcasts', to='dashboard.course')),
+                ('group', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='broadcasts', to='dashboard.group')),
+                ('sender', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='broadcasts', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Broadcast',
+                'verbose_name_plural': 'Broadcasts',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BroadcastRecipient',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('emailed_at', models.DateTimeField(blank=True, null=True)),
+                ('broadcast', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recipients', to='action_center.broadcast')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='broadcasts', to='students.student')),
+            ],
+            options={
+                'verbose_name': 'Broadcast Recipient',
+                'verbose_name_plural': 'Broadcast Recipients',
+                'unique_together': {('broadcast', 'student')},
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-19 02:53
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_status(apps, schema_editor):
+    Deadline = apps.get_model('action_center', 'Deadline')
+    now = timezone.now()
+    soon = now + timedelta(days=4)
+    Deadline.objects.filter(is_completed=True).update(status='completed')
+    Deadline.objects.filter(is_completed=False, due_date__lt=now).update(status='overdue')
+    Deadline.objects.filter(
+        is_completed=False, due_date__gte=now, due_date__lt=soon
+    ).update(status='due_soon')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('action_center', '0004_broadcasts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='deadline',
+            name='status',
+            field=models.CharField(choices=[('upcoming', 'Upcoming'), ('due_soon', 'Due soon'), ('overdue', 'Overdue'), ('completed', 'Completed')], default='upcoming', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='deadline',
+            index=models.Index(fields=['status', 'due_date'], name='action_cent_status_722f88_idx'),
+        ),
+        migrations.RunPython(backfill_status, migrations.RunPython.noop),
+    ]
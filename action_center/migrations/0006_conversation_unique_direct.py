@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:22
+
+from django.db import migrations, models
+
+
+def merge_duplicate_direct_conversations(apps, schema_editor):
+    """Fold course-less duplicates (from racing first messages) into one row."""
+    Conversation = apps.get_model('action_center', 'Conversation')
+    rows = Conversation.objects.filter(course__isnull=True).order_by(
+        'owner_id', 'counterpart_id', '-last_message_at', '-id'
+    )
+    kept = {}
+    for row in rows.iterator():
+        key = (row.owner_id, row.counterpart_id)
+        if key not in kept:
+            kept[key] = row
+            continue
+        # Ordered newest first: the kept row already has the latest message
+        kept[key].message_count += row.message_count
+        kept[key].save(update_fields=['message_count'])
+        row.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('action_center', '0005_deadline_status'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            merge_duplicate_direct_conversations, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name='conversation',
+            constraint=models.UniqueConstraint(condition=models.Q(('course__isnull', True)), fields=('owner', 'counterpart'), name='action_center_conversation_unique_direct'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('action_center', '0006_conversation_unique_direct'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='broadcast',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='broadcast',
+            name='email_error',
+            field=models.TextField(blank=True),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:37
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def fill_course_keys(apps, schema_editor):
+    """Copy course_id into course_key and fold duplicate threads together."""
+    Conversation = apps.get_model('action_center', 'Conversation')
+    Conversation.objects.filter(course__isnull=False).update(course_key=F('course_id'))
+    rows = Conversation.objects.order_by(
+        'owner_id', 'counterpart_id', 'course_key', '-last_message_at', '-id'
+    )
+    kept = {}
+    for row in rows.iterator():
+        key = (row.owner_id, row.counterpart_id, row.course_key)
+        if key not in kept:
+            kept[key] = row
+            continue
+        # Ordered newest first: the kept row already has the latest message
+        kept[key].message_count += row.message_count
+        kept[key].save(update_fields=['message_count'])
+        row.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('action_center', '0007_broadcast_claims'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='conversation',
+            name='action_center_conversation_unique_direct',
+        ),
+        migrations.AlterUniqueTogether(
+            name='conversation',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='course_key',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_course_keys, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='conversation',
+            unique_together={('owner', 'counterpart', 'course_key')},
+        ),
+    ]
@@ -5,16 +5,158 @@ These models power the "Casino Slot" ticker on the dashboard:
 - Message: Unread messages between teachers/parents
 - ForumTopic: Active course discussion threads
 - Deadline: Upcoming/missed assignment deadlines
+- UserCounters: Denormalized badge counts per user
+- Conversation: Denormalized inbox rows (one per participant and thread)
+- Broadcast: One message fanned out to a Group, Course or student selection
 
 Brand Colors:
 - Deep Forest Green: #2C5545
 - Cream: #F9F9F7
 """
 
-from django.db import models
+from datetime import timedelta
+from operator import attrgetter
+
+from django.db import models, transaction
+from django.db.models import Case, Count, F, Q, Value, When
 from django.conf import settings
 from django.utils import timezone
 
+from . import notify
+
+# Keeps IN (...) lists well under SQLite's bound-parameter limit
+BULK_CHUNK_SIZE = 500
+
+
+def _chunks(items, size=BULK_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class MessageQuerySet(models.QuerySet):
+    def mark_read(self, now=None):
+        """
+        Mark every unread message in this queryset as read with set-based
+        UPDATEs (chunked by id) and move the recipients' UserCounters in the
+        same transaction. Returns the number of messages marked read.
+        """
+        now = now or timezone.now()
+        with transaction.atomic():
+            rows = list(
+                self.filter(is_read=False)
+                .select_for_update()
+                .order_by()
+                .values_list("pk", "recipient_id", "priority")
+            )
+            if not rows:
+                return 0
+
+            updated = 0
+            for chunk in _chunks([pk for pk, _, _ in rows]):
+                updated += Message.objects.filter(pk__in=chunk, is_read=False).update(
+                    is_read=True, read_at=now
+                )
+
+            deltas = {}
+            for _, recipient_id, priority in rows:
+                unread, urgent = deltas.get(recipient_id, (0, 0))
+                deltas[recipient_id] = (unread + 1, urgent + (priority == "urgent"))
+            for recipient_id, (unread, urgent) in deltas.items():
+                UserCounters.objects.filter(user_id=recipient_id).update(
+                    unread_messages=F("unread_messages") - unread,
+                    urgent_unread=F("urgent_unread") - urgent,
+                )
+            notify.counters_changed(user_ids=deltas)
+        return updated
+
+
+class DeadlineQuerySet(models.QuerySet):
+    def mark_complete(self, now=None):
+        """
+        Complete every open deadline in this queryset with set-based
+        UPDATEs and decrement the course teachers' overdue counters in the
+        same transaction. Returns the number of deadlines completed.
+        """
+        from dashboard.models import Course
+
+        now = now or timezone.now()
+        with transaction.atomic():
+            rows = list(
+                self.filter(is_completed=False)
+                .select_for_update()
+                .order_by()
+                .values_list("pk", "course_id", "due_date")
+            )
+            if not rows:
+                return 0
+
+            updated = 0
+            for chunk in _chunks([pk for pk, _, _ in rows]):
+                updated += Deadline.objects.filter(
+                    pk__in=chunk, is_completed=False
+                ).update(
+                    is_completed=True,
+                    completed_at=now,
+                    status=Deadline.STATUS_COMPLETED,
+                    updated_at=now,
+                )
+
+            teachers = dict(
+                Course.objects.filter(pk__in={course_id for _, course_id, _ in rows})
+                .values_list("pk", "teacher_id")
+            )
+            counters = {
+                row.user_id: row
+                for row in UserCounters.objects.select_for_update().filter(
+                    user_id__in=set(teachers.values())
+                )
+            }
+            # Only deadlines already counted as overdue (see UserCounters)
+            overdue = {}
+            for _, course_id, due_date in rows:
+                row = counters.get(teachers.get(course_id))
+                if row is not None and due_date <= row.overdue_as_of:
+                    overdue[row.user_id] = overdue.get(row.user_id, 0) + 1
+            for user_id, count in overdue.items():
+                UserCounters.objects.filter(user_id=user_id).update(
+                    overdue_deadlines=F("overdue_deadlines") - count
+                )
+            notify.counters_changed(user_ids=teachers.values())
+            notify.deadlines_changed(pk for pk, _, _ in rows)
+        return updated
+
+    def sweep_statuses(self, now=None):
+        """
+        Move open deadlines between upcoming, due_soon and overdue (and
+        completed ones to completed) with one set-based UPDATE per target
+        state, each driven by the (is_completed, due_date) index.
+        Returns ({status: rows moved}, [ids that just became overdue]).
+        """
+        now = now or timezone.now()
+        soon = now + timedelta(days=Deadline.DUE_SOON_DAYS + 1)
+        targets = [
+            (Deadline.STATUS_OVERDUE, Q(is_completed=False, due_date__lt=now)),
+            (
+                Deadline.STATUS_DUE_SOON,
+                Q(is_completed=False, due_date__gte=now, due_date__lt=soon),
+            ),
+            (Deadline.STATUS_UPCOMING, Q(is_completed=False, due_date__gte=soon)),
+            (Deadline.STATUS_COMPLETED, Q(is_completed=True)),
+        ]
+        moved, newly_overdue = {}, []
+        with transaction.atomic():
+            for status, condition in targets:
+                stale = self.filter(condition).exclude(status=status)
+                if status == Deadline.STATUS_OVERDUE:
+                    newly_overdue = list(stale.values_list("pk", flat=True))
+                    moved[status] = sum(
+                        Deadline.objects.filter(pk__in=chunk).update(status=status)
+                        for chunk in _chunks(newly_overdue)
+                    )
+                else:
+                    moved[status] = stale.update(status=status)
+        return moved, newly_overdue
+
 
 class Message(models.Model):
     """
@@ -57,6 +199,8 @@ class Message(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     read_at = models.DateTimeField(null=True, blank=True)
 
+    objects = MessageQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Message"
         verbose_name_plural = "Messages"
@@ -64,6 +208,8 @@ class Message(models.Model):
         indexes = [
             models.Index(fields=["recipient", "is_read"]),
             models.Index(fields=["created_at"]),
+            # Conversation threads: each direction is one index range
+            models.Index(fields=["recipient", "sender", "course", "created_at"]),
         ]
 
     def __str__(self):
@@ -183,6 +329,8 @@ class ForumTopic(models.Model):
 
     def to_dict(self):
         """Full topic representation for API responses."""
+        from cadmus.counter_buffer import view_counts
+
         return {
             "id": self.id,
             "title": self.title,
@@ -192,7 +340,7 @@ class ForumTopic(models.Model):
             "course_id": self.course.id,
             "course_name": self.course.name,
             "replies_count": self.replies_count,
-            "views_count": self.views_count,
+            "views_count": self.views_count + view_counts.pending(ForumTopic, self.id),
             "status": self.status,
             "is_pinned": self.is_pinned,
             "is_announcement": self.is_announcement,
@@ -242,6 +390,24 @@ class Deadline(models.Model):
     is_completed = models.BooleanField(default=False)
     completed_at = models.DateTimeField(null=True, blank=True)
 
+    # Stored state so lists can filter in SQL; kept current by save() and
+    # the sweep_deadlines command (time-driven transitions)
+    STATUS_UPCOMING = "upcoming"
+    STATUS_DUE_SOON = "due_soon"
+    STATUS_OVERDUE = "overdue"
+    STATUS_COMPLETED = "completed"
+    STATUS_CHOICES = [
+        (STATUS_UPCOMING, "Upcoming"),
+        (STATUS_DUE_SOON, "Due soon"),
+        (STATUS_OVERDUE, "Overdue"),
+        (STATUS_COMPLETED, "Completed"),
+    ]
+    DUE_SOON_DAYS = 3
+
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=STATUS_UPCOMING
+    )
+
     # Creator
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -253,6 +419,8 @@ class Deadline(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = DeadlineQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Deadline"
         verbose_name_plural = "Deadlines"
@@ -260,29 +428,57 @@ class Deadline(models.Model):
         indexes = [
             models.Index(fields=["course", "due_date"]),
             models.Index(fields=["is_completed", "due_date"]),
+            models.Index(fields=["status", "due_date"]),
         ]
 
     def __str__(self):
         return f"{self.title} - Due: {self.due_date.strftime('%b %d')}"
 
+    def status_at(self, now):
+        """
+        Return (is_overdue, is_upcoming, days_remaining) relative to `now`.
+        Lets list renderers compute the clock once instead of per property.
+        """
+        days_remaining = (self.due_date - now).days
+        if self.is_completed:
+            return False, False, days_remaining
+        return (
+            self.due_date < now,
+            0 <= days_remaining <= self.DUE_SOON_DAYS,
+            days_remaining,
+        )
+
+    def compute_status(self, now):
+        """The stored status this deadline should have at `now`."""
+        if self.is_completed:
+            return self.STATUS_COMPLETED
+        is_overdue, is_upcoming, _ = self.status_at(now)
+        if is_overdue:
+            return self.STATUS_OVERDUE
+        return self.STATUS_DUE_SOON if is_upcoming else self.STATUS_UPCOMING
+
+    def save(self, *args, **kwargs):
+        """Keep the stored status in step with due_date/is_completed."""
+        self.status = self.compute_status(timezone.now())
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "status" not in update_fields:
+            kwargs["update_fields"] = list(update_fields) + ["status"]
+        super().save(*args, **kwargs)
+
     @property
     def is_overdue(self):
         """Check if deadline has passed and is not completed."""
-        return not self.is_completed and self.due_date < timezone.now()
+        return self.status_at(timezone.now())[0]
 
     @property
     def is_upcoming(self):
         """Check if deadline is within the next 3 days."""
-        if self.is_completed:
-            return False
-        time_until = self.due_date - timezone.now()
-        return 0 <= time_until.days <= 3
+        return self.status_at(timezone.now())[1]
 
     @property
     def days_remaining(self):
         """Calculate days until/since deadline."""
-        delta = self.due_date - timezone.now()
-        return delta.days
+        return self.status_at(timezone.now())[2]
 
     def mark_complete(self):
         """Mark this deadline as completed."""
@@ -291,17 +487,18 @@ class Deadline(models.Model):
             self.completed_at = timezone.now()
             self.save(update_fields=["is_completed", "completed_at"])
 
-    def to_ticker_dict(self):
+    def to_ticker_dict(self, now=None):
         """
         Return data formatted for the Casino Slot ticker animation.
         Highlights overdue status and urgency.
         """
-        if self.is_overdue:
+        is_overdue, is_upcoming, days_remaining = self.status_at(now or timezone.now())
+        if is_overdue:
             status_icon = "🔴"
-            status_text = f"{abs(self.days_remaining)} days overdue"
-        elif self.is_upcoming:
+            status_text = f"{abs(days_remaining)} days overdue"
+        elif is_upcoming:
             status_icon = "🟠"
-            status_text = f"Due in {self.days_remaining} days"
+            status_text = f"Due in {days_remaining} days"
         else:
             status_icon = "🟢"
             status_text = f"Due {self.due_date.strftime('%b %d')}"
@@ -313,8 +510,8 @@ class Deadline(models.Model):
             "title": self.title[:50] + ("..." if len(self.title) > 50 else ""),
             "subtitle": f"{status_text} • {self.course.name}",
             "priority": self.priority,
-            "is_overdue": self.is_overdue,
-            "is_upcoming": self.is_upcoming,
+            "is_overdue": is_overdue,
+            "is_upcoming": is_upcoming,
             "deadline_type": self.deadline_type,
             "due_date": self.due_date.strftime("%b %d, %I:%M %p"),
             "course_name": self.course.name,
@@ -338,3 +535,517 @@ class Deadline(models.Model):
             "created_by_id": self.created_by.id,
             "created_at": self.created_at.isoformat(),
         }
+
+
+class UserCounters(models.Model):
+    """
+    Denormalized badge counts, one row per user, so rendering a badge is a
+    single primary-key lookup instead of a COUNT per page.
+
+    Kept current by signals in action_center/signals.py (F() deltas on
+    Message/Deadline/ForumTopic saves and deletes). Deadlines that become
+    overdue just by the clock passing are added by sweep_overdue(); the
+    reconcile_action_counters command runs both and repairs any drift.
+
+    overdue_deadlines counts incomplete deadlines with due_date at or
+    before overdue_as_of, which lets completions and edits adjust the
+    counter only when the deadline was actually counted.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="action_counters",
+    )
+    unread_messages = models.IntegerField(default=0)
+    urgent_unread = models.IntegerField(default=0)
+    overdue_deadlines = models.IntegerField(default=0)
+    active_topics = models.IntegerField(default=0)
+
+    overdue_as_of = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    COUNTER_FIELDS = [
+        "unread_messages",
+        "urgent_unread",
+        "overdue_deadlines",
+        "active_topics",
+    ]
+
+    class Meta:
+        verbose_name = "User Counters"
+        verbose_name_plural = "User Counters"
+
+    def __str__(self):
+        return f"Counters for {self.user}"
+
+    @classmethod
+    def for_user(cls, user):
+        """
+        Return the user's counters row, building it on first access (safe
+        when two first requests race: rebuild() ignores the duplicate insert
+        and the row is re-read).
+        """
+        counters = cls.objects.filter(user_id=user.pk).first()
+        if counters is None:
+            cls.rebuild(user_ids=[user.pk])
+            counters = cls.objects.get(user_id=user.pk)
+        return counters
+
+    @classmethod
+    def compute(cls, user_ids=None, now=None):
+        """
+        Count everything from the source tables, grouped by user.
+        Returns {user_id: {field: value}} for users with at least one item.
+        """
+        now = now or timezone.now()
+        totals = {}
+
+        def add(rows, key, **fields):
+            for row in rows:
+                entry = totals.setdefault(row[key], dict.fromkeys(cls.COUNTER_FIELDS, 0))
+                for field, source in fields.items():
+                    entry[field] = row[source]
+
+        messages = Message.objects.filter(is_read=False)
+        deadlines = Deadline.objects.filter(is_completed=False, due_date__lte=now)
+        topics = ForumTopic.objects.filter(status="open")
+        if user_ids is not None:
+            messages = messages.filter(recipient_id__in=user_ids)
+            deadlines = deadlines.filter(course__teacher_id__in=user_ids)
+            topics = topics.filter(course__teacher_id__in=user_ids)
+
+        add(
+            messages.values("recipient_id").annotate(
+                unread=Count("id"), urgent=Count("id", filter=Q(priority="urgent"))
+            ),
+            "recipient_id",
+            unread_messages="unread",
+            urgent_unread="urgent",
+        )
+        add(
+            deadlines.values("course__teacher_id").annotate(total=Count("id")),
+            "course__teacher_id",
+            overdue_deadlines="total",
+        )
+        add(
+            topics.values("course__teacher_id").annotate(total=Count("id")),
+            "course__teacher_id",
+            active_topics="total",
+        )
+        return totals
+
+    @classmethod
+    def rebuild(cls, user_ids=None, now=None):
+        """
+        Recompute counters from the source tables (all users by default),
+        creating missing rows. Returns the number of rows that were wrong.
+        """
+        from django.contrib.auth import get_user_model
+
+        now = now or timezone.now()
+        users = get_user_model().objects.all()
+        if user_ids is not None:
+            users = users.filter(pk__in=user_ids)
+
+        with transaction.atomic():
+            totals = cls.compute(user_ids=user_ids, now=now)
+            existing = {
+                row.user_id: row
+                for row in cls.objects.select_for_update().filter(
+                    user_id__in=users.values("pk")
+                )
+            }
+            to_create, to_update = [], []
+            for user_id in users.values_list("pk", flat=True):
+                values = totals.get(user_id, dict.fromkeys(cls.COUNTER_FIELDS, 0))
+                row = existing.get(user_id)
+                if row is None:
+                    to_create.append(cls(user_id=user_id, overdue_as_of=now, **values))
+                    continue
+                if any(getattr(row, field) != values[field] for field in values):
+                    for field, value in values.items():
+                        setattr(row, field, value)
+                    to_update.append(row)
+
+            # A concurrent first request may have created the row meanwhile;
+            # it holds the same counts, so losing the insert race is fine
+            cls.objects.bulk_create(to_create, ignore_conflicts=True)
+            cls.objects.bulk_update(to_update, cls.COUNTER_FIELDS)
+            # Every row now counts overdue deadlines as of `now`
+            cls.objects.filter(user_id__in=users.values("pk")).update(
+                overdue_as_of=now
+            )
+        return len(to_update)
+
+    @classmethod
+    def sweep_overdue(cls, now=None):
+        """
+        Add deadlines that crossed their due date since each row's
+        overdue_as_of, in one set-based UPDATE. Returns rows touched.
+        """
+        from django.db.models import OuterRef, Subquery
+        from django.db.models.functions import Coalesce
+
+        now = now or timezone.now()
+        crossed = (
+            Deadline.objects.filter(
+                course__teacher_id=OuterRef("user_id"),
+                is_completed=False,
+                due_date__gt=OuterRef("overdue_as_of"),
+                due_date__lte=now,
+            )
+            .order_by()
+            .values("course__teacher_id")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        return cls.objects.filter(overdue_as_of__lt=now).update(
+            overdue_deadlines=F("overdue_deadlines")
+            + Coalesce(Subquery(crossed), 0),
+            overdue_as_of=now,
+        )
+
+    def to_dict(self):
+        """Badge counts for API responses."""
+        return {field: getattr(self, field) for field in self.COUNTER_FIELDS}
+
+
+class Conversation(models.Model):
+    """
+    One inbox row per participant and thread, where a thread is all
+    messages between two users about one course (or no course).
+
+    last_message_at / last_message_preview are denormalized from the newest
+    message so the inbox is a keyset scan of this table instead of a
+    GROUP BY over every message. Rows are folded in by Conversation.record()
+    (called from the Message post_save signal) and can be rebuilt with the
+    rebuild_conversations command.
+    """
+
+    PREVIEW_LENGTH = 120
+    RECORD_CHUNK_SIZE = 200  # Conversations per UPDATE in record()
+
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="conversations",
+    )
+    counterpart = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    course = models.ForeignKey(
+        "dashboard.Course",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    # course_id, or 0 for direct messages: a non-null key, so the unique
+    # index below also holds course-less conversations on every backend
+    # (NULLs never collide, and MySQL has no partial indexes)
+    course_key = models.PositiveBigIntegerField(default=0, editable=False)
+
+    last_message = models.ForeignKey(
+        Message,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    last_message_at = models.DateTimeField()
+    last_message_preview = models.CharField(max_length=PREVIEW_LENGTH, blank=True)
+    message_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Conversation"
+        verbose_name_plural = "Conversations"
+        ordering = ["-last_message_at", "-id"]
+        unique_together = ["owner", "counterpart", "course_key"]
+        indexes = [
+            models.Index(fields=["owner", "-last_message_at", "-id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.owner} <-> {self.counterpart}"
+
+    def save(self, *args, **kwargs):
+        self.course_key = self.course_id or 0
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def preview_for(cls, message):
+        text = f"{message.subject}: {message.body}" if message.body else message.subject
+        text = " ".join(text.split())
+        if len(text) > cls.PREVIEW_LENGTH:
+            text = text[: cls.PREVIEW_LENGTH - 3] + "..."
+        return text
+
+    @classmethod
+    def _key_filter(cls, key):
+        owner_id, counterpart_id, course_id = key
+        return Q(
+            owner_id=owner_id, counterpart_id=counterpart_id, course_key=course_id or 0
+        )
+
+    @classmethod
+    def record(cls, messages):
+        """
+        Fold saved messages into both participants' conversation rows: one
+        INSERT ... ON CONFLICT DO NOTHING for rows that may be missing, then
+        one UPDATE per RECORD_CHUNK_SIZE conversations adding the counts
+        with F() and moving last_message forward only if it is newer. Safe
+        for concurrent first messages: the unique (owner, counterpart,
+        course_key) index makes a losing insert a no-op and every increment
+        is applied in SQL.
+        """
+        latest, counts = {}, {}
+        for message in messages:
+            pairs = {
+                (message.recipient_id, message.sender_id),
+                (message.sender_id, message.recipient_id),
+            }
+            for owner_id, counterpart_id in pairs:
+                key = (owner_id, counterpart_id, message.course_id)
+                counts[key] = counts.get(key, 0) + 1
+                current = latest.get(key)
+                if current is None or (message.created_at, message.pk) > (
+                    current.created_at,
+                    current.pk,
+                ):
+                    latest[key] = message
+        if not latest:
+            return
+
+        keys = list(latest)
+        with transaction.atomic():
+            cls.objects.bulk_create(
+                [
+                    cls(
+                        owner_id=key[0],
+                        counterpart_id=key[1],
+                        course_id=key[2],
+                        course_key=key[2] or 0,
+                        last_message_at=latest[key].created_at,
+                    )
+                    for key in keys
+                ],
+                ignore_conflicts=True,
+            )
+            for start in range(0, len(keys), cls.RECORD_CHUNK_SIZE):
+                chunk = keys[start : start + cls.RECORD_CHUNK_SIZE]
+                matches = Q()
+                for key in chunk:
+                    matches |= cls._key_filter(key)
+                cls.objects.filter(matches).update(
+                    message_count=F("message_count")
+                    + Case(
+                        *[
+                            When(cls._key_filter(key), then=Value(counts[key]))
+                            for key in chunk
+                        ],
+                        default=Value(0),
+                    ),
+                    last_message_preview=cls._if_newer(
+                        chunk, latest, "last_message_preview", cls.preview_for
+                    ),
+                    last_message_at=cls._if_newer(
+                        chunk, latest, "last_message_at", attrgetter("created_at")
+                    ),
+                    last_message=cls._if_newer(
+                        chunk, latest, "last_message", attrgetter("pk")
+                    ),
+                )
+
+    @classmethod
+    def _if_newer(cls, keys, latest, field_name, value):
+        """
+        CASE setting `field_name` to value(latest[key]) on each key's row
+        whose stored last message is not newer; other rows keep theirs.
+        """
+        field = cls._meta.get_field(field_name)
+        if field.is_relation:
+            field = field.target_field
+        return Case(
+            *[
+                When(
+                    cls._key_filter(key)
+                    & (
+                        Q(last_message__isnull=True)
+                        | Q(last_message_at__lte=latest[key].created_at)
+                    ),
+                    then=Value(value(latest[key]), output_field=field),
+                )
+                for key in keys
+            ],
+            default=F(field_name),
+            output_field=field,
+        )
+
+    def message_streams(self):
+        """
+        The thread as two querysets, one per direction. Each is a single
+        (recipient, sender, course, created_at) index range, so a keyset page
+        merges two short index scans instead of sorting the whole thread.
+        """
+        directions = {
+            (self.owner_id, self.counterpart_id),
+            (self.counterpart_id, self.owner_id),
+        }
+        return [
+            Message.objects.filter(
+                sender_id=sender_id, recipient_id=recipient_id, course_id=self.course_id
+            )
+            for sender_id, recipient_id in sorted(directions)
+        ]
+
+    def to_dict(self):
+        """Inbox row representation for API responses."""
+        return {
+            "id": self.id,
+            "counterpart_id": self.counterpart_id,
+            "counterpart_name": self.counterpart.full_name,
+            "course_id": self.course_id,
+            "course_name": self.course.name if self.course else None,
+            "last_message_id": self.last_message_id,
+            "last_message_at": self.last_message_at.isoformat(),
+            "last_message_preview": self.last_message_preview,
+            "message_count": self.message_count,
+        }
+
+
+class Broadcast(models.Model):
+    """
+    One message sent to many students (a Group, a Course or a selection).
+    The subject/body are stored once here; BroadcastRecipient rows only link
+    students to it. Delivery is done by action_center.broadcasts.
+    """
+
+    TARGET_CHOICES = [
+        ("group", "Group"),
+        ("course", "Course"),
+        ("students", "Selected students"),
+    ]
+
+    STATUS_PENDING = "pending"
+    STATUS_SENDING = "sending"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_SENDING, "Sending"),
+        (STATUS_SENT, "Sent"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    sender = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="broadcasts",
+    )
+    subject = models.CharField(max_length=200)
+    body = models.TextField()
+
+    # Audience
+    target_type = models.CharField(max_length=10, choices=TARGET_CHOICES)
+    group = models.ForeignKey(
+        "dashboard.Group",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="broadcasts",
+    )
+    course = models.ForeignKey(
+        "dashboard.Course",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="broadcasts",
+    )
+    student_ids = models.JSONField(
+        default=list, blank=True, help_text='Used when target_type is "students"'
+    )
+    send_email = models.BooleanField(default=True)
+
+    # Delivery tracking
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, db_index=True
+    )
+    recipients_count = models.PositiveIntegerField(default=0)
+    emailed_count = models.PositiveIntegerField(default=0)
+    # Fan-out failure (status FAILED); email problems go to email_error and
+    # do not fail a broadcast whose recipients already have it
+    error = models.TextField(blank=True)
+    email_error = models.TextField(blank=True)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    # When a worker moved it to SENDING; stale claims are taken over
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Broadcast"
+        verbose_name_plural = "Broadcasts"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.subject} ({self.get_target_type_display()})"
+
+    def audience(self):
+        """Queryset of the targeted students' ids."""
+        from dashboard.models import CourseStudent
+        from students.models import Student
+
+        if self.target_type == "group":
+            return Student.objects.filter(group_id=self.group_id).values_list(
+                "pk", flat=True
+            )
+        if self.target_type == "course":
+            return CourseStudent.objects.filter(course_id=self.course_id).values_list(
+                "student_id", flat=True
+            )
+        return Student.objects.filter(pk__in=self.student_ids).values_list(
+            "pk", flat=True
+        )
+
+    def to_dict(self):
+        """Broadcast representation for API responses."""
+        return {
+            "id": self.id,
+            "subject": self.subject,
+            "target_type": self.target_type,
+            "group_id": self.group_id,
+            "course_id": self.course_id,
+            "send_email": self.send_email,
+            "status": self.status,
+            "recipients_count": self.recipients_count,
+            "emailed_count": self.emailed_count,
+            "error": self.error,
+            "email_error": self.email_error,
+            "created_at": self.created_at.isoformat(),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+        }
+
+
+class BroadcastRecipient(models.Model):
+    """A student's copy of a Broadcast (no per-recipient body)."""
+
+    broadcast = models.ForeignKey(
+        Broadcast, on_delete=models.CASCADE, related_name="recipients"
+    )
+    student = models.ForeignKey(
+        "students.Student", on_delete=models.CASCADE, related_name="broadcasts"
+    )
+    emailed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Broadcast Recipient"
+        verbose_name_plural = "Broadcast Recipients"
+        unique_together = ["broadcast", "student"]
+
+    def __str__(self):
+        return f"{self.broadcast} -> {self.student}"
@@ -0,0 +1,101 @@
+"""
+Change notifications for the Action Center.
+
+Whenever badge counts or ticker items change, the affected users' cached
+ticker feed is dropped and a delta is pushed to their open event streams
+(cadmus.pubsub). Both happen after the surrounding transaction commits, and
+payloads are only built for users that currently have a stream open.
+"""
+
+from django.db import transaction
+
+from cadmus.pubsub import ALL_USERS, broker
+
+
+def _teachers_of(course_ids):
+    from dashboard.models import Course
+
+    return set(
+        Course.objects.filter(pk__in=course_ids).values_list("teacher_id", flat=True)
+    )
+
+
+def counters_changed(user_ids=(), course_ids=()):
+    """UserCounters moved for these users (or the teachers of these courses)."""
+    user_ids, course_ids = set(user_ids), set(course_ids)
+
+    def send():
+        from .models import UserCounters
+        from .views import invalidate_feed
+
+        targets = user_ids | (_teachers_of(course_ids) if course_ids else set())
+        for user_id in targets:
+            invalidate_feed(user_id)
+        listening = [user_id for user_id in targets if broker.has_subscribers(user_id)]
+        for counters in UserCounters.objects.filter(user_id__in=listening):
+            broker.publish(counters.user_id, "counters", counters.to_dict())
+
+    transaction.on_commit(send)
+
+
+def message_created(message):
+    """Push the new message's ticker item to the recipient."""
+    broker.publish_on_commit(
+        message.recipient_id, "message", lambda: message.to_ticker_dict()
+    )
+
+
+def deadline_changed(deadline, deleted=False):
+    """Push a deadline's new state (or its removal) to the course teacher."""
+    course_id, deadline_id = deadline.course_id, deadline.pk
+
+    def send():
+        if not broker.has_subscribers(ALL_USERS):
+            return
+        for teacher_id in _teachers_of([course_id]):
+            if not broker.has_subscribers(teacher_id):
+                continue
+            if deleted:
+                data = {"id": deadline_id, "type": "deadline", "deleted": True}
+            else:
+                data = deadline.to_ticker_dict()
+            broker.publish(teacher_id, "deadline", data)
+
+    transaction.on_commit(send)
+
+
+def deadlines_changed(deadline_ids, event="deadline"):
+    """Push the current state of many deadlines (bulk updates, sweeps)."""
+    deadline_ids = list(deadline_ids)
+
+    def send():
+        from .models import Deadline
+
+        if not deadline_ids or not broker.has_subscribers(ALL_USERS):
+            return
+        deadlines = Deadline.objects.filter(pk__in=deadline_ids).select_related(
+            "course"
+        )
+        for deadline in deadlines:
+            if broker.has_subscribers(deadline.course.teacher_id):
+                broker.publish(
+                    deadline.course.teacher_id, event, deadline.to_ticker_dict()
+                )
+
+    transaction.on_commit(send)
+
+
+def deadlines_overdue(deadline_ids):
+    """Announce deadlines that the sweeper just moved to overdue."""
+    counters_changed(course_ids=_course_ids(deadline_ids))
+    deadlines_changed(deadline_ids, event="deadline_overdue")
+
+
+def _course_ids(deadline_ids):
+    from .models import Deadline
+
+    return set(
+        Deadline.objects.filter(pk__in=list(deadline_ids)).values_list(
+            "course_id", flat=True
+        )
+    )
@@ -0,0 +1,166 @@
+"""
+Signal receivers that keep UserCounters and Conversation rows in step with
+the source tables, and announce the changes through action_center.notify.
+
+Every instance remembers the counter-relevant fields it was loaded with
+(post_init). post_save applies the difference between that snapshot and
+the saved state as F() deltas, and post_delete removes the old
+contribution, so Message.mark_as_read() and Deadline.mark_complete() need
+no special casing. QuerySet.update() and bulk_create() do not send these
+signals; bulk code paths adjust the counters (and call
+Conversation.record()) themselves.
+"""
+
+from django.db.models import F, Subquery
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from dashboard.models import Course
+
+from . import notify
+from .models import Conversation, Deadline, ForumTopic, Message, UserCounters
+
+SNAPSHOT_FIELDS = {
+    Message: ("recipient_id", "is_read", "priority"),
+    Deadline: ("course_id", "is_completed", "due_date"),
+    ForumTopic: ("course_id", "status"),
+}
+
+
+def _snapshot(instance):
+    """Loaded values of the tracked fields, or None if any were deferred."""
+    try:
+        return tuple(instance.__dict__[name] for name in SNAPSHOT_FIELDS[type(instance)])
+    except KeyError:
+        return None
+
+
+def _apply(counters, deltas):
+    """Apply {field: delta} to a UserCounters queryset with one UPDATE."""
+    changes = {field: F(field) + delta for field, delta in deltas.items() if delta}
+    if changes:
+        counters.update(**changes)
+
+
+def _user_counters(user_id):
+    return UserCounters.objects.filter(user_id=user_id)
+
+
+def _teacher_counters(course_id):
+    teacher = Course.objects.filter(pk=course_id).values("teacher_id")[:1]
+    return UserCounters.objects.filter(user_id=Subquery(teacher))
+
+
+# ============================================
+# PER-MODEL ADJUSTMENTS
+# ============================================
+
+
+def _message_contribution(state):
+    recipient_id, is_read, priority = state
+    if is_read:
+        return {}
+    return {"unread_messages": 1, "urgent_unread": int(priority == "urgent")}
+
+
+def _adjust_messages(old, new):
+    for state, sign in ((old, -1), (new, 1)):
+        if state is None:
+            continue
+        deltas = _message_contribution(state)
+        _apply(
+            _user_counters(state[0]),
+            {field: sign * value for field, value in deltas.items()},
+        )
+
+
+def _adjust_deadlines(old, new):
+    # Only deadlines due at or before a row's overdue_as_of are counted;
+    # later ones are picked up by UserCounters.sweep_overdue().
+    for state, sign in ((old, -1), (new, 1)):
+        if state is None:
+            continue
+        course_id, is_completed, due_date = state
+        if is_completed:
+            continue
+        _apply(
+            _teacher_counters(course_id).filter(overdue_as_of__gte=due_date),
+            {"overdue_deadlines": sign},
+        )
+
+
+def _adjust_topics(old, new):
+    for state, sign in ((old, -1), (new, 1)):
+        if state is None:
+            continue
+        course_id, status = state
+        if status == "open":
+            _apply(_teacher_counters(course_id), {"active_topics": sign})
+
+
+ADJUSTERS = {
+    Message: _adjust_messages,
+    Deadline: _adjust_deadlines,
+    ForumTopic: _adjust_topics,
+}
+
+
+def _notify(sender, old, new):
+    """Drop cached feeds and push counters to the users whose rows moved."""
+    owners = {state[0] for state in (old, new) if state is not None}
+    if sender is Message:
+        notify.counters_changed(user_ids=owners)
+    else:
+        notify.counters_changed(course_ids=owners)
+
+
+# ============================================
+# RECEIVERS
+# ============================================
+
+
+@receiver(post_init, sender=Message)
+@receiver(post_init, sender=Deadline)
+@receiver(post_init, sender=ForumTopic)
+def remember_counter_state(sender, instance, **kwargs):
+    instance._counter_state = _snapshot(instance)
+
+
+@receiver(post_save, sender=Message)
+@receiver(post_save, sender=Deadline)
+@receiver(post_save, sender=ForumTopic)
+def update_counters_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    old = None if created else instance._counter_state
+    new = _snapshot(instance)
+    if not created and old is None:
+        # Saved from a deferred load: nothing to diff against, leave it
+        # to reconcile_action_counters.
+        instance._counter_state = new
+        return
+    if old != new:
+        ADJUSTERS[sender](old, new)
+        _notify(sender, old, new)
+    instance._counter_state = new
+    if sender is Message and created:
+        notify.message_created(instance)
+    elif sender is Deadline:
+        notify.deadline_changed(instance)
+
+
+@receiver(post_delete, sender=Message)
+@receiver(post_delete, sender=Deadline)
+@receiver(post_delete, sender=ForumTopic)
+def update_counters_on_delete(sender, instance, **kwargs):
+    if instance._counter_state is not None:
+        ADJUSTERS[sender](instance._counter_state, None)
+        _notify(sender, instance._counter_state, None)
+    if sender is Deadline:
+        notify.deadline_changed(instance, deleted=True)
+
+
+@receiver(post_save, sender=Message)
+def record_conversation(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        Conversation.record([instance])
@@ -0,0 +1,64 @@
+"""
+Deadline state sweeps.
+
+run_sweep() moves stored Deadline.status values that changed just because
+time passed, adds newly overdue deadlines to the badge counters and
+announces them (deadline_overdue events).
+
+Two ways to schedule it:
+- the sweep_deadlines command from cron / a PythonAnywhere task (WSGI);
+- a daemon thread in the ASGI process, started by the first event stream
+  (DEADLINE_SWEEP_INTERVAL seconds, 0 disables). Only sweeps run in the
+  ASGI process can reach open streams, since cadmus.pubsub is in-process.
+Sweeps are idempotent, so running both is safe.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from . import notify
+from .models import Deadline, UserCounters
+
+logger = logging.getLogger(__name__)
+
+_thread = None
+_thread_lock = threading.Lock()
+
+
+def run_sweep(now=None):
+    """Sweep deadline statuses once; returns ({status: moved}, newly_overdue)."""
+    now = now or timezone.now()
+    moved, newly_overdue = Deadline.objects.sweep_statuses(now=now)
+    UserCounters.sweep_overdue(now=now)
+    if newly_overdue:
+        notify.deadlines_overdue(newly_overdue)
+    return moved, newly_overdue
+
+
+def _loop(interval):
+    while True:
+        close_old_connections()
+        try:
+            run_sweep()
+        except Exception:
+            logger.exception("Deadline sweep failed")
+        time.sleep(interval)
+
+
+def ensure_background_sweeper():
+    """Start the in-process sweep thread once (no-op if disabled)."""
+    global _thread
+    interval = getattr(settings, "DEADLINE_SWEEP_INTERVAL", 0)
+    if not interval or _thread is not None:
+        return
+    with _thread_lock:
+        if _thread is None:
+            _thread = threading.Thread(
+                target=_loop, args=(interval,), name="deadline-sweeper", daemon=True
+            )
+            _thread.start()
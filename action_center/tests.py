@@ -1,3 +1,385 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from dashboard.models import Course, Group
+from students.models import Student
+
+from .broadcasts import EMAIL_NOT_CONFIGURED, create_broadcast, deliver_broadcast
+
+from .models import (
+    Broadcast,
+    BroadcastRecipient,
+    Conversation,
+    Deadline,
+    ForumTopic,
+    Message,
+    UserCounters,
+)
+from .views import FEED_MAX_ITEMS, build_ticker_feed
+
+User = get_user_model()
+
+
+class UserCountersTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user("teacher@example.com", "x")
+        cls.colleague = User.objects.create_user("colleague@example.com", "x")
+        cls.course = Course.objects.create(name="Philosophy", teacher=cls.teacher)
+
+    def _message(self, **fields):
+        return Message.objects.create(
+            sender=self.colleague,
+            recipient=self.teacher,
+            subject="Hola",
+            body="",
+            **fields,
+        )
+
+    def test_for_user_builds_the_row_from_source_tables(self):
+        self._message()
+        self._message(priority="urgent")
+        self._message(is_read=True)
+        Deadline.objects.create(
+            title="Essays",
+            course=self.course,
+            created_by=self.teacher,
+            due_date=timezone.now() - timedelta(1),
+        )
+        Deadline.objects.create(
+            title="Exam",
+            course=self.course,
+            created_by=self.teacher,
+            due_date=timezone.now() + timedelta(1),
+        )
+        ForumTopic.objects.create(
+            title="Cave", content="?", author=self.colleague, course=self.course
+        )
+
+        counters = UserCounters.for_user(self.teacher)
+        self.assertEqual(
+            [getattr(counters, field) for field in UserCounters.COUNTER_FIELDS],
+            [2, 1, 1, 1],
+        )
+        self.assertEqual(UserCounters.for_user(self.colleague).unread_messages, 0)
+
+    def test_rebuild_repairs_drift_only(self):
+        self._message()
+        UserCounters.for_user(self.teacher)
+        UserCounters.for_user(self.colleague)
+        UserCounters.objects.filter(user=self.teacher).update(unread_messages=7)
+
+        self.assertEqual(UserCounters.rebuild(), 1)
+        self.assertEqual(UserCounters.for_user(self.teacher).unread_messages, 1)
+        self.assertEqual(UserCounters.rebuild(), 0)
+
+    def test_rebuild_tolerates_a_concurrent_first_build(self):
+        # The row appears after rebuild() looked for it, as when two first
+        # requests race: the duplicate insert must be ignored
+        self._message()
+        UserCounters.objects.create(user=self.teacher, unread_messages=1)
+        with mock.patch.object(
+            UserCounters.objects,
+            "select_for_update",
+            return_value=UserCounters.objects.none(),
+        ):
+            UserCounters.rebuild(user_ids=[self.teacher.pk])
+        self.assertEqual(UserCounters.objects.filter(user=self.teacher).count(), 1)
+        self.assertEqual(UserCounters.for_user(self.teacher).unread_messages, 1)
+
+
+class ConversationRecordTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ana = User.objects.create_user("ana@example.com", "x")
+        cls.luis = User.objects.create_user("luis@example.com", "x")
+        cls.course = Course.objects.create(name="Philosophy", teacher=cls.ana)
+
+    def _send(self, sender, recipient, subject, course=None):
+        return Message.objects.create(
+            sender=sender, recipient=recipient, subject=subject, body="", course=course
+        )
+
+    def _row(self, owner, counterpart, course=None):
+        return Conversation.objects.get(
+            owner=owner, counterpart=counterpart, course=course
+        )
+
+    def test_first_message_creates_both_rows(self):
+        message = self._send(self.ana, self.luis, "Hola")
+        for owner, counterpart in ((self.ana, self.luis), (self.luis, self.ana)):
+            row = self._row(owner, counterpart)
+            self.assertEqual(row.message_count, 1)
+            self.assertEqual(row.last_message_id, message.pk)
+            self.assertEqual(row.last_message_preview, "Hola")
+        self.assertEqual(Conversation.objects.count(), 2)
+
+    def test_direct_messages_share_one_row_per_owner(self):
+        for subject in ("Hola", "Otra vez"):
+            Conversation.record([self._send(self.ana, self.luis, subject)])
+        self.assertEqual(Conversation.objects.count(), 2)
+        self.assertEqual(self._row(self.ana, self.luis).message_count, 4)
+
+    def test_duplicate_direct_row_is_rejected(self):
+        self._send(self.ana, self.luis, "Hola")
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Conversation.objects.create(
+                owner=self.ana, counterpart=self.luis, last_message_at=timezone.now()
+            )
+
+    def test_uniqueness_needs_no_partial_index(self):
+        # MySQL ignores conditional constraints and NULLs never collide, so
+        # the unique key must be made of non-null columns only
+        self.assertFalse(
+            [c for c in Conversation._meta.constraints if c.condition is not None]
+        )
+        for fields in Conversation._meta.unique_together:
+            for name in fields:
+                self.assertFalse(Conversation._meta.get_field(name).null, name)
+
+    def test_replies_move_last_message_forward(self):
+        self._send(self.ana, self.luis, "Hola")
+        reply = self._send(self.luis, self.ana, "Buenas")
+        row = self._row(self.ana, self.luis)
+        self.assertEqual(row.message_count, 2)
+        self.assertEqual(row.last_message_id, reply.pk)
+        self.assertEqual(row.last_message_preview, "Buenas")
+
+    def test_older_message_counts_but_keeps_last_message(self):
+        older = self._send(self.ana, self.luis, "Hola")
+        newer = self._send(self.ana, self.luis, "Otra vez")
+        Message.objects.filter(pk=older.pk).update(
+            created_at=newer.created_at - timedelta(minutes=5)
+        )
+        older.refresh_from_db()
+
+        Conversation.record([older])
+        row = self._row(self.luis, self.ana)
+        self.assertEqual(row.message_count, 3)
+        self.assertEqual(row.last_message_id, newer.pk)
+
+    def test_batch_with_several_threads(self):
+        # bulk_create sends no post_save, so nothing is recorded until the
+        # batch is folded in explicitly
+        Message.objects.bulk_create(
+            [
+                Message(sender=self.ana, recipient=self.luis, subject="Uno"),
+                Message(sender=self.ana, recipient=self.luis, subject="Dos"),
+                Message(
+                    sender=self.luis,
+                    recipient=self.ana,
+                    subject="Tres",
+                    course=self.course,
+                ),
+            ]
+        )
+        self.assertFalse(Conversation.objects.exists())
+        Conversation.record(Message.objects.order_by("id"))
+
+        direct = self._row(self.luis, self.ana)
+        self.assertEqual(direct.message_count, 2)
+        self.assertEqual(direct.last_message_preview, "Dos")
+        self.assertEqual(self._row(self.ana, self.luis, self.course).message_count, 1)
+        self.assertEqual(Conversation.objects.count(), 4)
+
+
+class TickerFeedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user("teacher@example.com", "x")
+        cls.colleague = User.objects.create_user("colleague@example.com", "x")
+        cls.course = Course.objects.create(name="Philosophy", teacher=cls.teacher)
+
+    def setUp(self):
+        cache.clear()
+
+    def _message(self, subject, **fields):
+        return Message.objects.create(
+            sender=self.colleague, recipient=self.teacher, subject=subject, **fields
+        )
+
+    def _deadline(self, title, days):
+        return Deadline.objects.create(
+            title=title,
+            course=self.course,
+            created_by=self.teacher,
+            due_date=timezone.now() + timedelta(days=days),
+        )
+
+    def _topic(self, title, **fields):
+        return ForumTopic.objects.create(
+            title=title,
+            content="?",
+            author=self.colleague,
+            course=self.course,
+            **fields,
+        )
+
+    def test_sources_are_merged_by_tier_then_distance_from_now(self):
+        self._message("Routine")
+        self._message("Urgent", priority="urgent")
+        self._message("Already read", is_read=True)
+        self._deadline("Missed", -2)
+        self._deadline("Due soon", 1.5)
+        self._deadline("Far away", 20)
+        self._topic("Pinned", is_pinned=True)
+        quiet = self._topic("Quiet")
+        ForumTopic.objects.filter(pk=quiet.pk).update(
+            last_activity=timezone.now() - timedelta(days=2)
+        )
+        other_course = Course.objects.create(name="Ethics", teacher=self.colleague)
+        ForumTopic.objects.create(
+            title="Not mine", content="?", author=self.teacher, course=other_course
+        )
+
+        feed = build_ticker_feed(self.teacher)
+        self.assertEqual(
+            [item["title"] for item in feed],
+            ["Urgent", "Missed", "Pinned", "Due soon", "Routine", "Quiet"],
+        )
+
+    def test_limit_cuts_the_merged_feed(self):
+        for number in range(4):
+            self._message(f"Message {number}")
+            self._deadline(f"Deadline {number}", -number - 1)
+        feed = build_ticker_feed(self.teacher)
+        self.assertEqual(len(feed), 8)
+        self.assertEqual(build_ticker_feed(self.teacher, limit=3), feed[:3])
+
+    def test_empty_sources(self):
+        self.assertEqual(build_ticker_feed(self.teacher), [])
+        self._deadline("Only deadline", -1)
+        self.assertEqual(
+            [item["type"] for item in build_ticker_feed(self.teacher)], ["deadline"]
+        )
+
+    def test_api_serves_slices_of_one_cached_feed(self):
+        for number in range(3):
+            self._message(f"Message {number}")
+        self.client.force_login(self.teacher)
+        url = reverse("action_center:feed")
+
+        response = self.client.get(url, {"limit": 2})
+        self.assertEqual(response.json()["count"], 2)
+        # Not invalidated (no commit in a TestCase): still the cached feed
+        self._message("Later", priority="urgent")
+        items = self.client.get(url, {"limit": 10}).json()["items"]
+        self.assertEqual(len(items), 3)
+        self.assertEqual(items[:2], response.json()["items"])
+
+        for limit, expected in (("0", 1), ("abc", 3), (str(FEED_MAX_ITEMS + 1), 3)):
+            response = self.client.get(url, {"limit": limit})
+            self.assertEqual(response.json()["count"], expected, limit)
+
+
+class EventStreamTests(TestCase):
+    def test_wsgi_requests_are_refused(self):
+        # A WSGI worker would drain the endless stream before responding
+        self.client.force_login(User.objects.create_user("ana@example.com", "x"))
+        response = self.client.get(reverse("action_center:stream"))
+        self.assertEqual(response.status_code, 501)
+        self.assertFalse(response.streaming)
+
+
+class BroadcastTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user("teacher@example.com", "x")
+        cls.group = Group.objects.create(name="III A")
+        cls.course = Course.objects.create(name="Philosophy", teacher=cls.teacher)
+        cls.students = [
+            Student.objects.create(
+                first_name=name, last_name="Quispe", email=email, group=cls.group
+            )
+            for name, email in (("Ana", "ana@example.com"), ("Luis", ""))
+        ]
+        cls.course.students.add(*cls.students)
+        cls.outsider = Student.objects.create(
+            first_name="Rosa", last_name="Mamani", email="rosa@example.com"
+        )
+
+    def _post(self, user, **data):
+        self.client.force_login(user)
+        return self.client.post(
+            reverse("action_center:broadcast"),
+            {"subject": "Excursion", "body": "Bring water", **data},
+        )
+
+    def test_course_broadcast_reaches_every_enrolled_student(self):
+        broadcast = create_broadcast(
+            self.teacher, "Excursion", "Bring water", "course", course=self.course
+        )
+        self.assertEqual(broadcast.status, Broadcast.STATUS_SENT)
+        self.assertEqual(broadcast.recipients_count, 2)
+        # Students without an email address only get the in-app copy
+        self.assertEqual(broadcast.emailed_count, 1)
+        self.assertEqual([message.to for message in mail.outbox], [["ana@example.com"]])
+
+    def test_redelivery_does_not_duplicate(self):
+        ana = self.students[0]
+        broadcast = create_broadcast(
+            self.teacher,
+            "Excursion",
+            "Bring water",
+            "students",
+            student_ids=[ana.pk, ana.pk],
+        )
+        self.assertEqual(broadcast.recipients_count, 1)
+
+        Broadcast.objects.filter(pk=broadcast.pk).update(
+            status=Broadcast.STATUS_PENDING
+        )
+        self.assertTrue(deliver_broadcast(broadcast.pk))
+        recipients = BroadcastRecipient.objects.filter(broadcast=broadcast)
+        self.assertEqual(recipients.count(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(EMAIL_CONFIGURED=False)
+    def test_unconfigured_email_is_reported_on_the_broadcast(self):
+        broadcast = create_broadcast(
+            self.teacher, "Excursion", "Bring water", "group", group=self.group
+        )
+        self.assertEqual(broadcast.status, Broadcast.STATUS_SENT)
+        self.assertEqual(broadcast.email_error, EMAIL_NOT_CONFIGURED)
+        self.assertEqual(mail.outbox, [])
+
+    def test_teacher_can_reach_own_students_and_group(self):
+        response = self._post(
+            self.teacher, target_type="group", target_id=self.group.pk
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["broadcast"]["recipients_count"], 2)
+
+    def test_teacher_cannot_reach_other_students(self):
+        response = self._post(
+            self.teacher, target_type="students", **{"ids[]": [self.outsider.pk]}
+        )
+        self.assertEqual(response.status_code, 403)
+
+        # A group is off limits if any of its students is not the teacher's
+        self.outsider.group = self.group
+        self.outsider.save()
+        response = self._post(
+            self.teacher, target_type="group", target_id=self.group.pk
+        )
+        self.assertEqual(response.status_code, 403)
+
+        other = User.objects.create_user("other@example.com", "x")
+        response = self._post(other, target_type="course", target_id=self.course.pk)
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Broadcast.objects.exists())
+
+    def test_school_admin_can_reach_anyone(self):
+        admin = User.objects.create_user("admin@example.com", "x", role="admin")
+        response = self._post(
+            admin, target_type="students", **{"ids[]": [self.outsider.pk]}
+        )
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,26 @@
+from django.urls import path
+from . import views
+
+app_name = "action_center"
+
+urlpatterns = [
+    path("feed", views.ticker_feed_api, name="feed"),
+    path("stream", views.event_stream, name="stream"),
+    path("topics/<int:topic_id>", views.topic_detail_api, name="topic_detail"),
+    path("inbox", views.inbox_api, name="inbox"),
+    path(
+        "inbox/<int:conversation_id>",
+        views.conversation_messages_api,
+        name="conversation_messages",
+    ),
+    path("broadcasts", views.broadcast_api, name="broadcast"),
+    path(
+        "broadcasts/<int:broadcast_id>",
+        views.broadcast_status_api,
+        name="broadcast_status",
+    ),
+    path("messages/mark-read", views.mark_messages_read_api, name="mark_read"),
+    path(
+        "deadlines/complete", views.complete_deadlines_api, name="complete_deadlines"
+    ),
+]
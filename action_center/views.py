@@ -1,3 +1,475 @@
-from django.shortcuts import render
+import asyncio
+import heapq
+import json
+import time
+from datetime import timedelta
+from itertools import islice
 
-# Create your views here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+
+from cadmus.counter_buffer import view_counts
+from cadmus.pubsub import broker
+from core.pagination import InvalidCursor, keyset_page
+from dashboard.models import Course, Group
+from students.models import Student
+
+from .broadcasts import create_broadcast
+from .sweeper import ensure_background_sweeper
+from .models import (
+    Broadcast,
+    Conversation,
+    Message,
+    ForumTopic,
+    Deadline,
+    UserCounters,
+)
+
+# Ticker tiers: lower sorts first, then closest to "now" within a tier
+TIER_URGENT = 0  # Overdue deadlines, urgent unread messages
+TIER_SOON = 1  # Deadlines due within 3 days, pinned topics / announcements
+TIER_NORMAL = 2  # Other unread messages and active topics
+
+FEED_MAX_ITEMS = 50
+INBOX_PAGE_SIZE = 20
+INBOX_MAX_PAGE_SIZE = 100
+ACTIVE_TOPIC_DAYS = 7
+
+
+def feed_cache_key(user_id):
+    return f"action_center:feed:{user_id}"
+
+
+def invalidate_feed(user_id):
+    """Drop a user's cached feed (e.g. after marking messages read)."""
+    cache.delete(feed_cache_key(user_id))
+
+
+def _unread_messages(user, now, limit):
+    """Unread messages, urgent first then newest (recipient, is_read) index."""
+    messages = (
+        Message.objects.filter(recipient=user, is_read=False)
+        .select_related("sender", "course")
+        .annotate(
+            tier=Case(
+                When(priority="urgent", then=Value(TIER_URGENT)),
+                default=Value(TIER_NORMAL),
+                output_field=IntegerField(),
+            )
+        )
+        .order_by("tier", "-created_at")[:limit]
+    )
+    for message in messages:
+        yield (message.tier, now - message.created_at), message.to_ticker_dict()
+
+
+def _active_topics(user, now, limit):
+    """Open topics with activity in the last week, pinned/announcements first."""
+    topics = (
+        ForumTopic.objects.filter(
+            course__teacher=user,
+            status="open",
+            last_activity__gte=now - timedelta(days=ACTIVE_TOPIC_DAYS),
+        )
+        .select_related("course")
+        .annotate(
+            tier=Case(
+                When(
+                    Q(is_pinned=True) | Q(is_announcement=True),
+                    then=Value(TIER_SOON),
+                ),
+                default=Value(TIER_NORMAL),
+                output_field=IntegerField(),
+            )
+        )
+        .order_by("tier", "-last_activity")[:limit]
+    )
+    for topic in topics:
+        yield (topic.tier, now - topic.last_activity), topic.to_ticker_dict()
+
+
+def _overdue_deadlines(user, now, limit):
+    """Most recently missed deadlines first, via (status, due_date)."""
+    deadlines = (
+        Deadline.objects.filter(status=Deadline.STATUS_OVERDUE, course__teacher=user)
+        .select_related("course")
+        .order_by("-due_date")[:limit]
+    )
+    for deadline in deadlines:
+        yield (TIER_URGENT, now - deadline.due_date), deadline.to_ticker_dict(now)
+
+
+def _upcoming_deadlines(user, now, limit):
+    """Deadlines due in the next few days, soonest first."""
+    deadlines = (
+        Deadline.objects.filter(status=Deadline.STATUS_DUE_SOON, course__teacher=user)
+        .select_related("course")
+        .order_by("due_date")[:limit]
+    )
+    for deadline in deadlines:
+        yield (TIER_SOON, deadline.due_date - now), deadline.to_ticker_dict(now)
+
+
+def build_ticker_feed(user, limit=20, now=None):
+    """
+    Merge unread messages, active topics and overdue/upcoming deadlines into
+    one list ordered by (tier, distance from now). Each source is fetched
+    already sorted and capped at `limit`, so a k-way merge of the four
+    streams gives the global top `limit` without sorting everything.
+    """
+    now = now or timezone.now()
+    sources = [
+        _unread_messages(user, now, limit),
+        _overdue_deadlines(user, now, limit),
+        _upcoming_deadlines(user, now, limit),
+        _active_topics(user, now, limit),
+    ]
+    merged = heapq.merge(*sources, key=lambda entry: entry[0])
+    return [item for _, item in islice(merged, limit)]
+
+
+@login_required
+def ticker_feed_api(request):
+    """API endpoint for the Action Center ticker (cached per user)."""
+    try:
+        limit = int(request.GET.get("limit", 20))
+    except ValueError:
+        limit = 20
+    limit = max(1, min(limit, FEED_MAX_ITEMS))
+
+    # One cached feed per user at full size; smaller limits are slices of it
+    items = cache.get_or_set(
+        feed_cache_key(request.user.id),
+        lambda: build_ticker_feed(request.user, FEED_MAX_ITEMS),
+        getattr(settings, "ACTION_CENTER_FEED_TTL", 30),
+    )[:limit]
+    return JsonResponse({"items": items, "count": len(items)})
+
+
+def _parse_ids(request):
+    """Read ids[] from an AJAX form post; invalid entries are ignored."""
+    return [int(value) for value in request.POST.getlist("ids[]") if value.isdigit()]
+
+
+@login_required
+def mark_messages_read_api(request):
+    """
+    Mark the user's messages as read in bulk.
+    POST ids[]=... for a selection, or all=1 (optionally course_id=...)
+    for "mark all read".
+    """
+    if request.method != "POST":
+        return JsonResponse(
+            {"status": "error", "message": "Invalid request method"}, status=405
+        )
+
+    messages = Message.objects.filter(recipient=request.user)
+    if request.POST.get("all") in ("1", "true"):
+        course_id = request.POST.get("course_id", "")
+        if course_id.isdigit():
+            messages = messages.filter(course_id=course_id)
+    else:
+        ids = _parse_ids(request)
+        if not ids:
+            return JsonResponse(
+                {"status": "error", "message": "No messages selected"}, status=400
+            )
+        messages = messages.filter(pk__in=ids)
+
+    updated = messages.mark_read()
+    return JsonResponse({"status": "success", "updated": updated})
+
+
+@login_required
+def complete_deadlines_api(request):
+    """Complete the selected deadlines (POST ids[]=...) in the user's courses."""
+    if request.method != "POST":
+        return JsonResponse(
+            {"status": "error", "message": "Invalid request method"}, status=405
+        )
+
+    ids = _parse_ids(request)
+    if not ids:
+        return JsonResponse(
+            {"status": "error", "message": "No deadlines selected"}, status=400
+        )
+
+    updated = Deadline.objects.filter(
+        pk__in=ids, course__teacher=request.user
+    ).mark_complete()
+    return JsonResponse({"status": "success", "updated": updated})
+
+
+def _page_size(request):
+    try:
+        limit = int(request.GET.get("limit", INBOX_PAGE_SIZE))
+    except ValueError:
+        limit = INBOX_PAGE_SIZE
+    return max(1, min(limit, INBOX_MAX_PAGE_SIZE))
+
+
+@login_required
+def inbox_api(request):
+    """
+    Conversations for the current user, newest activity first.
+    Keyset-paginated: pass back `next_cursor` as ?cursor= for the next page.
+    Optional ?course_id= narrows to one course's threads.
+    """
+    conversations = Conversation.objects.filter(owner=request.user).select_related(
+        "counterpart", "course"
+    )
+    course_id = request.GET.get("course_id", "")
+    if course_id.isdigit():
+        conversations = conversations.filter(course_id=course_id)
+
+    try:
+        rows, next_cursor = keyset_page(
+            conversations,
+            ("last_message_at", "id"),
+            cursor=request.GET.get("cursor"),
+            limit=_page_size(request),
+        )
+    except InvalidCursor as e:
+        return JsonResponse({"status": "error", "message": str(e)}, status=400)
+
+    return JsonResponse(
+        {
+            "conversations": [conversation.to_dict() for conversation in rows],
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+@login_required
+def conversation_messages_api(request, conversation_id):
+    """Messages in one of the user's conversations, newest first (keyset)."""
+    conversation = Conversation.objects.filter(
+        pk=conversation_id, owner=request.user
+    ).first()
+    if conversation is None:
+        return JsonResponse(
+            {"status": "error", "message": "Conversation not found"}, status=404
+        )
+
+    try:
+        rows, next_cursor = keyset_page(
+            [qs.select_related("sender") for qs in conversation.message_streams()],
+            ("created_at", "id"),
+            cursor=request.GET.get("cursor"),
+            limit=_page_size(request),
+        )
+    except InvalidCursor as e:
+        return JsonResponse({"status": "error", "message": str(e)}, status=400)
+
+    return JsonResponse(
+        {
+            "conversation": conversation.to_dict(),
+            "messages": [message.to_dict() for message in rows],
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+def _can_broadcast_to(user, target):
+    """
+    School admins may reach anyone. Teachers may reach a group or a list of
+    students only if every one of them is enrolled in a course they teach.
+    """
+    if user.is_school_admin or "course" in target:
+        return True
+    if "group" in target:
+        students = Student.objects.filter(group=target["group"])
+    else:
+        students = Student.objects.filter(pk__in=target["student_ids"])
+    return not students.exclude(enrolled_courses__teacher=user).exists()
+
+
+@login_required
+def broadcast_api(request):
+    """
+    Send one message to a whole Group, Course or selected students.
+    POST subject, body, target_type (group|course|students), target_id or
+    ids[], and optionally send_email=0. Large audiences are delivered in the
+    background; poll broadcast_status_api for progress.
+    """
+    if request.method != "POST":
+        return JsonResponse(
+            {"status": "error", "message": "Invalid request method"}, status=405
+        )
+
+    subject = request.POST.get("subject", "").strip()
+    body = request.POST.get("body", "").strip()
+    target_type = request.POST.get("target_type", "")
+    target_id = request.POST.get("target_id", "")
+    if not subject or not body:
+        return JsonResponse(
+            {"status": "error", "message": "Subject and message are required"},
+            status=400,
+        )
+
+    target = {}
+    if target_type == "group" and target_id.isdigit():
+        target["group"] = Group.objects.filter(pk=target_id).first()
+    elif target_type == "course" and target_id.isdigit():
+        courses = Course.objects.all()
+        if not request.user.is_school_admin:
+            courses = courses.filter(teacher=request.user)
+        target["course"] = courses.filter(pk=target_id).first()
+    elif target_type == "students":
+        target["student_ids"] = _parse_ids(request)
+    if not any(target.values()):
+        return JsonResponse(
+            {"status": "error", "message": "Invalid broadcast target"}, status=400
+        )
+    if not _can_broadcast_to(request.user, target):
+        return JsonResponse(
+            {"status": "error", "message": "Permission denied"}, status=403
+        )
+
+    broadcast = create_broadcast(
+        request.user,
+        subject,
+        body,
+        target_type,
+        send_email=request.POST.get("send_email", "1") not in ("0", "false"),
+        **target,
+    )
+    return JsonResponse(
+        {"status": "success", "broadcast": broadcast.to_dict()},
+        status=200 if broadcast.status != Broadcast.STATUS_PENDING else 202,
+    )
+
+
+@login_required
+def broadcast_status_api(request, broadcast_id):
+    """Delivery progress of one of the user's broadcasts."""
+    broadcast = Broadcast.objects.filter(pk=broadcast_id, sender=request.user).first()
+    if broadcast is None:
+        return JsonResponse(
+            {"status": "error", "message": "Broadcast not found"}, status=404
+        )
+    return JsonResponse({"status": "success", "broadcast": broadcast.to_dict()})
+
+
+@login_required
+def topic_detail_api(request, topic_id):
+    """A forum topic; the view is counted through the write-behind buffer."""
+    topic = (
+        ForumTopic.objects.filter(pk=topic_id)
+        .select_related("author", "course")
+        .first()
+    )
+    if topic is None:
+        return JsonResponse(
+            {"status": "error", "message": "Topic not found"}, status=404
+        )
+    view_counts.increment(ForumTopic, topic.pk)
+    return JsonResponse({"status": "success", "topic": topic.to_dict()})
+
+
+# ============================================
+# SERVER-SENT EVENTS
+# ============================================
+
+
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+
+def _stream_snapshot(user):
+    from dashboard.views import next_session_payload
+
+    return UserCounters.for_user(user).to_dict(), next_session_payload()
+
+
+async def _event_source(user):
+    """
+    Yield SSE frames for one connection: a snapshot, then deltas from the
+    broker, a heartbeat comment when idle, and a fresh next_session when the
+    countdown reaches zero.
+    """
+    subscription = broker.subscribe(user.pk)
+    heartbeat = getattr(settings, "SSE_HEARTBEAT_SECONDS", 15)
+    try:
+        counters, next_session = await sync_to_async(_stream_snapshot)(user)
+        yield "retry: 5000\n\n"
+        yield _sse("counters", counters)
+        yield _sse("next_session", next_session)
+
+        def rollover_at(payload):
+            if not payload:
+                return None
+            return time.monotonic() + max(payload["minutes_to_start"], 0) * 60 + 60
+
+        next_rollover = rollover_at(next_session)
+        while True:
+            timeout = heartbeat
+            if next_rollover is not None:
+                timeout = max(0, min(timeout, next_rollover - time.monotonic()))
+            try:
+                event, data = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                if next_rollover is not None and time.monotonic() >= next_rollover:
+                    from dashboard.views import next_session_payload
+
+                    next_session = await sync_to_async(next_session_payload)()
+                    next_rollover = rollover_at(next_session)
+                    yield _sse("next_session", next_session)
+                else:
+                    yield ": ping\n\n"
+                continue
+
+            if subscription.overflowed:
+                # Deltas were dropped; have the client refetch the feed
+                while not subscription.queue.empty():
+                    subscription.queue.get_nowait()
+                subscription.overflowed = False
+                yield _sse("resync", {})
+                continue
+            if event == "next_session":
+                next_rollover = rollover_at(data)
+            yield _sse(event, data)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+async def event_stream(request):
+    """
+    Server-sent events for the dashboard: counters, message, deadline,
+    next_session and resync events for the current user. Serve under ASGI
+    (cadmus/asgi.py); each open stream costs a coroutine, not a thread.
+    Under WSGI, StreamingHttpResponse drains an async iterator before
+    sending anything, so this never-ending stream would hold a worker
+    forever: it answers 501 there and clients keep using the feed API.
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {
+                "status": "error",
+                "message": "Event stream requires an ASGI server; poll the feed",
+            },
+            status=501,
+        )
+    ensure_background_sweeper()
+    user = await sync_to_async(get_user)(request)
+    if not user.is_authenticated:
+        return JsonResponse(
+            {"status": "error", "message": "Authentication required"}, status=401
+        )
+
+    response = StreamingHttpResponse(
+        _event_source(user), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # Don't let nginx buffer the stream
+    return response
@@ -0,0 +1,101 @@
+/**
+ * LIVE UPDATES - Server-sent events consumer
+ *
+ * Opens the Action Center event stream (action_center.views.event_stream)
+ * and keeps the header countdown in step with `next_session` events,
+ * starting from the server-rendered #nextSessionData when the page has it.
+ * Every event is also re-dispatched on `document` as `silabus:<event>`
+ * (counters, message, deadline, deadline_overdue, next_session, resync) so
+ * other scripts can react without opening a second connection.
+ *
+ * Under WSGI the stream answers 501; the browser then closes the
+ * EventSource and the countdown keeps ticking from the rendered data.
+ */
+
+(function () {
+    const script = document.currentScript;
+    const streamUrl = script && script.dataset.streamUrl;
+
+    const EVENTS = [
+        'counters',
+        'message',
+        'deadline',
+        'deadline_overdue',
+        'next_session',
+        'resync',
+    ];
+    let countdownTimer = null;
+
+    function formatMinutes(minutes) {
+        if (minutes < 60) {
+            return `${minutes} min`;
+        }
+        const hours = Math.floor(minutes / 60);
+        return `${hours}h ${String(minutes % 60).padStart(2, '0')}min`;
+    }
+
+    function showNextSession(session) {
+        const container = document.getElementById('headerSessionInfo');
+        const minutesEl = document.getElementById('headerSessionMinutes');
+        const detailsEl = document.getElementById('headerSessionDetails');
+        if (!container || !minutesEl || !detailsEl) {
+            return;
+        }
+        clearInterval(countdownTimer);
+        if (!session) {
+            container.style.display = 'none';
+            return;
+        }
+
+        let minutes = Math.max(session.minutes_to_start, 0);
+        minutesEl.textContent = formatMinutes(minutes);
+        detailsEl.textContent = [
+            session.course_name,
+            session.start_time_display,
+            session.room,
+        ]
+            .filter(Boolean)
+            .join(' · ');
+        container.style.display = '';
+
+        // Count down locally; the server sends a fresh session at zero
+        countdownTimer = setInterval(function () {
+            minutes = Math.max(minutes - 1, 0);
+            minutesEl.textContent = formatMinutes(minutes);
+        }, 60000);
+    }
+
+    function updateCounters(counters) {
+        Object.entries(counters).forEach(function ([field, value]) {
+            document
+                .querySelectorAll(`[data-counter="${field}"]`)
+                .forEach(function (el) {
+                    el.textContent = value;
+                    el.hidden = !value;
+                });
+        });
+    }
+
+    const initial = document.getElementById('nextSessionData');
+    if (initial) {
+        showNextSession(JSON.parse(initial.textContent));
+    }
+    if (!streamUrl || !window.EventSource) {
+        return;
+    }
+
+    const source = new EventSource(streamUrl);
+    EVENTS.forEach(function (name) {
+        source.addEventListener(name, function (event) {
+            const data = JSON.parse(event.data);
+            if (name === 'next_session') {
+                showNextSession(data);
+            } else if (name === 'counters') {
+                updateCounters(data);
+            }
+            document.dispatchEvent(
+                new CustomEvent(`silabus:${name}`, { detail: data })
+            );
+        });
+    });
+})();
@@ -3,6 +3,10 @@ ASGI config for SilabusLMS project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Needed for the server-sent events stream (api/action-center/stream), which
+holds a connection open per dashboard tab without tying up a worker thread.
+Serve with any ASGI server, e.g. ``uvicorn cadmus.asgi:application``.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
 """
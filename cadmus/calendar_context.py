@@ -8,6 +8,7 @@ from students.models import Student
 from core.models import User
 import json
 from django.core.serializers.json import DjangoJSONEncoder
+from cadmus.metrics import observe_rows
 
 
 def calendar_context(request):
@@ -19,6 +20,7 @@ def calendar_context(request):
         # Get all events for the calendar
         events = Event.objects.all().order_by("start_time")
         events_data = [event.to_dict() for event in events]
+        observe_rows("global_events_json", len(events_data))
 
         # Get top 10 students (reuse existing logic)
         from students.models import Student
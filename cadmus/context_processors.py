@@ -1,6 +1,8 @@
 # Context processor to provide common data to all templates
 from students.models import Student
+from action_center.models import UserCounters
 from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.functional import SimpleLazyObject
 import json
 
 
@@ -13,5 +15,9 @@ def common_context(request):
 
         return {
             "top_students_json": json.dumps(top_students_data, cls=DjangoJSONEncoder),
+            # Badge counts: one row lookup, only on templates that use them
+            "action_counters": SimpleLazyObject(
+                lambda: UserCounters.for_user(request.user)
+            ),
         }
     return {}
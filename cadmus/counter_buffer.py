@@ -0,0 +1,136 @@
+"""
+Write-behind counter buffer for hot, lossy-tolerant counters (view counts).
+
+Incrementing views_count with an UPDATE per page view makes every view of
+a popular topic queue on the same row lock. Instead, increments are summed
+in memory and flushed as ONE statement per model:
+
+    UPDATE t SET views_count = views_count + CASE id WHEN 1 THEN 7
+                                                     WHEN 9 THEN 2 END
+    WHERE id IN (1, 9)
+
+Flushes happen:
+- every COUNTER_BUFFER_FLUSH_INTERVAL seconds (daemon thread),
+- as soon as COUNTER_BUFFER_MAX_PENDING increments are buffered,
+- at interpreter exit (atexit; covers graceful worker shutdown).
+
+So a crash (SIGKILL, OOM) loses at most MAX_PENDING increments or one
+interval's worth per process, whichever is smaller. A failed flush puts
+its counts back into the buffer. Each process has its own buffer; the
+UPDATEs are additive, so several workers flushing is fine.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Case, F, IntegerField, Value, When
+
+logger = logging.getLogger(__name__)
+
+FLUSH_CHUNK_SIZE = 500
+
+
+class CounterBuffer:
+    def __init__(self, field):
+        self.field = field
+        self._pending = Counter()  # (model, pk) -> increments
+        self._total = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def interval(self):
+        return getattr(settings, "COUNTER_BUFFER_FLUSH_INTERVAL", 10)
+
+    @property
+    def max_pending(self):
+        return getattr(settings, "COUNTER_BUFFER_MAX_PENDING", 1000)
+
+    def increment(self, model, pk, amount=1):
+        """Buffer `amount` views for model row `pk`."""
+        with self._lock:
+            self._pending[(model, pk)] += amount
+            self._total += amount
+            total = self._total
+        self._ensure_thread()
+        if total >= self.max_pending:
+            self.flush()
+
+    def pending(self, model, pk):
+        """Increments for a row not yet written (add to the stored value)."""
+        with self._lock:
+            return self._pending.get((model, pk), 0)
+
+    def flush(self):
+        """Write all buffered increments; returns the number of rows updated."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, Counter()
+                self._total = 0
+            if not batch:
+                return 0
+
+            by_model = {}
+            for (model, pk), amount in batch.items():
+                by_model.setdefault(model, {})[pk] = amount
+
+            updated = 0
+            for model, amounts in by_model.items():
+                items = list(amounts.items())
+                for start in range(0, len(items), FLUSH_CHUNK_SIZE):
+                    chunk = dict(items[start : start + FLUSH_CHUNK_SIZE])
+                    try:
+                        updated += self._write(model, chunk)
+                    except Exception:
+                        logger.exception("Counter flush failed for %s", model.__name__)
+                        self._restore(model, chunk)
+            return updated
+
+    def _write(self, model, amounts):
+        delta = Case(
+            *[When(pk=pk, then=Value(amount)) for pk, amount in amounts.items()],
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+        return model.objects.filter(pk__in=list(amounts)).update(
+            **{self.field: F(self.field) + delta}
+        )
+
+    def _restore(self, model, amounts):
+        with self._lock:
+            for pk, amount in amounts.items():
+                self._pending[(model, pk)] += amount
+                self._total += amount
+
+    def _ensure_thread(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"{self.field}-flusher", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            close_old_connections()
+            self.flush()
+
+
+view_counts = CounterBuffer("views_count")
+
+
+@atexit.register
+def _flush_on_exit():
+    try:
+        view_counts.flush()
+    except Exception:
+        logger.exception("Counter flush at exit failed")
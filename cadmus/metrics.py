@@ -0,0 +1,300 @@
+"""
+Prometheus metrics for SilabusLMS.
+
+In-process, thread-safe aggregation exposed in the Prometheus text format
+at /metrics:
+- silabus_request_duration_seconds: latency histogram per URL name
+- silabus_requests_total: requests per URL name, method and status
+- silabus_db_queries_total / silabus_db_query_seconds_total: per URL name
+- silabus_cache_requests_total / silabus_cache_hit_ratio: per cache alias
+  (needs one of the Instrumented*Cache backends in CACHES)
+- silabus_payload_rows_total: rows serialized into the big JSON payloads
+
+Values are per process: with several workers, scrape each one or sum them
+in Prometheus.
+"""
+
+import hmac
+import threading
+from bisect import bisect_left
+
+from django.conf import settings
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import Http404, HttpResponse, HttpResponseForbidden
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(names, values):
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        value = value.replace("\n", "\\n")
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with a fixed set of label names."""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._values)
+
+    def samples(self):
+        for key, value in sorted(self.snapshot().items()):
+            yield self.name, _format_labels(self.labelnames, key), value
+
+
+class Histogram:
+    """Cumulative-bucket histogram with a fixed set of label names."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}  # key -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, amount, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        index = bisect_left(self.buckets, amount)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            state[index] += 1
+            state[-2] += amount
+            state[-1] += 1
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, list(state)) for key, state in self._values.items())
+        names = self.labelnames + ("le",)
+        for key, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), state):
+                cumulative += count
+                yield (
+                    f"{self.name}_bucket",
+                    _format_labels(names, key + (_format_value(bound),)),
+                    cumulative,
+                )
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum", labels, state[-2]
+            yield f"{self.name}_count", labels, state[-1]
+
+
+class Registry:
+    """Holds metric families and renders the text exposition format."""
+
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def exposition(self):
+        lines = []
+        with self._lock:
+            metrics = list(self._metrics)
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {_format_value(value)}")
+        lines.extend(_cache_hit_ratio_lines())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+REQUEST_DURATION = REGISTRY.histogram(
+    "silabus_request_duration_seconds",
+    "Request latency in seconds by URL name.",
+    ["view"],
+)
+REQUESTS = REGISTRY.counter(
+    "silabus_requests_total",
+    "Requests by URL name, method and status code.",
+    ["view", "method", "status"],
+)
+DB_QUERIES = REGISTRY.counter(
+    "silabus_db_queries_total",
+    "Database queries executed by URL name.",
+    ["view"],
+)
+DB_SECONDS = REGISTRY.counter(
+    "silabus_db_query_seconds_total",
+    "Time spent in database queries by URL name.",
+    ["view"],
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "silabus_cache_requests_total",
+    "Cache lookups by cache alias and result (hit/miss).",
+    ["cache", "result"],
+)
+PAYLOAD_ROWS = REGISTRY.counter(
+    "silabus_payload_rows_total",
+    "Rows serialized into JSON payloads, by payload name.",
+    ["payload"],
+)
+
+
+def observe_rows(payload, rows):
+    """Count rows serialized into a named JSON payload (e.g. 'students_json')."""
+    PAYLOAD_ROWS.inc(rows, payload=payload)
+
+
+def _cache_hit_ratio_lines():
+    values = CACHE_REQUESTS.snapshot()
+    aliases = sorted({alias for alias, _ in values})
+    if not aliases:
+        return []
+    lines = [
+        "# HELP silabus_cache_hit_ratio Share of cache lookups that were hits.",
+        "# TYPE silabus_cache_hit_ratio gauge",
+    ]
+    for alias in aliases:
+        hits = values.get((alias, "hit"), 0)
+        misses = values.get((alias, "miss"), 0)
+        ratio = hits / (hits + misses) if hits + misses else 0.0
+        lines.append(f'silabus_cache_hit_ratio{{cache="{alias}"}} {ratio!r}')
+    return lines
+
+
+# ============================================
+# INSTRUMENTED CACHE BACKENDS
+# ============================================
+
+_MISSING = object()
+
+
+class CacheMetricsMixin:
+    """
+    Counts hits and misses for get/get_many on any Django cache backend.
+    Backends implement one in terms of the other (LocMem get_many -> get,
+    Database get -> get_many), so only the outermost call is counted.
+    """
+
+    _depth = threading.local()
+
+    def __init__(self, location, params):
+        super().__init__(location, params)
+        self.metrics_alias = params.get("METRICS_ALIAS", "default")
+
+    def _count(self, hits, misses):
+        if hits:
+            CACHE_REQUESTS.inc(hits, cache=self.metrics_alias, result="hit")
+        if misses:
+            CACHE_REQUESTS.inc(misses, cache=self.metrics_alias, result="miss")
+
+    def _enter(self):
+        depth = getattr(self._depth, "value", 0)
+        self._depth.value = depth + 1
+        return depth == 0
+
+    def _exit(self):
+        self._depth.value -= 1
+
+    def get(self, key, default=None, version=None):
+        outermost = self._enter()
+        try:
+            value = super().get(key, _MISSING, version=version)
+        finally:
+            self._exit()
+        if outermost:
+            self._count(int(value is not _MISSING), int(value is _MISSING))
+        return default if value is _MISSING else value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        outermost = self._enter()
+        try:
+            found = super().get_many(keys, version=version)
+        finally:
+            self._exit()
+        if outermost:
+            self._count(len(found), len(keys) - len(found))
+        return found
+
+
+class InstrumentedLocMemCache(CacheMetricsMixin, LocMemCache):
+    pass
+
+
+class InstrumentedDatabaseCache(CacheMetricsMixin, DatabaseCache):
+    pass
+
+
+# ============================================
+# /metrics VIEW
+# ============================================
+
+
+def _client_ip(request):
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def _has_metrics_token(request):
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if not token:
+        return False
+    header = request.META.get("HTTP_AUTHORIZATION", "")
+    return hmac.compare_digest(header.encode(), f"Bearer {token}".encode())
+
+
+def metrics_view(request):
+    """
+    Prometheus scrape endpoint (404 unless METRICS_ENABLED), limited to
+    staff, the METRICS_TOKEN bearer token or METRICS_ALLOWED_IPS.
+    """
+    if not getattr(settings, "METRICS_ENABLED", False):
+        raise Http404
+    allowed_ips = getattr(settings, "METRICS_ALLOWED_IPS", [])
+    user = getattr(request, "user", None)
+    is_staff = user is not None and user.is_authenticated and user.is_staff
+    if (
+        not is_staff
+        and not _has_metrics_token(request)
+        and _client_ip(request) not in allowed_ips
+    ):
+        return HttpResponseForbidden("Forbidden")
+    return HttpResponse(REGISTRY.exposition(), content_type=CONTENT_TYPE)
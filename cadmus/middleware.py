@@ -1,5 +1,23 @@
+import cProfile
+import functools
+import heapq
+import io
+import json
+import logging
+import pstats
+import random
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack
+from pathlib import Path
+
+from django.conf import settings
 from django.contrib.auth import login
 from django.contrib.auth import get_user_model
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
 
 User = get_user_model()
 
@@ -25,3 +43,349 @@ class AutoLoginMiddleware:
 
         response = self.get_response(request)
         return response
+
+
+# ============================================
+# SQL INSTRUMENTATION (query count, DB time, N+1 detection)
+# ============================================
+
+sql_logger = logging.getLogger("cadmus.sql")
+
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:\s*%s\s*,?)+\)", re.IGNORECASE)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SELECT_LIST_RE = re.compile(r"^SELECT .+? FROM ", re.DOTALL)
+
+
+@functools.lru_cache(maxsize=2048)
+def fingerprint_sql(sql):
+    """
+    Normalize a statement so repeats of the same query shape compare equal.
+    Literals become '?' and IN (...) lists of any length collapse to IN (?).
+    """
+    sql = _IN_LIST_RE.sub("IN (?)", sql)
+    sql = _STRING_RE.sub("?", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    return _WHITESPACE_RE.sub(" ", sql).strip()
+
+
+def summarize_sql(sql, limit=300):
+    """Shorten a statement for logs: drop the column list, keep FROM/WHERE."""
+    return _SELECT_LIST_RE.sub("SELECT ... FROM ", sql, count=1)[:limit]
+
+
+class QueryRecorder:
+    """
+    connection.execute_wrapper callable that records one request's queries.
+    Keeps only counters per fingerprint and a bounded heap of the slowest
+    statements, so memory and CPU stay flat no matter how many queries run.
+    """
+
+    def __init__(self, keep_slowest=5):
+        self.keep_slowest = keep_slowest
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+        self.slowest = []  # min-heap of (duration, sql)
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.count += 1
+            self.duration += elapsed
+            self.fingerprints[fingerprint_sql(sql)] += 1
+            if len(self.slowest) < self.keep_slowest:
+                heapq.heappush(self.slowest, (elapsed, sql))
+            elif elapsed > self.slowest[0][0]:
+                heapq.heapreplace(self.slowest, (elapsed, sql))
+
+    def repeated(self, threshold):
+        """Fingerprints executed at least `threshold` times (N+1 bursts)."""
+        return [
+            (fingerprint, count)
+            for fingerprint, count in self.fingerprints.most_common()
+            if count >= threshold
+        ]
+
+
+class SQLInstrumentationMiddleware:
+    """
+    Records per-request query count, total DB time and the slowest statements
+    on every configured database, flags repeated query shapes (N+1 bursts),
+    adds a Server-Timing header and writes one JSON log line per request to
+    the "cadmus.sql" logger.
+
+    Enabled with settings.SQL_INSTRUMENTATION.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "SQL_INSTRUMENTATION", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.keep_slowest = getattr(settings, "SQL_INSTRUMENTATION_SLOWEST", 5)
+        self.n_plus_one_threshold = getattr(
+            settings, "SQL_INSTRUMENTATION_N_PLUS_ONE_THRESHOLD", 10
+        )
+
+    def __call__(self, request):
+        recorder = QueryRecorder(keep_slowest=self.keep_slowest)
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(recorder))
+            response = self.get_response(request)
+        total = time.perf_counter() - started
+
+        db_ms = recorder.duration * 1000
+        response["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={db_ms:.1f};desc="{recorder.count} queries"',
+                f"app;dur={(total - recorder.duration) * 1000:.1f}",
+                f"total;dur={total * 1000:.1f}",
+            ]
+        )
+
+        repeated = recorder.repeated(self.n_plus_one_threshold)
+        match = getattr(request, "resolver_match", None)
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "view": match.view_name if match else None,
+            "status": response.status_code,
+            "queries": recorder.count,
+            "db_ms": round(db_ms, 2),
+            "total_ms": round(total * 1000, 2),
+            "slowest": [
+                {"ms": round(elapsed * 1000, 2), "sql": summarize_sql(sql)}
+                for elapsed, sql in sorted(recorder.slowest, reverse=True)
+            ],
+            "n_plus_one": [
+                {"count": count, "sql": summarize_sql(fingerprint)}
+                for fingerprint, count in repeated
+            ],
+        }
+        log = sql_logger.warning if repeated else sql_logger.info
+        log(json.dumps(record))
+        return response
+
+
+# ============================================
+# ON-DEMAND PROFILER (cProfile dumps to PROFILING_DIR)
+# ============================================
+
+profile_logger = logging.getLogger("cadmus.profiling")
+
+_template_timings = threading.local()
+
+
+def _install_template_timer():
+    """
+    Time page-level template renders (the backend Template.render that
+    django.shortcuts.render calls) while a profiled request is running.
+    Installed once; costs one attribute lookup when no profile is active.
+    """
+    from django.template.backends.django import Template
+
+    if getattr(Template.render, "_profiling_timer", False):
+        return
+    original_render = Template.render
+
+    @functools.wraps(original_render)
+    def render(self, context=None, request=None):
+        timings = getattr(_template_timings, "active", None)
+        if timings is None:
+            return original_render(self, context, request)
+        started = time.perf_counter()
+        try:
+            return original_render(self, context, request)
+        finally:
+            name = getattr(self.template.origin, "template_name", None) or "<string>"
+            timings.append((name, time.perf_counter() - started))
+
+    render._profiling_timer = True
+    Template.render = render
+
+
+class ProfilingMiddleware:
+    """
+    Runs a single request under cProfile and dumps a .prof file plus a
+    top-N text summary (with page template render times) to PROFILING_DIR.
+
+    A request is profiled when:
+    - a superuser sends the PROFILING_HEADER header or the ?_profile=1 flag
+    - or it is picked by PROFILING_SAMPLE_RATE (0.0 - 1.0)
+
+    Old dumps are deleted once the directory exceeds PROFILING_MAX_BYTES.
+    Enabled with settings.PROFILING_ENABLED.
+    """
+
+    QUERY_FLAG = "_profile"
+
+    def __init__(self, get_response):
+        if not getattr(settings, "PROFILING_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.header = getattr(settings, "PROFILING_HEADER", "X-Profile")
+        self.sample_rate = getattr(settings, "PROFILING_SAMPLE_RATE", 0.0)
+        self.top_n = getattr(settings, "PROFILING_TOP_N", 40)
+        self.max_bytes = getattr(settings, "PROFILING_MAX_BYTES", 50 * 1024 * 1024)
+        self.directory = Path(
+            getattr(settings, "PROFILING_DIR", Path(settings.BASE_DIR) / "profiles")
+        )
+        _install_template_timer()
+
+    def should_profile(self, request):
+        user = getattr(request, "user", None)
+        if user is not None and user.is_superuser:
+            if request.headers.get(self.header) or request.GET.get(self.QUERY_FLAG):
+                return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def __call__(self, request):
+        if not self.should_profile(request):
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        _template_timings.active = timings = []
+        started = time.perf_counter()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already running on this thread
+            _template_timings.active = None
+            return self.get_response(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+            _template_timings.active = None
+        elapsed = time.perf_counter() - started
+
+        try:
+            name = self.dump(request, response, profiler, timings, elapsed)
+        except OSError:
+            profile_logger.exception("Could not write profile for %s", request.path)
+        else:
+            response["X-Profile-Id"] = name
+        return response
+
+    def dump(self, request, response, profiler, timings, elapsed):
+        """Write <name>.prof and <name>.txt, then enforce the size cap."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        match = getattr(request, "resolver_match", None)
+        label = match.view_name if match else request.path
+        slug = re.sub(r"[^A-Za-z0-9]+", "-", label).strip("-") or "root"
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{slug}-{int(elapsed * 1000)}ms"
+
+        profiler.dump_stats(str(self.directory / f"{name}.prof"))
+
+        summary = io.StringIO()
+        summary.write(f"{request.method} {request.get_full_path()}\n")
+        summary.write(f"view: {label}  status: {response.status_code}\n")
+        summary.write(f"total: {elapsed * 1000:.1f} ms\n\n")
+        if timings:
+            summary.write("Template rendering:\n")
+            for template_name, seconds in timings:
+                summary.write(f"  {seconds * 1000:9.1f} ms  {template_name}\n")
+            summary.write("\n")
+        stats = pstats.Stats(profiler, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_n)
+        (self.directory / f"{name}.txt").write_text(summary.getvalue())
+
+        self.rotate()
+        profile_logger.info("Profiled %s in %.1f ms -> %s", label, elapsed * 1000, name)
+        return name
+
+    def rotate(self):
+        """Delete the oldest dumps until the directory fits PROFILING_MAX_BYTES."""
+        files = sorted(
+            (p for p in self.directory.iterdir() if p.suffix in (".prof", ".txt")),
+            key=lambda p: p.stat().st_mtime,
+        )
+        total = sum(p.stat().st_size for p in files)
+        for path in files:
+            if total <= self.max_bytes:
+                break
+            total -= path.stat().st_size
+            path.unlink(missing_ok=True)
+
+
+# ============================================
+# PROMETHEUS METRICS (request latency and DB usage per URL name)
+# ============================================
+
+
+class MetricsMiddleware:
+    """
+    Feeds cadmus.metrics with request latency, status codes and database
+    query counts/time, labelled by URL name. Disabled with
+    settings.METRICS_ENABLED = False.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "METRICS_ENABLED", True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        from cadmus import metrics
+
+        db = _DBTimer()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(db))
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - started
+
+        match = getattr(request, "resolver_match", None)
+        view = (match.view_name if match else None) or "<unresolved>"
+        metrics.REQUEST_DURATION.observe(elapsed, view=view)
+        metrics.REQUESTS.inc(
+            view=view, method=request.method, status=str(response.status_code)
+        )
+        if db.count:
+            metrics.DB_QUERIES.inc(db.count, view=view)
+            metrics.DB_SECONDS.inc(db.duration, view=view)
+        return response
+
+
+class _DBTimer:
+    """Minimal execute_wrapper: query count and total time only."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started
+
+
+# ============================================
+# READ REPLICA (per-request read-your-writes pinning)
+# ============================================
+
+
+class ReplicaPinningMiddleware:
+    """
+    Resets cadmus.routers state for each request, so a write pins only the
+    request that made it to the primary database.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        from cadmus.routers import request_scope
+
+        with request_scope():
+            return self.get_response(request)
@@ -0,0 +1,104 @@
+"""
+In-process publish/subscribe for server-sent events.
+
+Model signals publish small per-user deltas (new message, counters,
+deadline changes, next session); the SSE endpoint
+(action_center.views.event_stream) subscribes one bounded asyncio.Queue
+per open connection and streams whatever arrives.
+
+Publishers run in sync code (views, signals, management commands) on any
+thread, so delivery goes through loop.call_soon_threadsafe(). Subscribers
+whose queue is full are flagged as overflowed instead of blocking the
+publisher; the stream then tells the client to resync.
+
+Scope: one process. Every ASGI worker has its own broker, so with several
+workers a client only sees events published by the worker it is connected
+to (run a single ASGI worker for the stream, or swap the broker for a
+shared bus).
+"""
+
+import asyncio
+import threading
+
+from django.conf import settings
+from django.db import transaction
+
+ALL_USERS = "*"
+
+
+class Subscription:
+    def __init__(self, key, loop, maxsize):
+        self.key = key
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def _put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    def deliver(self, event):
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # Loop already closed: the connection is going away
+            pass
+
+
+class Broker:
+    def __init__(self):
+        self._subscriptions = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id):
+        """Register a queue for `user_id`; call from the event loop."""
+        subscription = Subscription(
+            user_id,
+            asyncio.get_running_loop(),
+            getattr(settings, "SSE_QUEUE_SIZE", 100),
+        )
+        with self._lock:
+            self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.key, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(subscription.key, None)
+
+    def publish(self, user_id, event, data):
+        """Send (event, data) to every open stream of `user_id` (or ALL_USERS)."""
+        with self._lock:
+            if user_id == ALL_USERS:
+                targets = [s for subs in self._subscriptions.values() for s in subs]
+            else:
+                targets = list(self._subscriptions.get(user_id, ()))
+        for subscription in targets:
+            subscription.deliver((event, data))
+        return len(targets)
+
+    def publish_on_commit(self, user_id, event, data_factory):
+        """
+        Publish once the current transaction commits. `data_factory` is
+        called at that point, so payloads reflect committed state and are
+        only built when someone is listening.
+        """
+
+        def send():
+            if self.has_subscribers(user_id):
+                self.publish(user_id, event, data_factory())
+
+        transaction.on_commit(send)
+
+    def has_subscribers(self, user_id):
+        with self._lock:
+            if user_id == ALL_USERS:
+                return bool(self._subscriptions)
+            return bool(self._subscriptions.get(user_id))
+
+
+broker = Broker()
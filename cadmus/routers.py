@@ -0,0 +1,82 @@
+"""
+Database routers for SilabusLMS.
+
+ReplicaRouter sends designated reads to the "replica" alias:
+- Views opt in with @use_replica (gradebook, leaderboards, exports...)
+- Code paths opt in with `with read_from_replica():`
+- After any write in the same request, reads stick to "default" so the
+  request always sees its own writes (ReplicaPinningMiddleware resets this
+  at the start of every request)
+
+Everything else, and every write, uses "default". When no replica alias is
+configured the router is a no-op.
+"""
+
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+_replica_requested = ContextVar("replica_requested", default=False)
+_pinned_to_primary = ContextVar("pinned_to_primary", default=False)
+
+
+def replica_alias():
+    """Configured replica alias, or None if there is no replica."""
+    alias = getattr(settings, "REPLICA_DATABASE_ALIAS", "replica")
+    return alias if alias in settings.DATABASES else None
+
+
+@contextmanager
+def read_from_replica():
+    """Route reads inside the block to the replica (unless pinned by a write)."""
+    token = _replica_requested.set(True)
+    try:
+        yield
+    finally:
+        _replica_requested.reset(token)
+
+
+def use_replica(view_func):
+    """View decorator: the view's reads go to the replica."""
+
+    @functools.wraps(view_func)
+    def wrapper(*args, **kwargs):
+        with read_from_replica():
+            return view_func(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def request_scope():
+    """Start a request unpinned and without replica reads."""
+    pinned = _pinned_to_primary.set(False)
+    requested = _replica_requested.set(False)
+    try:
+        yield
+    finally:
+        _replica_requested.reset(requested)
+        _pinned_to_primary.reset(pinned)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        alias = replica_alias()
+        if alias and _replica_requested.get() and not _pinned_to_primary.get():
+            return alias
+        return None
+
+    def db_for_write(self, model, **hints):
+        # Read-your-writes: every later read in this request uses default
+        _pinned_to_primary.set(True)
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # default and replica hold the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica receives schema changes through replication/sync
+        return db != replica_alias()
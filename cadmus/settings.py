@@ -41,9 +41,14 @@ INSTALLED_APPS = [
     "settings_app",
     "action_center",
     "forums",
+    "curriculum",
+    "search",
 ]
 
 MIDDLEWARE = [
+    "cadmus.middleware.MetricsMiddleware",
+    "cadmus.middleware.SQLInstrumentationMiddleware",
+    "cadmus.middleware.ReplicaPinningMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -56,6 +61,9 @@ MIDDLEWARE = [
 if not ON_PYTHONANYWHERE:
     MIDDLEWARE.append("cadmus.middleware.AutoLoginMiddleware")
 
+# Runs after authentication so superusers can trigger it per request
+MIDDLEWARE.append("cadmus.middleware.ProfilingMiddleware")
+
 ROOT_URLCONF = "cadmus.urls"
 
 TEMPLATES = [
@@ -105,6 +113,48 @@ else:
         }
     }
 
+# Read Replica (optional)
+# Designated read-heavy views (gradebook, leaderboards) read from "replica"
+# via cadmus.routers.ReplicaRouter; writes and everything else use default.
+# - PythonAnywhere: set MYSQL_REPLICA_HOST
+# - Local: set SQLITE_REPLICA_NAME (e.g. cadmus_replica.db) and keep it in
+#   sync with `python manage.py sync_replica`
+# Under the test runner the replica mirrors the test database; core.tests
+# has a fixture with two separate SQLite files for replication-lag tests.
+REPLICA_DATABASE_ALIAS = "replica"
+if ON_PYTHONANYWHERE and os.environ.get("MYSQL_REPLICA_HOST"):
+    DATABASES[REPLICA_DATABASE_ALIAS] = {
+        **DATABASES["default"],
+        "HOST": os.environ["MYSQL_REPLICA_HOST"],
+        "TEST": {"MIRROR": "default"},
+    }
+elif not ON_PYTHONANYWHERE and os.environ.get("SQLITE_REPLICA_NAME"):
+    DATABASES[REPLICA_DATABASE_ALIAS] = {
+        **DATABASES["default"],
+        "NAME": BASE_DIR / os.environ["SQLITE_REPLICA_NAME"],
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["cadmus.routers.ReplicaRouter"]
+
+# SQLite Performance Profile (opt-in, for local and small-school deployments)
+# WAL + tuned pragmas on every connection (see core/db.py) and persistent
+# connections with health checks. Enable with SQLITE_PERFORMANCE=1.
+SQLITE_PERFORMANCE = os.environ.get("SQLITE_PERFORMANCE", "0") == "1"
+# Pragmas default to core.db.DEFAULT_SQLITE_PRAGMAS; set SQLITE_PRAGMAS to a
+# dict to override individual values, e.g. {"mmap_size": 0}
+
+if SQLITE_PERFORMANCE:
+    for _db in DATABASES.values():
+        if _db["ENGINE"].endswith("sqlite3"):
+            _db.update(
+                {
+                    "CONN_MAX_AGE": 600,
+                    "CONN_HEALTH_CHECKS": True,
+                    "OPTIONS": {"timeout": 20},
+                }
+            )
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -143,6 +193,111 @@ LOGIN_URL = "core:login"
 LOGIN_REDIRECT_URL = "dashboard:dashboard"
 LOGOUT_REDIRECT_URL = "core:login"
 
+# SQL Instrumentation (cadmus.middleware.SQLInstrumentationMiddleware)
+# Per-request query count, DB time, slowest statements and N+1 detection.
+# Cheap enough for production; turn on with SQL_INSTRUMENTATION=1.
+SQL_INSTRUMENTATION = os.environ.get("SQL_INSTRUMENTATION", "0") == "1"
+SQL_INSTRUMENTATION_SLOWEST = 5  # Slowest statements kept per request
+SQL_INSTRUMENTATION_N_PLUS_ONE_THRESHOLD = 10  # Repeats of one query shape
+
+# On-demand Profiler (cadmus.middleware.ProfilingMiddleware)
+# Superusers profile a request with the X-Profile header or ?_profile=1;
+# PROFILING_SAMPLE_RATE additionally profiles a random share of all requests.
+PROFILING_ENABLED = os.environ.get("PROFILING_ENABLED", "0") == "1"
+PROFILING_SAMPLE_RATE = float(os.environ.get("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_HEADER = "X-Profile"
+PROFILING_DIR = BASE_DIR / "profiles"
+PROFILING_MAX_BYTES = 50 * 1024 * 1024  # Oldest dumps are rotated out
+PROFILING_TOP_N = 40  # Functions listed in the text summary
+
+# Prometheus Metrics (cadmus.metrics, scraped at /metrics)
+# On by default in development only. Behind a reverse proxy (PythonAnywhere)
+# REMOTE_ADDR is the proxy's address, so the IP allowlist is local-only and
+# production scrapers send "Authorization: Bearer $METRICS_TOKEN" instead.
+# Staff users are always allowed.
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1" if DEBUG else "0") == "1"
+METRICS_ALLOWED_IPS = ["127.0.0.1", "::1"] if DEBUG else []
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+# Cache
+# Instrumented backends count hits/misses for silabus_cache_hit_ratio
+CACHES = {
+    "default": {
+        "BACKEND": "cadmus.metrics.InstrumentedLocMemCache",
+        "LOCATION": "silabus-default",
+        "METRICS_ALIAS": "default",
+    }
+}
+
+# Action Center ticker feed cache (seconds, per user)
+ACTION_CENTER_FEED_TTL = 30
+
+# Curriculum coverage matrices (curriculum.coverage, seconds, per term);
+# also invalidated whenever lesson plan links change
+CURRICULUM_COVERAGE_TTL = 600
+
+# Friendship graph analytics (students.social_graph, seconds, per group)
+SOCIAL_GRAPH_TTL = 300
+
+# Server-sent events (action_center.views.event_stream, needs ASGI)
+SSE_HEARTBEAT_SECONDS = 15  # Keep-alive comment for proxies
+SSE_QUEUE_SIZE = 100  # Pending events per stream before asking for a resync
+
+# Deadline status sweeps (action_center.sweeper): seconds between sweeps in
+# the ASGI process so overdue events reach open streams; 0 = cron only
+DEADLINE_SWEEP_INTERVAL = 60
+
+# Email (broadcast copies)
+# Development prints messages to the console by default; to test real SMTP
+# locally set EMAIL_BACKEND=django.core.mail.backends.smtp.EmailBackend and
+# point EMAIL_HOST/EMAIL_PORT at a debugging server:
+#   python -m aiosmtpd -n -l localhost:1025                (pip install aiosmtpd)
+# Production sends over SMTP. Without EMAIL_HOST nothing is sent: the dummy
+# backend takes over, `check` warns (action_center.checks) and broadcasts
+# record the problem in their email_error.
+SMTP_EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+EMAIL_BACKEND = os.environ.get(
+    "EMAIL_BACKEND",
+    "django.core.mail.backends.console.EmailBackend" if DEBUG else SMTP_EMAIL_BACKEND,
+)
+EMAIL_HOST = os.environ.get("EMAIL_HOST", "localhost" if DEBUG else "")
+EMAIL_PORT = int(os.environ.get("EMAIL_PORT", "1025" if DEBUG else "587"))
+EMAIL_HOST_USER = os.environ.get("EMAIL_HOST_USER", "")
+EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD", "")
+EMAIL_USE_TLS = os.environ.get("EMAIL_USE_TLS", "0" if DEBUG else "1") == "1"
+EMAIL_TIMEOUT = 10
+EMAIL_CONFIGURED = bool(EMAIL_HOST) or EMAIL_BACKEND != SMTP_EMAIL_BACKEND
+if not EMAIL_CONFIGURED:
+    EMAIL_BACKEND = "django.core.mail.backends.dummy.EmailBackend"
+DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL", "noreply@silabuslms.com")
+
+# Broadcasts (action_center.broadcasts)
+BROADCAST_CHUNK_SIZE = 500  # Recipients per bulk_create / SMTP batch
+BROADCAST_SYNC_LIMIT = 200  # Larger fan-outs are delivered in the background
+BROADCAST_STALE_SECONDS = 1800  # SENDING this long = worker died, re-claim
+
+# Write-behind view counters (cadmus.counter_buffer): a crash loses at most
+# MAX_PENDING increments or FLUSH_INTERVAL seconds of views per process
+COUNTER_BUFFER_FLUSH_INTERVAL = 10
+COUNTER_BUFFER_MAX_PENDING = 1000
+
+# Logging
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "cadmus.sql": {"handlers": ["console"], "level": "INFO", "propagate": False},
+        "cadmus.profiling": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
+    },
+}
+
 # Admin Site Branding
 ADMIN_SITE_HEADER = "SilabusLMS Administration"
 ADMIN_SITE_TITLE = "SilabusLMS"
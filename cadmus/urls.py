@@ -6,6 +6,7 @@ from django.contrib import admin
 from django.urls import path, include
 from django.shortcuts import redirect
 from students import api as students_api
+from cadmus.metrics import metrics_view
 
 urlpatterns = [
     # Admin
@@ -18,8 +19,14 @@ urlpatterns = [
     path("students/", include("students.urls")),
     path("lessons/", include("lessons.urls")),
     path("settings/", include("settings_app.urls")),
+    path("api/action-center/", include("action_center.urls")),
+    path("api/forums/", include("forums.urls")),
+    path("api/search/", include("search.urls")),
+    path("api/curriculum/", include("curriculum.urls")),
     # API URLs - direct mapping to avoid duplicate 'students' in path
     path("api/students/top/", students_api.top_students_api, name="api_top_students"),
+    # Prometheus scrape endpoint (staff, METRICS_TOKEN or METRICS_ALLOWED_IPS)
+    path("metrics", metrics_view, name="metrics"),
 ]
 
 # Serve media files in development
@@ -3,3 +3,11 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     name = 'core'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from .db import configure_sqlite_connection
+
+        connection_created.connect(
+            configure_sqlite_connection, dispatch_uid="core.configure_sqlite"
+        )
@@ -0,0 +1,65 @@
+"""
+Database connection tuning for SilabusLMS.
+
+SQLite performance profile (settings.SQLITE_PERFORMANCE):
+- WAL journal, so readers no longer block on a writer (and vice versa)
+- synchronous=NORMAL: safe with WAL, one fsync per checkpoint not per commit
+- mmap_size / cache_size: keep hot pages in memory between requests
+- busy_timeout: writers wait for the lock instead of failing immediately
+
+Pragmas are applied on every new connection via the connection_created
+signal (connected in CoreConfig.ready).
+"""
+
+from django.conf import settings
+
+DEFAULT_SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,  # 256 MB
+    "cache_size": -64000,  # Negative = KiB, so ~64 MB
+    "busy_timeout": 5000,  # ms
+    "temp_store": "MEMORY",
+}
+
+
+def get_sqlite_pragmas():
+    """The default pragmas, with any settings.SQLITE_PRAGMAS overrides."""
+    return {**DEFAULT_SQLITE_PRAGMAS, **getattr(settings, "SQLITE_PRAGMAS", {})}
+
+
+def apply_sqlite_pragmas(raw_connection, pragmas):
+    """Run PRAGMA statements on a DB-API sqlite3 connection."""
+    for name, value in pragmas.items():
+        raw_connection.execute(f"PRAGMA {name} = {value}")
+
+
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """connection_created receiver applying the SQLite performance profile."""
+    if connection.vendor != "sqlite":
+        return
+    if not getattr(settings, "SQLITE_PERFORMANCE", False):
+        return
+    apply_sqlite_pragmas(connection.connection, get_sqlite_pragmas())
+
+
+def sync_sqlite_replica(source="default", replica=None):
+    """
+    Copy the SQLite `source` database onto the replica alias with the
+    online backup API. Stands in for replication when running locally or
+    in tests with two SQLite files (call it after writing fixtures).
+    """
+    from django.core.exceptions import ImproperlyConfigured
+    from django.db import connections
+
+    from cadmus.routers import replica_alias
+
+    replica = replica or replica_alias()
+    if replica is None:
+        raise ImproperlyConfigured("No replica database alias is configured")
+    src, dst = connections[source], connections[replica]
+    if src.vendor != "sqlite" or dst.vendor != "sqlite":
+        raise ImproperlyConfigured("sync_sqlite_replica needs two SQLite databases")
+    src.ensure_connection()
+    dst.ensure_connection()
+    src.connection.backup(dst.connection)
@@ -0,0 +1,214 @@
+"""
+SQLite Concurrency Benchmark for SilabusLMS
+
+Measures gradebook read throughput while teachers are writing grades, on two
+copies of the configured SQLite database:
+- default: rollback journal, synchronous=FULL (SQLite out of the box)
+- tuned:   the core/db.py pragma profile (WAL, NORMAL, mmap...)
+
+Reader threads run the per-group average-grade query; writer threads insert
+grades one transaction at a time. The live database is never modified.
+
+Usage:
+    python manage.py seed_database --clear --scale 10000 --seed 1
+    python manage.py benchmark_sqlite --readers 4 --writers 2 --duration 5
+"""
+
+import random
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.db import apply_sqlite_pragmas, get_sqlite_pragmas
+
+DEFAULT_MODE_PRAGMAS = {
+    "journal_mode": "DELETE",
+    "synchronous": "FULL",
+}
+
+READ_SQL = """
+    SELECT s.id, AVG(g.numeric_score), COUNT(g.id)
+    FROM students_student s
+    JOIN students_grade g ON g.student_id = s.id
+    WHERE s.group_id = ?
+    GROUP BY s.id
+"""
+
+WRITE_SQL = """
+    INSERT INTO students_grade (
+        student_id, course_id, grade_type, title, numeric_score,
+        date_recorded, notes, created_at, updated_at
+    ) VALUES (?, ?, 'quiz', 'Benchmark Quiz', ?, ?, '', ?, ?)
+"""
+
+
+class Command(BaseCommand):
+    help = "Compare SQLite read throughput under concurrent grade writes"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--readers", type=int, default=4)
+        parser.add_argument("--writers", type=int, default=1)
+        parser.add_argument(
+            "--duration", type=float, default=5.0, help="Seconds per mode"
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=5.0,
+            help="sqlite3 busy timeout in seconds for every connection",
+        )
+
+    def handle(self, *args, **options):
+        db = settings.DATABASES["default"]
+        if not db["ENGINE"].endswith("sqlite3"):
+            raise CommandError("benchmark_sqlite needs a SQLite default database")
+        source = Path(db["NAME"])
+        if not source.exists():
+            raise CommandError(f"{source} does not exist; run migrate/seed first")
+
+        workdir = Path(tempfile.mkdtemp(prefix="silabus-sqlite-bench-"))
+        try:
+            results = {}
+            for mode, pragmas in (
+                ("default", DEFAULT_MODE_PRAGMAS),
+                ("tuned", get_sqlite_pragmas()),
+            ):
+                path = workdir / f"{mode}.db"
+                self._copy_database(source, path)
+                self.stdout.write(f"Running {mode} mode ({options['duration']}s)...")
+                results[mode] = self._run(path, pragmas, options)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        self._report(results, options)
+
+    def _copy_database(self, source, target):
+        """Snapshot the live database with the online backup API."""
+        with sqlite3.connect(source) as src, sqlite3.connect(target) as dst:
+            src.backup(dst)
+
+    def _run(self, path, pragmas, options):
+        with sqlite3.connect(path) as conn:
+            apply_sqlite_pragmas(conn, pragmas)
+            group_ids = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT DISTINCT group_id FROM students_student "
+                    "WHERE group_id IS NOT NULL"
+                )
+            ]
+            enrollments = conn.execute(
+                "SELECT student_id, course_id FROM dashboard_coursestudent LIMIT 5000"
+            ).fetchall()
+        if not group_ids or not enrollments:
+            raise CommandError("No students/enrollments found; seed the database")
+
+        stop = threading.Event()
+        stats = {"reads": [], "writes": [], "read_errors": 0, "write_errors": 0}
+        lock = threading.Lock()
+
+        def connect():
+            conn = sqlite3.connect(path, timeout=options["timeout"])
+            apply_sqlite_pragmas(conn, pragmas)
+            return conn
+
+        def reader(seed):
+            rng = random.Random(seed)
+            conn = connect()
+            latencies, errors = [], 0
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    conn.execute(READ_SQL, (rng.choice(group_ids),)).fetchall()
+                except sqlite3.OperationalError:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - started)
+            conn.close()
+            with lock:
+                stats["reads"].extend(latencies)
+                stats["read_errors"] += errors
+
+        def writer(seed):
+            rng = random.Random(seed)
+            conn = connect()
+            latencies, errors = [], 0
+            today = date.today().isoformat()
+            while not stop.is_set():
+                student_id, course_id = rng.choice(enrollments)
+                now = datetime.now(timezone.utc).isoformat(sep=" ")
+                started = time.perf_counter()
+                try:
+                    with conn:
+                        conn.execute(
+                            WRITE_SQL,
+                            (
+                                student_id,
+                                course_id,
+                                rng.uniform(0, 20),
+                                today,
+                                now,
+                                now,
+                            ),
+                        )
+                except sqlite3.OperationalError:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - started)
+            conn.close()
+            with lock:
+                stats["writes"].extend(latencies)
+                stats["write_errors"] += errors
+
+        threads = [
+            threading.Thread(target=reader, args=(n,)) for n in range(options["readers"])
+        ] + [
+            threading.Thread(target=writer, args=(1000 + n,))
+            for n in range(options["writers"])
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(options["duration"])
+        stop.set()
+        for thread in threads:
+            thread.join()
+        return stats
+
+    def _report(self, results, options):
+        duration = options["duration"]
+
+        def pct(values, q):
+            """q-th percentile in milliseconds."""
+            if len(values) < 2:
+                return values[0] * 1000 if values else 0.0
+            return statistics.quantiles(values, n=100)[q - 1] * 1000
+
+        self.stdout.write("")
+        self.stdout.write(
+            f"{'mode':<10}{'reads/s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+            f"{'writes/s':>10}{'w p95 ms':>10}{'locked':>8}"
+        )
+        for mode, stats in results.items():
+            self.stdout.write(
+                f"{mode:<10}"
+                f"{len(stats['reads']) / duration:>10.1f}"
+                f"{pct(stats['reads'], 50):>10.2f}"
+                f"{pct(stats['reads'], 95):>10.2f}"
+                f"{len(stats['writes']) / duration:>10.1f}"
+                f"{pct(stats['writes'], 95):>10.2f}"
+                f"{stats['read_errors'] + stats['write_errors']:>8}"
+            )
+        default_reads = len(results["default"]["reads"])
+        if default_reads:
+            speedup = len(results["tuned"]["reads"]) / default_reads
+            self.stdout.write(
+                self.style.SUCCESS(f"\nTuned read throughput: {speedup:.1f}x default")
+            )
@@ -0,0 +1,265 @@
+"""
+View Benchmark Suite for SilabusLMS
+
+Seeds a throwaway test database at several scales (via seed_database --scale)
+and drives the main pages through the Django test client, recording per view:
+- Wall time (best of --repeat runs)
+- Query count
+- Response size
+
+Fails (non-zero exit) when:
+- A view's query count grows with the number of students (N+1 patterns)
+- A view exceeds its stored baseline (query count, or wall time beyond
+  --time-tolerance); benchmarks/baseline.json holds the default scales,
+  and a missing baseline or scale is reported as a warning
+
+Usage:
+    python manage.py benchmark_views
+    python manage.py benchmark_views --scales 100,1000,5000 --save-baseline
+"""
+
+import io
+import json
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.test import Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.urls import reverse
+
+# (label, url name) pairs driven on every scale
+BENCHMARK_VIEWS = [
+    ("dashboard_view", "dashboard:dashboard"),
+    ("students_view", "students:students"),
+    ("grades_view", "students:grades"),
+    ("my_courses_view", "dashboard:my_courses"),
+    ("lesson_plans_view", "lessons:lesson_plans"),
+    ("top_students_api", "api_top_students"),
+]
+
+DEFAULT_BASELINE = Path(settings.BASE_DIR) / "benchmarks" / "baseline.json"
+
+
+class QueryCounter:
+    """execute_wrapper that counts statements (no DEBUG query log limit)."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = "Benchmark the main views at several dataset scales"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scales",
+            default="100,1000",
+            help="Comma-separated student counts to seed (default: 100,1000)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=42,
+            help="Random seed passed to seed_database (default: 42)",
+        )
+        parser.add_argument(
+            "--months",
+            type=int,
+            default=2,
+            help="Months of history per student (default: 2)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Requests per view and scale; the fastest is kept (default: 3)",
+        )
+        parser.add_argument(
+            "--baseline",
+            default=str(DEFAULT_BASELINE),
+            help="Baseline JSON file to compare against",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="Write this run's results as the new baseline",
+        )
+        parser.add_argument(
+            "--time-tolerance",
+            type=float,
+            default=0.5,
+            help="Allowed wall-time regression over baseline (default: 0.5 = +50%%)",
+        )
+        parser.add_argument(
+            "--query-slack",
+            type=int,
+            default=10,
+            help="Extra queries tolerated between smallest and largest scale "
+            "(default: 10, absorbs data-dependent lookups on fixed-size lists)",
+        )
+
+    def handle(self, *args, **options):
+        scales = sorted({int(s) for s in options["scales"].split(",") if s.strip()})
+        if not scales:
+            raise CommandError("--scales must list at least one student count")
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        # Other aliases (the read replica) read the test database too, as
+        # with TEST["MIRROR"] under the test runner
+        for alias in connections:
+            if alias != DEFAULT_DB_ALIAS:
+                connections[alias].creation.set_as_test_mirror(
+                    connection.settings_dict
+                )
+        try:
+            results = {}
+            for scale in scales:
+                self.stdout.write(self.style.MIGRATE_HEADING(f"Scale: {scale} students"))
+                self._seed(scale, options)
+                results[str(scale)] = self._run_scale(options["repeat"])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        self._print_report(results)
+
+        baseline_path = Path(options["baseline"])
+        if options["save_baseline"]:
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            baseline_path.write_text(json.dumps(results, indent=2, sort_keys=True))
+            self.stdout.write(self.style.SUCCESS(f"Baseline saved to {baseline_path}"))
+
+        failures = self._check_scaling(results, scales, options["query_slack"])
+        if options["save_baseline"]:
+            pass
+        elif not baseline_path.exists():
+            self.stderr.write(
+                self.style.WARNING(
+                    f"No baseline at {baseline_path}: comparison skipped "
+                    "(record one with --save-baseline)"
+                )
+            )
+        else:
+            baseline = json.loads(baseline_path.read_text())
+            missing = sorted(set(results) - set(baseline), key=int)
+            if missing:
+                self.stderr.write(
+                    self.style.WARNING(
+                        f"Baseline has no results for scale(s) {', '.join(missing)}"
+                    )
+                )
+            failures += self._check_baseline(
+                results, baseline, options["time_tolerance"]
+            )
+
+        if failures:
+            for failure in failures:
+                self.stderr.write(self.style.ERROR(f"  - {failure}"))
+            raise CommandError(f"{len(failures)} benchmark budget(s) exceeded")
+        self.stdout.write(self.style.SUCCESS("All benchmark budgets met"))
+
+    def _seed(self, scale, options):
+        """Replace the test database contents with a dataset of `scale` students."""
+        started = time.monotonic()
+        call_command(
+            "seed_database",
+            clear=True,
+            scale=scale,
+            seed=options["seed"],
+            months=options["months"],
+            stdout=io.StringIO(),
+        )
+        self.stdout.write(f"  seeded in {time.monotonic() - started:.1f}s")
+
+    def _run_scale(self, repeat):
+        """Request every benchmark view and return {label: metrics}."""
+        from django.contrib.auth import get_user_model
+
+        teacher = get_user_model().objects.get(email="teacher@silabuslms.com")
+        client = Client()
+        client.force_login(teacher)
+
+        metrics = {}
+        for label, url_name in BENCHMARK_VIEWS:
+            url = reverse(url_name)
+            timings = []
+            for _ in range(max(repeat, 1)):
+                counter = QueryCounter()
+                # Count every alias: use_replica views read through "replica"
+                with ExitStack() as stack:
+                    for conn in connections.all():
+                        stack.enter_context(conn.execute_wrapper(counter))
+                    started = time.perf_counter()
+                    response = client.get(url)
+                    elapsed = time.perf_counter() - started
+                if response.status_code != 200:
+                    raise CommandError(
+                        f"{label} ({url}) returned HTTP {response.status_code}"
+                    )
+                timings.append(elapsed)
+            metrics[label] = {
+                "wall_ms": round(min(timings) * 1000, 2),
+                "queries": counter.count,
+                "bytes": len(response.content),
+            }
+        return metrics
+
+    def _print_report(self, results):
+        header = f"{'view':<20}{'scale':>8}{'wall ms':>12}{'queries':>10}{'bytes':>12}"
+        self.stdout.write("")
+        self.stdout.write(header)
+        self.stdout.write("-" * len(header))
+        for label, _ in BENCHMARK_VIEWS:
+            for scale, metrics in results.items():
+                m = metrics[label]
+                self.stdout.write(
+                    f"{label:<20}{scale:>8}{m['wall_ms']:>12.2f}"
+                    f"{m['queries']:>10}{m['bytes']:>12}"
+                )
+        self.stdout.write("")
+
+    def _check_scaling(self, results, scales, slack):
+        """Query counts must not depend on the number of students."""
+        if len(scales) < 2:
+            return []
+        smallest, largest = str(scales[0]), str(scales[-1])
+        failures = []
+        for label, _ in BENCHMARK_VIEWS:
+            low = results[smallest][label]["queries"]
+            high = results[largest][label]["queries"]
+            if high > low + slack:
+                failures.append(
+                    f"{label}: query count grows with N "
+                    f"({low} at {smallest} -> {high} at {largest} students)"
+                )
+        return failures
+
+    def _check_baseline(self, results, baseline, tolerance):
+        """Compare against stored results for the scales present in both."""
+        failures = []
+        for scale, metrics in results.items():
+            for label, m in metrics.items():
+                base = baseline.get(scale, {}).get(label)
+                if not base:
+                    continue
+                if m["queries"] > base["queries"]:
+                    failures.append(
+                        f"{label} @ {scale}: {m['queries']} queries "
+                        f"(baseline {base['queries']})"
+                    )
+                if m["wall_ms"] > base["wall_ms"] * (1 + tolerance):
+                    failures.append(
+                        f"{label} @ {scale}: {m['wall_ms']:.1f} ms "
+                        f"(baseline {base['wall_ms']:.1f} ms)"
+                    )
+        return failures
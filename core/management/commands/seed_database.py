@@ -9,13 +9,24 @@ Generates realistic mock data including:
 - Teacher Observations (History)
 - Forum Topics & Deadlines
 
+Scale mode (--scale N) generates benchmark-sized datasets (10k-200k students)
+with bulk_create in batches: groups of ~30 students, one course per group,
+five groups per teacher, plus weekly sessions and lesson plans. Pass --seed to
+get the same dataset on every run. bulk_create() sends no post_save, so lesson
+plans get their first revision and search entry (and observations their search
+entry) explicitly, as rollover does.
+
 Usage:
     python manage.py seed_database [--clear]
+    python manage.py seed_database --clear --scale 50000 --seed 42
 """
 
 import random
-from datetime import date, timedelta
+import string
+import time
+from datetime import date, time as dt_time, timedelta
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils import timezone
 
 # Try to import faker
@@ -29,6 +40,118 @@ except ImportError:
     print("Warning: faker not installed. Using basic random data.")
 
 
+# =============================================
+# CONFIGURATION
+# =============================================
+
+ROOMS = ["III A", "III B", "IV A", "IV B", "V C"]
+AT_RISK_PERCENTAGE = 0.10
+
+# Scale mode layout
+SCALE_LEVELS = ["I", "II", "III", "IV", "V"]
+SCALE_SUBJECTS = ["Philosophy", "Social Studies"]
+SCALE_GROUP_SIZE = 30
+SCALE_GROUPS_PER_TEACHER = 5
+SCALE_SESSIONS_PER_COURSE = 2
+SCALE_LESSONS_PER_COURSE = 4
+SCALE_WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday"]
+LESSON_TOPICS = [
+    "The Allegory of the Cave",
+    "Socratic Dialogue",
+    "Ethics and Virtue",
+    "Human Rights",
+    "Peruvian Independence",
+    "Citizenship and Democracy",
+    "Critical Thinking",
+    "Logic and Arguments",
+]
+
+# Interests Data
+INTEREST_DATA = {
+    "music": ["Pop Music", "K-Pop", "Rock", "Latin", "EDM", "Classical"],
+    "sports": ["Soccer", "Volleyball", "Basketball", "Swimming", "Tennis"],
+    "hobbies": ["Gaming", "Reading", "Photography", "Cooking", "Dancing"],
+    "academic": ["History", "Science", "Math", "Literature"],
+    "technology": ["Coding", "Robotics", "AI", "Design"],
+    "arts": ["Painting", "Drawing", "Theater", "Cinema"],
+}
+
+# Names
+FIRST_NAMES_MALE = [
+    "Carlos",
+    "Jose",
+    "Luis",
+    "Miguel",
+    "Juan",
+    "Diego",
+    "Andres",
+    "Mateo",
+    "Daniel",
+    "Santiago",
+]
+FIRST_NAMES_FEMALE = [
+    "Maria",
+    "Ana",
+    "Rosa",
+    "Carmen",
+    "Lucia",
+    "Sofia",
+    "Camila",
+    "Valeria",
+    "Daniela",
+    "Paula",
+]
+LAST_NAMES = [
+    "Garcia",
+    "Rodriguez",
+    "Martinez",
+    "Lopez",
+    "Gonzalez",
+    "Hernandez",
+    "Perez",
+    "Sanchez",
+    "Ramirez",
+    "Torres",
+]
+
+# Grade Templates
+GRADE_TEMPLATES = {
+    "homework": [
+        "Reading Response",
+        "Chapter Summary",
+        "Vocabulary Sheet",
+        "Critical Analysis",
+    ],
+    "quiz": ["Pop Quiz", "Weekly Quiz", "Vocabulary Quiz", "Concept Check"],
+    "test": ["Unit Test", "Mid-Term Exam", "Chapter Test"],
+    "presentation": [
+        "Oral Presentation",
+        "Group Project",
+        "Debate Performance",
+    ],
+    "participation": ["Class Participation", "Discussion Contribution"],
+}
+
+# Observation Templates
+OBSERVATION_TEMPLATES = [
+    (
+        "academic",
+        "{first_name} showed excellent understanding of the material today.",
+    ),
+    (
+        "participation",
+        "{first_name} worked well with {partner} on the group activity.",
+    ),
+    ("behavior", "{first_name} needs to focus more during class discussions."),
+    (
+        "achievement",
+        "Great improvement in {first_name}'s participation this week!",
+    ),
+    ("leadership", "{first_name} took lead in the group project effectively."),
+    ("concern", "{first_name} seems distracted lately. Will monitor."),
+]
+
+
 class Command(BaseCommand):
     help = "Seed the database with realistic mock data for SilabusLMS"
 
@@ -44,6 +167,30 @@ class Command(BaseCommand):
             default=125,
             help="Number of students to create (default: 125)",
         )
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=0,
+            help="Bulk-create a benchmark dataset with this many students",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="Random seed for a deterministic dataset",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows per bulk_create batch in scale mode (default: 1000)",
+        )
+        parser.add_argument(
+            "--months",
+            type=int,
+            default=6,
+            help="Months of grade/attendance history per student (default: 6)",
+        )
 
     def handle(self, *args, **options):
         from django.contrib.auth import get_user_model
@@ -58,10 +205,18 @@ class Command(BaseCommand):
         )
         from action_center.models import ForumTopic, Message, Deadline
 
+        from events.models import Session
+        from lessons.models import LessonPlan
+
         User = get_user_model()
 
+        if options["seed"] is not None:
+            random.seed(options["seed"])
+
         if options["clear"]:
             self.stdout.write("Clearing existing data...")
+            LessonPlan.objects.all().delete()
+            Session.objects.all().delete()
             Grade.objects.all().delete()
             TeacherObservation.objects.all().delete()
             StudentNote.objects.all().delete()
@@ -95,94 +250,7 @@ class Command(BaseCommand):
         # CONFIGURATION
         # =============================================
 
-        ROOMS = ["III A", "III B", "IV A", "IV B", "V C"]
         STUDENTS_PER_ROOM = options["students"] // len(ROOMS)
-        AT_RISK_PERCENTAGE = 0.10
-
-        # Interests Data
-        INTEREST_DATA = {
-            "music": ["Pop Music", "K-Pop", "Rock", "Latin", "EDM", "Classical"],
-            "sports": ["Soccer", "Volleyball", "Basketball", "Swimming", "Tennis"],
-            "hobbies": ["Gaming", "Reading", "Photography", "Cooking", "Dancing"],
-            "academic": ["History", "Science", "Math", "Literature"],
-            "technology": ["Coding", "Robotics", "AI", "Design"],
-            "arts": ["Painting", "Drawing", "Theater", "Cinema"],
-        }
-
-        # Names
-        FIRST_NAMES_MALE = [
-            "Carlos",
-            "Jose",
-            "Luis",
-            "Miguel",
-            "Juan",
-            "Diego",
-            "Andres",
-            "Mateo",
-            "Daniel",
-            "Santiago",
-        ]
-        FIRST_NAMES_FEMALE = [
-            "Maria",
-            "Ana",
-            "Rosa",
-            "Carmen",
-            "Lucia",
-            "Sofia",
-            "Camila",
-            "Valeria",
-            "Daniela",
-            "Paula",
-        ]
-        LAST_NAMES = [
-            "Garcia",
-            "Rodriguez",
-            "Martinez",
-            "Lopez",
-            "Gonzalez",
-            "Hernandez",
-            "Perez",
-            "Sanchez",
-            "Ramirez",
-            "Torres",
-        ]
-
-        # Grade Templates
-        GRADE_TEMPLATES = {
-            "homework": [
-                "Reading Response",
-                "Chapter Summary",
-                "Vocabulary Sheet",
-                "Critical Analysis",
-            ],
-            "quiz": ["Pop Quiz", "Weekly Quiz", "Vocabulary Quiz", "Concept Check"],
-            "test": ["Unit Test", "Mid-Term Exam", "Chapter Test"],
-            "presentation": [
-                "Oral Presentation",
-                "Group Project",
-                "Debate Performance",
-            ],
-            "participation": ["Class Participation", "Discussion Contribution"],
-        }
-
-        # Observation Templates
-        OBSERVATION_TEMPLATES = [
-            (
-                "academic",
-                "{first_name} showed excellent understanding of the material today.",
-            ),
-            (
-                "participation",
-                "{first_name} worked well with {partner} on the group activity.",
-            ),
-            ("behavior", "{first_name} needs to focus more during class discussions."),
-            (
-                "achievement",
-                "Great improvement in {first_name}'s participation this week!",
-            ),
-            ("leadership", "{first_name} took lead in the group project effectively."),
-            ("concern", "{first_name} seems distracted lately. Will monitor."),
-        ]
 
         # =============================================
         # 1. CREATE INTERESTS
@@ -197,6 +265,10 @@ class Command(BaseCommand):
                 all_interests.append(interest)
         self.stdout.write(self.style.SUCCESS(f"Created {len(all_interests)} interests"))
 
+        if options["scale"]:
+            self.seed_at_scale(teacher, all_interests, options)
+            return
+
         # =============================================
         # 2. CREATE GROUPS & COURSES
         # =============================================
@@ -301,12 +373,12 @@ class Command(BaseCommand):
 
         # Assign Peer Tutors (randomly assign some older students as tutors to younger ones)
         # For simplicity, just assign random other students
-        for student in all_students:
-            if random.random() < 0.2:  # 20% have a peer tutor
-                potential_tutors = [s for s in all_students if s != student]
-                if potential_tutors:
-                    student.tutor = random.choice(potential_tutors)
-                    student.save()
+        for idx, student in enumerate(all_students):
+            if random.random() < 0.2 and len(all_students) > 1:  # 20% have a peer tutor
+                # Pick any other student by index offset (O(1), never self)
+                offset = random.randint(1, len(all_students) - 1)
+                student.tutor = all_students[(idx + offset) % len(all_students)]
+                student.save(update_fields=["tutor"])
 
         self.stdout.write(self.style.SUCCESS(f"Created {len(all_students)} students"))
 
@@ -327,7 +399,7 @@ class Command(BaseCommand):
             # Filter students in this course's room
             course_students = [s for s in all_students if s.group.name == course.room]
 
-            for student in course_students:
+            for student_idx, student in enumerate(course_students):
                 CourseStudent.objects.get_or_create(course=course, student=student)
 
                 is_at_risk = student.id in at_risk_ids
@@ -403,9 +475,10 @@ class Command(BaseCommand):
                 # Generate 1-3 observations total per student
                 for _ in range(random.randint(1, 3)):
                     obs_type, template = random.choice(OBSERVATION_TEMPLATES)
-                    partner = random.choice(
-                        [s for s in course_students if s != student]
-                    )
+                    offset = random.randint(1, max(len(course_students) - 1, 1))
+                    partner = course_students[
+                        (student_idx + offset) % len(course_students)
+                    ]
 
                     text = template.format(
                         first_name=student.first_name, partner=partner.first_name
@@ -447,3 +520,403 @@ class Command(BaseCommand):
         self.stdout.write(f"Grades: {grades_count}")
         self.stdout.write(f"Attendance Records: {att_count}")
         self.stdout.write(f"Observations: {obs_count}")
+
+    # =============================================
+    # SCALE MODE (bulk_create)
+    # =============================================
+
+    def seed_at_scale(self, teacher, all_interests, options):
+        """
+        Generate a benchmark-sized dataset with bulk_create.
+
+        Students are generated group by group and flushed in batches of
+        --batch-size, so memory stays bounded and every table is written
+        with a handful of multi-row INSERTs per batch.
+        """
+        from django.contrib.auth import get_user_model
+        from django.contrib.auth.hashers import make_password
+        from dashboard.models import Group, Course
+        from events.models import Session
+        from lessons.models import LessonPlan
+
+        User = get_user_model()
+
+        rng = random.Random(options["seed"])
+        total_students = options["scale"]
+        batch_size = options["batch_size"]
+        started = time.monotonic()
+
+        num_groups = -(-total_students // SCALE_GROUP_SIZE)
+        num_teachers = -(-num_groups // SCALE_GROUPS_PER_TEACHER)
+
+        with transaction.atomic():
+            # --- Teachers (one password hash shared by all seeded accounts) ---
+            self.stdout.write(f"Creating {num_teachers} teachers...")
+            password = make_password("silabus2026")
+            extra_emails = [f"teacher{n}@silabus.edu" for n in range(1, num_teachers)]
+            User.objects.bulk_create(
+                [
+                    User(
+                        email=email,
+                        first_name=rng.choice(FIRST_NAMES_FEMALE + FIRST_NAMES_MALE),
+                        last_name=rng.choice(LAST_NAMES),
+                        role="teacher",
+                        position=rng.choice(SCALE_SUBJECTS) + " Teacher",
+                        password=password,
+                    )
+                    for email in extra_emails
+                ],
+                batch_size=batch_size,
+                ignore_conflicts=True,
+            )
+            teachers_by_email = User.objects.in_bulk(extra_emails, field_name="email")
+            teachers = [teacher] + [teachers_by_email[email] for email in extra_emails]
+
+            # --- Groups ---
+            self.stdout.write(f"Creating {num_groups} groups...")
+            group_names = [self._scale_group_name(i) for i in range(num_groups)]
+            Group.objects.bulk_create(
+                [
+                    Group(name=name, level="High School")
+                    for name in group_names
+                ],
+                batch_size=batch_size,
+                ignore_conflicts=True,
+            )
+            groups_by_name = Group.objects.in_bulk(group_names, field_name="name")
+            groups = [groups_by_name[name] for name in group_names]
+
+            # --- Courses (one per group, enrollment codes pre-generated) ---
+            self.stdout.write(f"Creating {num_groups} courses...")
+            codes = Course.generate_enrollment_codes(num_groups, rng=rng)
+            course_objs = []
+            for idx, group in enumerate(groups):
+                subject = SCALE_SUBJECTS[idx % len(SCALE_SUBJECTS)]
+                course_objs.append(
+                    Course(
+                        name=subject,
+                        abbreviation=subject[:4].upper(),
+                        color=rng.choice(["#4A8B6F", "#2C5545", "#C17F59", "#5B7DB1"]),
+                        section_group=group.name,
+                        room=group.name,
+                        start_date=date(2025, 8, 1),
+                        enrollment_code=codes[idx],
+                        teacher=teachers[idx // SCALE_GROUPS_PER_TEACHER],
+                    )
+                )
+            Course.objects.bulk_create(course_objs, batch_size=batch_size)
+            courses_by_code = Course.objects.in_bulk(codes, field_name="enrollment_code")
+            courses = [courses_by_code[code] for code in codes]
+
+            # --- Weekly sessions & lesson plans ---
+            sessions = []
+            lesson_plans = []
+            today = date.today()
+            for course in courses:
+                for day in rng.sample(SCALE_WEEKDAYS, SCALE_SESSIONS_PER_COURSE):
+                    hour = rng.randint(8, 14)
+                    sessions.append(
+                        Session(
+                            course=course,
+                            day_of_week=day,
+                            start_time=dt_time(hour, 0),
+                            end_time=dt_time(hour + 1, 30),
+                            room=course.room,
+                        )
+                    )
+                for n in range(SCALE_LESSONS_PER_COURSE):
+                    topic = rng.choice(LESSON_TOPICS)
+                    lesson_plans.append(
+                        LessonPlan(
+                            title=f"{topic} ({n + 1})",
+                            course=course,
+                            lesson_date=today - timedelta(days=rng.randint(0, 150)),
+                            objectives=f"Students will be able to discuss {topic}.",
+                            content=f"Introduction, group work and debate on {topic}.",
+                            materials="Textbook, worksheet, projector",
+                            status=rng.choice(["draft", "published", "completed"]),
+                        )
+                    )
+            Session.objects.bulk_create(sessions, batch_size=batch_size)
+            LessonPlan.objects.bulk_create(lesson_plans, batch_size=batch_size)
+            self._after_lesson_plans_created(
+                [course.pk for course in courses], batch_size
+            )
+
+            # --- Students & history, flushed in batches ---
+            self.stdout.write(f"Creating {total_students} students with history...")
+            counts = {
+                "students": 0,
+                "grades": 0,
+                "attendance": 0,
+                "observations": 0,
+            }
+            buffer = self._empty_scale_buffer()
+            email_offset = self._next_student_number()
+
+            for idx, group in enumerate(groups):
+                remaining = total_students - idx * SCALE_GROUP_SIZE
+                self._generate_scale_group(
+                    rng,
+                    buffer,
+                    group,
+                    courses[idx],
+                    teacher=courses[idx].teacher,
+                    size=min(SCALE_GROUP_SIZE, remaining),
+                    interests=all_interests,
+                    first_number=email_offset + idx * SCALE_GROUP_SIZE,
+                    months=options["months"],
+                )
+                if len(buffer["students"]) >= batch_size:
+                    self._flush_scale_buffer(buffer, counts, batch_size)
+                    buffer = self._empty_scale_buffer()
+                    self.stdout.write(
+                        f"  {counts['students']}/{total_students} students "
+                        f"({time.monotonic() - started:.1f}s)"
+                    )
+            self._flush_scale_buffer(buffer, counts, batch_size)
+
+        elapsed = time.monotonic() - started
+        self.stdout.write("=" * 50)
+        self.stdout.write(f"SCALE SEEDING COMPLETE in {elapsed:.1f}s")
+        self.stdout.write("=" * 50)
+        self.stdout.write(f"Teachers: {len(teachers)}")
+        self.stdout.write(f"Groups/Courses: {len(groups)}")
+        self.stdout.write(f"Students: {counts['students']}")
+        self.stdout.write(f"Grades: {counts['grades']}")
+        self.stdout.write(f"Attendance Records: {counts['attendance']}")
+        self.stdout.write(f"Observations: {counts['observations']}")
+
+    @staticmethod
+    def _after_lesson_plans_created(course_ids, batch_size):
+        """Initial revisions and search entries for bulk-created plans."""
+        from lessons.models import LessonPlan
+        from lessons.revisions import record_initial_revisions
+        from search.documents import index_objects
+        from search.models import SearchEntry
+
+        for start in range(0, len(course_ids), batch_size):
+            plans = list(
+                LessonPlan.objects.filter(
+                    course_id__in=course_ids[start : start + batch_size]
+                )
+            )
+            record_initial_revisions(plans)
+            index_objects(SearchEntry.KIND_LESSON_PLAN, [plan.pk for plan in plans])
+
+    @staticmethod
+    def _scale_group_name(index):
+        """Return 'I A', 'II A', ... 'V Z', then 'I A2', ... for group `index`."""
+        level = SCALE_LEVELS[index % len(SCALE_LEVELS)]
+        section = index // len(SCALE_LEVELS)
+        letter = string.ascii_uppercase[section % 26]
+        suffix = str(section // 26 + 1) if section >= 26 else ""
+        return f"{level} {letter}{suffix}"
+
+    @staticmethod
+    def _next_student_number():
+        """Offset for generated emails so re-runs without --clear don't collide."""
+        from students.models import Student
+
+        return Student.objects.count()
+
+    @staticmethod
+    def _empty_scale_buffer():
+        return {
+            "students": [],
+            "interests": [],
+            "tutors": [],
+            "enrollments": [],
+            "attendance": [],
+            "grades": [],
+            "observations": [],
+            "notes": [],
+        }
+
+    def _generate_scale_group(
+        self, rng, buffer, group, course, teacher, size, interests, first_number, months
+    ):
+        """Build unsaved rows for one group of students into `buffer`."""
+        from dashboard.models import CourseStudent
+        from students.models import (
+            Student,
+            StudentNote,
+            Grade,
+            AttendanceRecord,
+            TeacherObservation,
+        )
+
+        today = date.today()
+        start_date = today - timedelta(days=30 * months)
+        members = []
+
+        for n in range(size):
+            is_female = rng.random() > 0.5
+            first_name = rng.choice(FIRST_NAMES_FEMALE if is_female else FIRST_NAMES_MALE)
+            last_name = rng.choice(LAST_NAMES)
+            age = rng.randint(13, 18)
+            student = Student(
+                first_name=first_name,
+                last_name=last_name,
+                email=(
+                    f"{first_name.lower()}.{last_name.lower()}"
+                    f"{first_number + n}@silabus.edu"
+                ),
+                group=group,
+                birthday=date(2026 - age, rng.randint(1, 12), rng.randint(1, 28)),
+                teacher_tutor=teacher,
+            )
+            is_at_risk = rng.random() < AT_RISK_PERCENTAGE
+
+            student_interests = rng.sample(interests, rng.randint(2, 5))
+            interests_dict = {}
+            for intr in student_interests:
+                interests_dict.setdefault(intr.category, []).append(intr.name)
+                buffer["interests"].append((student, intr))
+            student.interests_json = interests_dict
+
+            buffer["enrollments"].append(CourseStudent(course=course, student=student))
+
+            # Monthly attendance
+            percentages = []
+            curr = start_date.replace(day=1)
+            while curr <= today:
+                pct = rng.uniform(60, 85) if is_at_risk else rng.uniform(85, 100)
+                percentages.append(pct)
+                buffer["attendance"].append(
+                    AttendanceRecord(
+                        student=student,
+                        course=course,
+                        month=curr,
+                        attendance_percentage=pct,
+                        classes_attended=int(20 * (pct / 100)),
+                        classes_total=20,
+                    )
+                )
+                if curr.month == 12:
+                    curr = curr.replace(year=curr.year + 1, month=1)
+                else:
+                    curr = curr.replace(month=curr.month + 1)
+
+            # Grades: 30% chance on any given 3-day step
+            scores = []
+            curr_date = start_date
+            while curr_date <= today:
+                if rng.random() < 0.3:
+                    g_type = rng.choice(list(GRADE_TEMPLATES.keys()))
+                    if is_at_risk:
+                        score = rng.choice(
+                            [rng.uniform(5, 10), rng.uniform(11, 13), rng.uniform(14, 15)]
+                        )
+                    else:
+                        score = rng.choice(
+                            [rng.uniform(14, 17), rng.uniform(18, 20), rng.uniform(11, 13)]
+                        )
+                    scores.append(score)
+                    buffer["grades"].append(
+                        Grade(
+                            student=student,
+                            course=course,
+                            grade_type=g_type,
+                            title=rng.choice(GRADE_TEMPLATES[g_type]),
+                            numeric_score=score,
+                            date_recorded=curr_date,
+                        )
+                    )
+                curr_date += timedelta(days=3)
+
+            # Aggregates are known up front, so no update pass is needed
+            student.attendance_rate = (
+                sum(percentages) / len(percentages) if percentages else 100.0
+            )
+            student.average_grade = sum(scores) / len(scores) if scores else 0.0
+            members.append(student)
+
+        # Observations and peer tutors need the whole group
+        for idx, student in enumerate(members):
+            for _ in range(rng.randint(1, 3)):
+                obs_type, template = rng.choice(OBSERVATION_TEMPLATES)
+                partner = members[(idx + rng.randint(1, max(size - 1, 1))) % size]
+                text = template.format(
+                    first_name=student.first_name, partner=partner.first_name
+                )
+                buffer["observations"].append(
+                    TeacherObservation(
+                        student=student,
+                        teacher=teacher,
+                        observation_type=obs_type,
+                        text=text,
+                        course=course,
+                    )
+                )
+                buffer["notes"].append(
+                    StudentNote(student=student, teacher=teacher, text=text)
+                )
+            if size > 1 and rng.random() < 0.2:
+                tutor = members[(idx + rng.randint(1, size - 1)) % size]
+                buffer["tutors"].append((student, tutor))
+
+        buffer["students"].extend(members)
+
+    def _flush_scale_buffer(self, buffer, counts, batch_size):
+        """Write one buffer of generated rows with bulk_create."""
+        from dashboard.models import CourseStudent
+        from search.documents import index_objects
+        from search.models import SearchEntry
+        from students.models import (
+            Student,
+            StudentNote,
+            Grade,
+            AttendanceRecord,
+            TeacherObservation,
+        )
+
+        students = buffer["students"]
+        if not students:
+            return
+
+        Student.objects.bulk_create(students, batch_size=batch_size)
+        if students[0].pk is None:
+            # Backends that can't return ids from bulk inserts (MySQL)
+            ids = dict(
+                Student.objects.filter(
+                    email__in=[s.email for s in students]
+                ).values_list("email", "id")
+            )
+            for student in students:
+                student.pk = ids[student.email]
+
+        for student, tutor in buffer["tutors"]:
+            student.tutor = tutor
+        Student.objects.bulk_update(
+            [student for student, _ in buffer["tutors"]],
+            ["tutor"],
+            batch_size=batch_size,
+        )
+
+        Through = Student.interests.through
+        Through.objects.bulk_create(
+            [
+                Through(student_id=student.pk, interest_id=interest.pk)
+                for student, interest in buffer["interests"]
+            ],
+            batch_size=batch_size,
+        )
+        CourseStudent.objects.bulk_create(buffer["enrollments"], batch_size=batch_size)
+        AttendanceRecord.objects.bulk_create(buffer["attendance"], batch_size=batch_size)
+        Grade.objects.bulk_create(buffer["grades"], batch_size=batch_size)
+        TeacherObservation.objects.bulk_create(
+            buffer["observations"], batch_size=batch_size
+        )
+        StudentNote.objects.bulk_create(buffer["notes"], batch_size=batch_size)
+        index_objects(
+            SearchEntry.KIND_OBSERVATION,
+            TeacherObservation.objects.filter(
+                student_id__in=[student.pk for student in students]
+            ).values_list("pk", flat=True),
+        )
+
+        counts["students"] += len(students)
+        counts["grades"] += len(buffer["grades"])
+        counts["attendance"] += len(buffer["attendance"])
+        counts["observations"] += len(buffer["observations"])
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from core.db import sync_sqlite_replica
+
+
+class Command(BaseCommand):
+    help = "Copy the default SQLite database onto the local replica alias"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--replica",
+            default=None,
+            help="Replica alias (default: settings.REPLICA_DATABASE_ALIAS)",
+        )
+
+    def handle(self, *args, **options):
+        sync_sqlite_replica(replica=options["replica"])
+        self.stdout.write(self.style.SUCCESS("Replica synced from default"))
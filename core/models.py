@@ -81,6 +81,11 @@ class User(AbstractUser):
         """Return the user's full name."""
         return f"{self.first_name} {self.last_name}"
 
+    @property
+    def is_school_admin(self):
+        """Staff and administrators, who may act on any course or student."""
+        return self.is_superuser or self.is_staff or self.role == "admin"
+
     def to_dict(self):
         """Return a dictionary representation of the user."""
         return {
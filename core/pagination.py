@@ -0,0 +1,102 @@
+"""
+Keyset (seek) pagination helpers.
+
+OFFSET pagination gets slower the deeper you page because the database
+still walks every skipped row. Keyset pagination remembers the sort key of
+the last row served and asks for rows strictly after it, so every page is
+an index range scan of `limit` rows no matter how far in it is.
+
+Cursors are opaque URL-safe strings wrapping the last row's sort values.
+"""
+
+import base64
+import heapq
+import json
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(values):
+    raw = json.dumps([str(value) for value in values]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor, model, fields):
+    """Parse a cursor back into typed values for `fields` of `model`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw, list) or len(raw) != len(fields):
+            raise InvalidCursor("Cursor does not match the ordering")
+        return [
+            model._meta.get_field(name).to_python(value)
+            for name, value in zip(fields, raw)
+        ]
+    except (ValueError, TypeError, ValidationError) as exc:
+        raise InvalidCursor("Invalid cursor") from exc
+
+
+def _after(fields, values, descending):
+    """(f1, f2, ...) strictly after (v1, v2, ...) in the given direction."""
+    lookup = "lt" if descending else "gt"
+    condition = Q()
+    for index, name in enumerate(fields):
+        equal = {field: value for field, value in zip(fields[:index], values)}
+        condition |= Q(**equal, **{f"{name}__{lookup}": values[index]})
+    return condition
+
+
+def keyset_page(queryset, fields, cursor=None, limit=20, descending=True):
+    """
+    Return (rows, next_cursor) for `queryset` ordered by `fields`, e.g.
+    ("created_at", "id"). The last field must be unique (normally the pk)
+    and there should be an index matching the ordering. next_cursor is None
+    on the last page. Raises InvalidCursor for tampered cursors.
+
+    `queryset` may also be a list of disjoint querysets on the same model
+    (e.g. the two directions of a message thread); each is paged on its own
+    index and the pages are merged, which avoids an OR that the database
+    would have to sort in full.
+    """
+    fields = tuple(fields)
+    querysets = list(queryset) if isinstance(queryset, (list, tuple)) else [queryset]
+    prefix = "-" if descending else ""
+    if cursor:
+        values = decode_cursor(cursor, querysets[0].model, fields)
+        after = _after(fields, values, descending)
+        querysets = [qs.filter(after) for qs in querysets]
+
+    streams = [
+        list(qs.order_by(*(prefix + name for name in fields))[: limit + 1])
+        for qs in querysets
+    ]
+    if len(streams) == 1:
+        rows = streams[0]
+    else:
+        merged = heapq.merge(
+            *streams,
+            key=lambda row: tuple(_raw(row, name) for name in fields),
+            reverse=descending,
+        )
+        rows = list(islice(merged, limit + 1))
+
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor([_value(last, name) for name in fields])
+
+
+def _raw(row, name):
+    return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+def _value(row, name):
+    value = _raw(row, name)
+    return value.isoformat() if hasattr(value, "isoformat") else value
@@ -1,3 +1,109 @@
-from django.test import TestCase
+import tempfile
+from pathlib import Path
 
-# Create your tests here.
+from django.conf import settings
+from django.db import connections, router
+from django.test import TransactionTestCase, override_settings
+
+from cadmus.routers import read_from_replica, request_scope, use_replica
+from core.db import sync_sqlite_replica
+from dashboard.models import Group
+
+TEST_REPLICA_ALIAS = "test_replica"
+
+
+class SQLiteReplicaTestCase(TransactionTestCase):
+    """
+    Fixture with a real second SQLite file as the replica: the alias is
+    registered for the class, copied from the test database before each
+    test, and only catches up again when the test calls sync_replica(), so
+    replication lag is observable. Each test runs in a fresh request scope
+    (unpinned).
+
+    The alias is added after the runner has set up its databases, so it is
+    neither created nor flushed by it: every sync replaces its contents.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._replica_dir = tempfile.TemporaryDirectory()
+        replica_settings = {
+            **connections["default"].settings_dict,
+            "NAME": str(Path(cls._replica_dir.name) / "replica.sqlite3"),
+            "TEST": {"NAME": None, "MIRROR": None},
+        }
+        connections.settings[TEST_REPLICA_ALIAS] = replica_settings
+        cls._settings_override = override_settings(
+            DATABASES={**settings.DATABASES, TEST_REPLICA_ALIAS: replica_settings},
+            REPLICA_DATABASE_ALIAS=TEST_REPLICA_ALIAS,
+        )
+        cls._settings_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._settings_override.disable()
+        connections[TEST_REPLICA_ALIAS].close()
+        del connections[TEST_REPLICA_ALIAS]
+        del connections.settings[TEST_REPLICA_ALIAS]
+        cls._replica_dir.cleanup()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        self.sync_replica()
+        self.enterContext(request_scope())
+
+    def sync_replica(self):
+        sync_sqlite_replica(replica=TEST_REPLICA_ALIAS)
+
+
+class ReplicaRouterTests(SQLiteReplicaTestCase):
+    def _write_on_primary(self, name):
+        # .using() bypasses the router, so this write does not pin
+        return Group.objects.using("default").create(name=name)
+
+    def test_reads_stay_on_primary_unless_requested(self):
+        self._write_on_primary("IV A")
+        self.assertEqual(router.db_for_read(Group), "default")
+        self.assertTrue(Group.objects.filter(name="IV A").exists())
+
+    def test_requested_reads_go_to_replica(self):
+        self._write_on_primary("IV A")
+        with read_from_replica():
+            self.assertEqual(router.db_for_read(Group), TEST_REPLICA_ALIAS)
+            self.assertFalse(Group.objects.filter(name="IV A").exists())
+
+        self.sync_replica()
+        with read_from_replica():
+            self.assertTrue(Group.objects.filter(name="IV A").exists())
+
+    def test_write_pins_later_reads_to_primary(self):
+        with read_from_replica():
+            Group.objects.create(name="IV B")
+            self.assertEqual(router.db_for_read(Group), "default")
+            self.assertTrue(Group.objects.filter(name="IV B").exists())
+
+    def test_request_scope_resets_pinning(self):
+        with read_from_replica():
+            Group.objects.create(name="IV B")
+        with request_scope(), read_from_replica():
+            self.assertEqual(router.db_for_read(Group), TEST_REPLICA_ALIAS)
+            self.assertFalse(Group.objects.filter(name="IV B").exists())
+
+    def test_use_replica_decorator(self):
+        @use_replica
+        def view():
+            return Group.objects.all().db
+
+        self.assertEqual(view(), TEST_REPLICA_ALIAS)
+        self.assertEqual(Group.objects.all().db, "default")
+
+    def test_replica_is_never_migrated(self):
+        self.assertFalse(router.allow_migrate(TEST_REPLICA_ALIAS, "dashboard"))
+        self.assertTrue(router.allow_migrate("default", "dashboard"))
+
+    def test_no_replica_configured(self):
+        with override_settings(REPLICA_DATABASE_ALIAS="missing"):
+            with read_from_replica():
+                self.assertEqual(router.db_for_read(Group), "default")
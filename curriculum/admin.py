@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import CurriculumNode
+
+
+@admin.register(CurriculumNode)
+class CurriculumNodeAdmin(admin.ModelAdmin):
+    list_display = ("code", "framework", "level_name", "category", "is_active")
+    list_filter = ("framework", "level_name", "is_active")
+    search_fields = ("code", "description")
+    raw_id_fields = ("parent",)
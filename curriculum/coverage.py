@@ -0,0 +1,254 @@
+"""
+Curriculum coverage per course, as bitsets.
+
+Every active node of a framework gets a bit position. A course's coverage
+for a term is a Python int with a bit set for each node its lesson plans
+(dated inside the term) are linked to, rolled up the tree: linking a
+capacidad also marks its competencia as touched. A node is *complete* for
+a course when every leaf below it is covered.
+
+Roll-up and completeness use masks precomputed from CurriculumClosure in
+one query, so per course the work is a few ORs and ANDs; school-wide
+figures (union, intersection, gaps, courses per node) are bitwise folds
+over the course rows.
+
+The school-wide result is cached per (framework, term) and invalidated by
+bumping a version key whenever links, plans, courses or nodes change
+(curriculum.signals; the bulk writes of imports and term rollovers call
+invalidate_coverage() themselves). Views cut the cached rows down to the courses a
+user may see and recompute the aggregates from those bitsets.
+"""
+
+import time
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import cache
+
+from dashboard.models import Course
+from lessons.models import LessonPlan
+
+from .models import CurriculumClosure, CurriculumNode
+
+DEFAULT_FRAMEWORK = "Minedu"
+VERSION_KEY = "curriculum:coverage:version"
+
+# Heatmap cell values
+NOT_COVERED, TOUCHED, COMPLETE = 0, 1, 2
+
+
+def term_bounds(year):
+    """The school term as (first day, last day); terms are calendar years."""
+    return date(year, 1, 1), date(year, 12, 31)
+
+
+def coverage_version():
+    return cache.get_or_set(VERSION_KEY, time.time_ns, None)
+
+
+def invalidate_coverage():
+    """Make every cached coverage result stale."""
+    cache.set(VERSION_KEY, time.time_ns(), None)
+
+
+def _bits(mask):
+    """Positions of the set bits of `mask`, lowest first."""
+    positions = []
+    while mask:
+        low = mask & -mask
+        positions.append(low.bit_length() - 1)
+        mask ^= low
+    return positions
+
+
+class CoverageIndex:
+    """Bit positions and roll-up masks for one framework's active nodes."""
+
+    def __init__(self, framework):
+        self.nodes = list(
+            CurriculumNode.objects.filter(framework=framework, is_active=True)
+            .order_by("depth", "code")
+            .only(
+                "id", "code", "category", "level_name", "description", "parent", "depth"
+            )
+        )
+        self.position = {node.pk: index for index, node in enumerate(self.nodes)}
+        self.all = (1 << len(self.nodes)) - 1
+
+        # up[i]: node i and its ancestors; down[i]: node i and its descendants
+        self.up = [1 << index for index in range(len(self.nodes))]
+        self.down = list(self.up)
+        pairs = CurriculumClosure.objects.filter(
+            descendant__framework=framework, depth__gt=0
+        ).values_list("ancestor_id", "descendant_id")
+        for ancestor_id, descendant_id in pairs:
+            ancestor = self.position.get(ancestor_id)
+            descendant = self.position.get(descendant_id)
+            if ancestor is None or descendant is None:
+                continue
+            self.up[descendant] |= 1 << ancestor
+            self.down[ancestor] |= 1 << descendant
+
+        self.leaves = 0
+        for index, mask in enumerate(self.down):
+            if mask == 1 << index:
+                self.leaves |= mask
+        # Leaves each node needs covered to count as complete
+        self.leaves_below = [mask & self.leaves for mask in self.down]
+
+    def rolled_up(self, node_ids):
+        """Coverage bitset for directly linked nodes, ancestors included."""
+        mask = 0
+        for node_id in node_ids:
+            index = self.position.get(node_id)
+            if index is not None:
+                mask |= self.up[index]
+        return mask
+
+    def complete(self, covered):
+        """Nodes of `covered` whose every leaf is covered too."""
+        mask = 0
+        for index in _bits(covered):
+            needed = self.leaves_below[index]
+            if covered & needed == needed:
+                mask |= 1 << index
+        return mask
+
+
+def compute_coverage(framework, year):
+    """
+    Coverage of every course with lesson plans in the term, uncached.
+    Bitsets are ints; see coverage_payload() for the JSON form.
+    """
+    index = CoverageIndex(framework)
+    start, end = term_bounds(year)
+    links = (
+        LessonPlan.curriculum_nodes.through.objects.filter(
+            lessonplan__lesson_date__range=(start, end),
+            curriculumnode__framework=framework,
+            curriculumnode__is_active=True,
+        )
+        .values_list("lessonplan__course_id", "curriculumnode_id")
+        .distinct()
+    )
+    linked = {}
+    for course_id, node_id in links:
+        linked.setdefault(course_id, set()).add(node_id)
+
+    planned = set(
+        LessonPlan.objects.filter(lesson_date__range=(start, end))
+        .values_list("course_id", flat=True)
+        .distinct()
+    )
+    courses = Course.objects.filter(pk__in=planned | set(linked)).order_by(
+        "grade_level", "name", "section_group", "id"
+    )
+    rows = []
+    for course in courses.only(
+        "id", "name", "section_group", "grade_level", "teacher_id"
+    ):
+        covered = index.rolled_up(linked.get(course.pk, ()))
+        rows.append(
+            {
+                "id": course.pk,
+                "name": course.name,
+                "section_group": course.section_group,
+                "grade_level": course.grade_level,
+                "teacher_id": course.teacher_id,
+                "covered": covered,
+                "complete": index.complete(covered),
+            }
+        )
+
+    return {
+        "framework": framework,
+        "year": year,
+        "nodes": [
+            {
+                "id": node.pk,
+                "code": node.code,
+                "category": node.category,
+                "level_name": node.level_name,
+                "description": node.description,
+                "parent_id": node.parent_id,
+                "depth": node.depth,
+            }
+            for node in index.nodes
+        ],
+        "all": index.all,
+        "leaves": index.leaves,
+        "courses": rows,
+    }
+
+
+def get_coverage(framework, year):
+    """compute_coverage() through the cache."""
+    key = f"curriculum:coverage:{coverage_version()}:{framework}:{year}"
+    return cache.get_or_set(
+        key,
+        lambda: compute_coverage(framework, year),
+        getattr(settings, "CURRICULUM_COVERAGE_TTL", 600),
+    )
+
+
+def coverage_payload(coverage, course_ids=None):
+    """
+    JSON-ready coverage limited to `course_ids` (None = all): per course a
+    heatmap row (0 not covered, 1 touched, 2 complete) plus its bitsets as
+    hex, and school-wide union, intersection, gaps and courses per node.
+    """
+    nodes = coverage["nodes"]
+    rows = [
+        row
+        for row in coverage["courses"]
+        if course_ids is None or row["id"] in course_ids
+    ]
+
+    union = 0
+    common = coverage["all"] if rows else 0
+    leaves = coverage["leaves"]
+    covered_by = [0] * len(nodes)
+    courses = []
+    for row in rows:
+        covered, complete = row["covered"], row["complete"]
+        union |= covered
+        common &= covered
+        for position in _bits(covered):
+            covered_by[position] += 1
+        courses.append(
+            {
+                "id": row["id"],
+                "name": row["name"],
+                "section_group": row["section_group"],
+                "grade_level": row["grade_level"],
+                "covered": format(covered, "x"),
+                "complete": format(complete, "x"),
+                "leaf_ratio": (
+                    round((covered & leaves).bit_count() / leaves.bit_count(), 3)
+                    if leaves
+                    else 0
+                ),
+                "cells": [
+                    (
+                        COMPLETE
+                        if complete >> position & 1
+                        else TOUCHED if covered >> position & 1 else NOT_COVERED
+                    )
+                    for position in range(len(nodes))
+                ],
+            }
+        )
+
+    gaps = leaves & ~union
+    return {
+        "framework": coverage["framework"],
+        "year": coverage["year"],
+        "nodes": nodes,
+        "courses": courses,
+        "school": {
+            "covered": format(union, "x"),
+            "common": format(common, "x"),
+            "covered_by": covered_by,
+            "gaps": [nodes[position]["code"] for position in _bits(gaps)],
+        },
+    }
@@ -0,0 +1,207 @@
+"""
+Curriculum framework CSV import.
+
+Expected columns (as in minedu_curriculum_general_overview.csv):
+    Framework, Category, Parent_ID, Level_Name, Description, Code
+Parent_ID is the parent's Code, or NULL/empty for a root.
+
+Imports are idempotent and diff by (Framework, Code): new codes are
+bulk-inserted, changed rows bulk-updated, codes no longer in the file are
+retired (is_active=False) and nothing is written for unchanged rows. The
+closure table is recomputed in memory for each framework and only the
+missing or stale (ancestor, descendant, depth) rows are written. All of it
+runs in one transaction.
+"""
+
+import csv
+
+from django.db import transaction
+
+from .models import CurriculumClosure, CurriculumNode
+
+NULL_PARENTS = {"", "NULL", "None"}
+UPDATE_FIELDS = ("category", "level_name", "description", "depth", "is_active")
+BULK_BATCH_SIZE = 500
+
+
+class CurriculumImportError(ValueError):
+    pass
+
+
+def read_rows(file):
+    """Parse a framework CSV (open text file) into row dicts."""
+    rows = []
+    reader = csv.DictReader(file)
+    for line, row in enumerate(reader, start=2):
+        try:
+            framework = row["Framework"].strip()
+            code = row["Code"].strip()
+            parent = (row["Parent_ID"] or "").strip()
+            item = {
+                "framework": framework,
+                "code": code,
+                "parent_code": None if parent in NULL_PARENTS else parent,
+                "category": (row["Category"] or "").strip(),
+                "level_name": (row["Level_Name"] or "").strip(),
+                "description": (row["Description"] or "").strip(),
+            }
+        except (KeyError, AttributeError):
+            raise CurriculumImportError(f"Line {line}: missing columns")
+        if not framework or not code:
+            raise CurriculumImportError(
+                f"Line {line}: Framework and Code are required"
+            )
+        rows.append(item)
+    return rows
+
+
+def _depths(rows):
+    """{code: depth} for one framework; rejects unknown parents and cycles."""
+    parents = {row["code"]: row["parent_code"] for row in rows}
+    depths = {}
+    for code in parents:
+        chain = []
+        current = code
+        while current is not None and current not in depths:
+            if current in chain:
+                raise CurriculumImportError(f"Cycle through {current}")
+            if current not in parents:
+                raise CurriculumImportError(f"{chain[-1]}: unknown parent {current}")
+            chain.append(current)
+            current = parents[current]
+        depth = depths[current] + 1 if current is not None else 0
+        for node in reversed(chain):
+            depths[node] = depth
+            depth += 1
+    return depths
+
+
+@transaction.atomic
+def import_rows(rows, retire_missing=True):
+    """
+    Apply parsed rows. Returns {"created", "updated", "retired",
+    "closure_added", "closure_removed"} counts.
+    """
+    stats = dict.fromkeys(
+        ("created", "updated", "retired", "closure_added", "closure_removed"), 0
+    )
+    by_framework = {}
+    for row in rows:
+        by_framework.setdefault(row["framework"], {})[row["code"]] = row
+
+    for framework, framework_rows in by_framework.items():
+        depths = _depths(list(framework_rows.values()))
+        existing = {
+            node.code: node
+            for node in CurriculumNode.objects.filter(framework=framework)
+        }
+
+        new_nodes, changed = [], []
+        for code, row in framework_rows.items():
+            values = {
+                "category": row["category"],
+                "level_name": row["level_name"],
+                "description": row["description"],
+                "depth": depths[code],
+                "is_active": True,
+            }
+            node = existing.get(code)
+            if node is None:
+                new_nodes.append(
+                    CurriculumNode(framework=framework, code=code, **values)
+                )
+            elif any(getattr(node, field) != value for field, value in values.items()):
+                for field, value in values.items():
+                    setattr(node, field, value)
+                changed.append(node)
+        # Parents are linked in a second pass: bulk_create does not return
+        # primary keys on MySQL, so new rows are re-read by code first
+        CurriculumNode.objects.bulk_create(new_nodes, batch_size=BULK_BATCH_SIZE)
+        CurriculumNode.objects.bulk_update(
+            changed, UPDATE_FIELDS, batch_size=BULK_BATCH_SIZE
+        )
+        stats["created"] += len(new_nodes)
+        updated = {node.code for node in changed}
+
+        nodes = {
+            node.code: node
+            for node in CurriculumNode.objects.filter(framework=framework)
+        }
+        reparented = []
+        for code, row in framework_rows.items():
+            node = nodes[code]
+            parent_id = nodes[row["parent_code"]].pk if row["parent_code"] else None
+            if node.parent_id != parent_id:
+                node.parent_id = parent_id
+                reparented.append(node)
+        CurriculumNode.objects.bulk_update(
+            reparented, ["parent"], batch_size=BULK_BATCH_SIZE
+        )
+        updated |= {node.code for node in reparented if node.code in existing}
+        stats["updated"] += len(updated)
+
+        if retire_missing:
+            stats["retired"] += (
+                CurriculumNode.objects.filter(framework=framework, is_active=True)
+                .exclude(code__in=list(framework_rows))
+                .update(is_active=False)
+            )
+
+        added, removed = sync_closure(framework)
+        stats["closure_added"] += added
+        stats["closure_removed"] += removed
+
+    if any(stats.values()):
+        from .coverage import invalidate_coverage
+
+        transaction.on_commit(invalidate_coverage)
+    return stats
+
+
+def sync_closure(framework):
+    """
+    Bring the closure rows of one framework in line with the parent links.
+    Returns (rows added, rows removed).
+    """
+    parents = dict(
+        CurriculumNode.objects.filter(framework=framework).values_list(
+            "pk", "parent_id"
+        )
+    )
+    wanted = set()
+    for node_id in parents:
+        depth, current = 0, node_id
+        while current is not None:
+            wanted.add((current, node_id, depth))
+            current, depth = parents.get(current), depth + 1
+
+    current_rows = {
+        (ancestor, descendant, depth): pk
+        for pk, ancestor, descendant, depth in CurriculumClosure.objects.filter(
+            descendant__framework=framework
+        ).values_list("pk", "ancestor_id", "descendant_id", "depth")
+    }
+    stale = [pk for key, pk in current_rows.items() if key not in wanted]
+    missing = [key for key in wanted if key not in current_rows]
+
+    for start in range(0, len(stale), BULK_BATCH_SIZE):
+        CurriculumClosure.objects.filter(
+            pk__in=stale[start : start + BULK_BATCH_SIZE]
+        ).delete()
+    # A moved node keeps its (ancestor, descendant) pairs with a new depth:
+    # the stale rows were deleted above, so re-inserting cannot collide
+    CurriculumClosure.objects.bulk_create(
+        [
+            CurriculumClosure(
+                ancestor_id=ancestor, descendant_id=descendant, depth=depth
+            )
+            for ancestor, descendant, depth in missing
+        ],
+        batch_size=BULK_BATCH_SIZE,
+    )
+    return len(missing), len(stale)
+
+
+def import_csv(path, retire_missing=True):
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        return import_rows(read_rows(file), retire_missing=retire_missing)
@@ -0,0 +1,51 @@
+"""
+Import curriculum framework CSVs into CurriculumNode / CurriculumClosure.
+
+Safe to re-run: rows are diffed by (Framework, Code), so an unchanged file
+writes nothing. Codes missing from a framework's file are retired unless
+--keep-missing is given.
+
+Usage:
+    python manage.py import_curriculum
+    python manage.py import_curriculum path/to/framework.csv --keep-missing
+"""
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from curriculum.importer import CurriculumImportError, import_csv
+
+DEFAULT_CSV = "minedu_curriculum_general_overview.csv"
+
+
+class Command(BaseCommand):
+    help = "Import (or re-sync) curriculum frameworks from CSV files"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            help=f"CSV files (default: {DEFAULT_CSV} in the project root)",
+        )
+        parser.add_argument(
+            "--keep-missing",
+            action="store_true",
+            help="Do not retire codes that are no longer in the file",
+        )
+
+    def handle(self, *args, **options):
+        paths = options["paths"] or [Path(settings.BASE_DIR) / DEFAULT_CSV]
+        for path in paths:
+            try:
+                stats = import_csv(path, retire_missing=not options["keep_missing"])
+            except (OSError, CurriculumImportError) as e:
+                raise CommandError(f"{path}: {e}")
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{Path(path).name}: {stats['created']} created, "
+                    f"{stats['updated']} updated, {stats['retired']} retired; "
+                    f"closure +{stats['closure_added']} -{stats['closure_removed']}"
+                )
+            )
@@ -0,0 +1,61 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:08
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CurriculumNode',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('framework', models.CharField(help_text='e.g., "Minedu"', max_length=50)),
+                ('code', models.CharField(help_text='e.g., "MIN-C1-CAP1"', max_length=50)),
+                ('category', models.CharField(blank=True, help_text='e.g., "Personal Social"', max_length=100)),
+                ('level_name', models.CharField(blank=True, help_text='e.g., "Competencia", "Capacidad"', max_length=50)),
+                ('description', models.TextField()),
+                ('depth', models.PositiveSmallIntegerField(default=0)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('parent', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='children', to='curriculum.curriculumnode')),
+            ],
+            options={
+                'verbose_name': 'Curriculum Node',
+                'verbose_name_plural': 'Curriculum Nodes',
+                'ordering': ['framework', 'code'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CurriculumClosure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveSmallIntegerField()),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendant_links', to='curriculum.curriculumnode')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancestor_links', to='curriculum.curriculumnode')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='curriculumnode',
+            index=models.Index(fields=['framework', 'is_active', 'depth'], name='curriculum__framewo_f3d5e1_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='curriculumnode',
+            unique_together={('framework', 'code')},
+        ),
+        migrations.AddIndex(
+            model_name='curriculumclosure',
+            index=models.Index(fields=['descendant', 'depth'], name='curriculum__descend_b3a3c1_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='curriculumclosure',
+            unique_together={('ancestor', 'descendant')},
+        ),
+    ]
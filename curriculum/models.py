@@ -0,0 +1,95 @@
+from django.db import models
+
+
+class CurriculumNode(models.Model):
+    """
+    One node of a curriculum framework tree, e.g. a Minedu Competencia and
+    its Capacidades. Identified by (framework, code); imports diff on code.
+
+    Ancestor/descendant questions go through CurriculumClosure, which holds
+    one row per (ancestor, descendant) pair including each node itself, so
+    "all capacidades under this competencia" or "the path to the root" is a
+    single indexed lookup at any depth.
+    """
+
+    framework = models.CharField(max_length=50, help_text='e.g., "Minedu"')
+    code = models.CharField(max_length=50, help_text='e.g., "MIN-C1-CAP1"')
+    category = models.CharField(
+        max_length=100, blank=True, help_text='e.g., "Personal Social"'
+    )
+    level_name = models.CharField(
+        max_length=50, blank=True, help_text='e.g., "Competencia", "Capacidad"'
+    )
+    description = models.TextField()
+    parent = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="children",
+    )
+    depth = models.PositiveSmallIntegerField(default=0)
+    # Codes that disappear from the framework file are retired, not deleted,
+    # so lesson plans linked to them keep their history
+    is_active = models.BooleanField(default=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Curriculum Node"
+        verbose_name_plural = "Curriculum Nodes"
+        ordering = ["framework", "code"]
+        unique_together = ("framework", "code")
+        indexes = [
+            models.Index(fields=["framework", "is_active", "depth"]),
+        ]
+
+    def __str__(self):
+        return f"{self.code} {self.description[:50]}"
+
+    def ancestors(self):
+        """Ancestors from the root down (excluding this node)."""
+        return CurriculumNode.objects.filter(
+            descendant_links__descendant=self, descendant_links__depth__gt=0
+        ).order_by("-descendant_links__depth")
+
+    def descendants(self):
+        """Every node below this one, nearest first."""
+        return CurriculumNode.objects.filter(
+            ancestor_links__ancestor=self, ancestor_links__depth__gt=0
+        ).order_by("ancestor_links__depth", "code")
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "framework": self.framework,
+            "code": self.code,
+            "category": self.category,
+            "level_name": self.level_name,
+            "description": self.description,
+            "parent_id": self.parent_id,
+            "depth": self.depth,
+            "is_active": self.is_active,
+        }
+
+
+class CurriculumClosure(models.Model):
+    """Transitive closure of CurriculumNode.parent (depth 0 = the node itself)."""
+
+    ancestor = models.ForeignKey(
+        CurriculumNode, on_delete=models.CASCADE, related_name="descendant_links"
+    )
+    descendant = models.ForeignKey(
+        CurriculumNode, on_delete=models.CASCADE, related_name="ancestor_links"
+    )
+    depth = models.PositiveSmallIntegerField()
+
+    class Meta:
+        unique_together = ("ancestor", "descendant")
+        indexes = [
+            models.Index(fields=["descendant", "depth"]),
+        ]
+
+    def __str__(self):
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
@@ -0,0 +1,48 @@
+"""
+Drop cached curriculum coverage (curriculum.coverage) when its inputs
+change: lesson plan <-> node links, lesson plans (date or course may have
+moved), courses (names shown in the matrix) and nodes saved one at a time,
+e.g. from the admin; those also resync their framework's closure rows, as
+the parent may have changed. Imports and term rollovers use bulk writes,
+which send no signals, so they invalidate it themselves
+(curriculum.importer, dashboard.rollover).
+"""
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from dashboard.models import Course
+from lessons.models import LessonPlan
+
+from .coverage import invalidate_coverage
+from .importer import sync_closure
+from .models import CurriculumNode
+
+
+@receiver(
+    m2m_changed,
+    sender=LessonPlan.curriculum_nodes.through,
+    dispatch_uid="curriculum.links_changed",
+)
+def lesson_plan_links_changed(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        transaction.on_commit(invalidate_coverage)
+
+
+@receiver(post_save, sender=LessonPlan, dispatch_uid="curriculum.plan_saved")
+@receiver(post_delete, sender=LessonPlan, dispatch_uid="curriculum.plan_deleted")
+@receiver(post_save, sender=Course, dispatch_uid="curriculum.course_saved")
+@receiver(post_delete, sender=Course, dispatch_uid="curriculum.course_deleted")
+def coverage_input_changed(sender, raw=False, **kwargs):
+    if not raw:
+        transaction.on_commit(invalidate_coverage)
+
+
+@receiver(post_save, sender=CurriculumNode, dispatch_uid="curriculum.node_saved")
+@receiver(post_delete, sender=CurriculumNode, dispatch_uid="curriculum.node_deleted")
+def node_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    sync_closure(instance.framework)
+    transaction.on_commit(invalidate_coverage)
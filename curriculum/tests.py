@@ -0,0 +1,87 @@
+from django.test import TestCase
+
+from .importer import CurriculumImportError, import_rows
+from .models import CurriculumClosure, CurriculumNode
+
+
+def row(code, parent_code=None, description=None):
+    return {
+        "framework": "Minedu",
+        "code": code,
+        "parent_code": parent_code,
+        "category": "Personal Social",
+        "level_name": "Capacidad" if parent_code else "Competencia",
+        "description": description or f"Node {code}",
+    }
+
+
+ROWS = [
+    row("C1"),
+    row("C1-CAP1", "C1"),
+    row("C1-CAP2", "C1"),
+    row("C2"),
+]
+
+
+def closure():
+    return set(
+        CurriculumClosure.objects.values_list(
+            "ancestor__code", "descendant__code", "depth"
+        )
+    )
+
+
+class ImportRowsTests(TestCase):
+    def test_first_import_builds_nodes_and_closure(self):
+        stats = import_rows(ROWS)
+        self.assertEqual(stats["created"], 4)
+        self.assertEqual(stats["closure_added"], 6)
+        self.assertEqual(CurriculumNode.objects.get(code="C1-CAP2").depth, 1)
+        self.assertIn(("C1", "C1-CAP1", 1), closure())
+
+    def test_reimport_writes_nothing(self):
+        import_rows(ROWS)
+        before = closure()
+        stats = import_rows(ROWS)
+        self.assertEqual(set(stats.values()), {0})
+        self.assertEqual(closure(), before)
+
+    def test_changes_reparenting_and_retirement(self):
+        import_rows(ROWS)
+        # C1-CAP2 moves under C2; nothing is retired yet
+        stats = import_rows(
+            [
+                row("C1"),
+                row("C1-CAP1", "C1", description="Reworded"),
+                row("C2"),
+                row("C1-CAP2", "C2"),
+            ]
+        )
+        self.assertEqual(stats["updated"], 2)
+        self.assertEqual(stats["closure_removed"], 1)
+        self.assertIn(("C2", "C1-CAP2", 1), closure())
+        self.assertNotIn(("C1", "C1-CAP2", 1), closure())
+
+        stats = import_rows([row("C1"), row("C1-CAP1", "C1")])
+        self.assertEqual(stats["retired"], 2)
+        self.assertEqual(
+            set(
+                CurriculumNode.objects.filter(is_active=False).values_list(
+                    "code", flat=True
+                )
+            ),
+            {"C2", "C1-CAP2"},
+        )
+
+    def test_unknown_parent_rolls_back(self):
+        with self.assertRaises(CurriculumImportError):
+            import_rows([row("C1"), row("C1-CAP1", "C9")])
+        self.assertFalse(CurriculumNode.objects.exists())
+
+    def test_saving_a_single_node_resyncs_closure(self):
+        import_rows(ROWS)
+        node = CurriculumNode.objects.get(code="C1-CAP1")
+        node.parent = CurriculumNode.objects.get(code="C2")
+        node.save()
+        self.assertIn(("C2", "C1-CAP1", 1), closure())
+        self.assertNotIn(("C1", "C1-CAP1", 1), closure())
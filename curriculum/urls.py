@@ -0,0 +1,11 @@
+from django.urls import path
+
+from . import views
+
+app_name = "curriculum"
+
+urlpatterns = [
+    path("", views.curriculum_tree_api, name="tree"),
+    path("nodes/<int:node_id>", views.curriculum_node_api, name="node"),
+    path("coverage", views.curriculum_coverage_api, name="coverage"),
+]
@@ -0,0 +1,77 @@
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.utils import timezone
+
+from dashboard.models import Course
+
+from .coverage import DEFAULT_FRAMEWORK, coverage_payload, get_coverage
+from .models import CurriculumNode
+
+
+@login_required
+def curriculum_tree_api(request):
+    """
+    Active curriculum nodes as nested trees, one per framework.
+    GET ?framework=Minedu to limit to one framework.
+    """
+    nodes = CurriculumNode.objects.filter(is_active=True).order_by("depth", "code")
+    framework = request.GET.get("framework")
+    if framework:
+        nodes = nodes.filter(framework=framework)
+
+    by_id, frameworks = {}, {}
+    for node in nodes:
+        item = by_id[node.pk] = {**node.to_dict(), "children": []}
+        parent = by_id.get(node.parent_id)
+        if parent is not None:
+            parent["children"].append(item)
+        else:
+            frameworks.setdefault(node.framework, []).append(item)
+    return JsonResponse({"status": "success", "frameworks": frameworks})
+
+
+@login_required
+def curriculum_node_api(request, node_id):
+    """A node with its path to the root and everything below it."""
+    node = CurriculumNode.objects.filter(pk=node_id).first()
+    if node is None:
+        return JsonResponse(
+            {"status": "error", "message": "Curriculum node not found"}, status=404
+        )
+    return JsonResponse(
+        {
+            "status": "success",
+            "node": node.to_dict(),
+            "ancestors": [ancestor.to_dict() for ancestor in node.ancestors()],
+            "descendants": [
+                descendant.to_dict()
+                for descendant in node.descendants().filter(is_active=True)
+            ],
+        }
+    )
+
+
+@login_required
+def curriculum_coverage_api(request):
+    """
+    Coverage heatmap for a term: which nodes each course's lesson plans
+    cover, plus school-wide union, intersection and gaps.
+    GET ?year=2026&framework=Minedu. Admins see every course, teachers
+    their own (aggregates are computed over the visible courses).
+    """
+    year = request.GET.get("year", "")
+    if not year:
+        year = timezone.localdate().year
+    elif year.isdigit() and 1900 < int(year) < 3000:
+        year = int(year)
+    else:
+        return JsonResponse({"status": "error", "message": "Invalid year"}, status=400)
+    framework = request.GET.get("framework") or DEFAULT_FRAMEWORK
+
+    coverage = get_coverage(framework, year)
+    course_ids = None
+    if not (request.user.is_superuser or request.user.role == "admin"):
+        course_ids = set(
+            Course.objects.filter(teacher=request.user).values_list("id", flat=True)
+        )
+    return JsonResponse({"status": "success", **coverage_payload(coverage, course_ids)})
@@ -0,0 +1,92 @@
+"""
+Clone courses, their weekly sessions and lesson plans into a new term.
+
+Everything is written in one transaction with bulk inserts (see
+dashboard.rollover). Dates move by whole weeks so lessons keep their
+weekday; pass --exact-dates to move them by the exact difference.
+
+Usage:
+    python manage.py rollover_term --all --start-date 2027-03-01
+    python manage.py rollover_term --teacher teacher@silabuslms.com --shift-days 364
+    python manage.py rollover_term --course 3 --course 4 --start-date 2027-03-01 --dry-run
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.dateparse import parse_date
+
+from core.models import User
+from dashboard.models import Course
+from dashboard.rollover import RolloverError, rollover_courses, rollover_shift
+
+
+class DryRun(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Clone courses with sessions and lesson plans into a new term"
+
+    def add_arguments(self, parser):
+        scope = parser.add_mutually_exclusive_group(required=True)
+        scope.add_argument("--all", action="store_true", help="Every course")
+        scope.add_argument("--teacher", help="Email of the teacher whose courses to clone")
+        scope.add_argument(
+            "--course", type=int, action="append", help="Course id (repeatable)"
+        )
+        when = parser.add_mutually_exclusive_group(required=True)
+        when.add_argument("--start-date", help="First day of the new term (YYYY-MM-DD)")
+        when.add_argument("--shift-days", type=int, help="Move every date by N days")
+        parser.add_argument(
+            "--exact-dates",
+            action="store_true",
+            help="Do not round the shift to whole weeks",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Roll back instead of committing"
+        )
+
+    def handle(self, *args, **options):
+        courses = Course.objects.order_by("pk")
+        if options["teacher"]:
+            teacher = User.objects.filter(email=options["teacher"]).first()
+            if teacher is None:
+                raise CommandError(f"No user with email {options['teacher']}")
+            courses = courses.filter(teacher=teacher)
+        elif options["course"]:
+            courses = courses.filter(pk__in=options["course"])
+        courses = list(courses)
+        if not courses:
+            raise CommandError("No courses to roll over")
+
+        if options["shift_days"] is not None:
+            shift = timedelta(days=options["shift_days"])
+        else:
+            start = parse_date(options["start_date"])
+            if start is None:
+                raise CommandError("--start-date must be YYYY-MM-DD")
+            try:
+                shift = rollover_shift(
+                    courses, start, align_to_week=not options["exact_dates"]
+                )
+            except RolloverError as e:
+                raise CommandError(str(e))
+
+        try:
+            with transaction.atomic():
+                result = rollover_courses(courses, shift)
+                if options["dry_run"]:
+                    raise DryRun
+        except DryRun:
+            self.stdout.write(self.style.WARNING("Dry run, nothing was saved"))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Cloned {result['courses']} courses, {result['schedules']} "
+                f"schedule entries, {result['sessions']} sessions and "
+                f"{result['lesson_plans']} lesson plans with "
+                f"{result['curriculum_links']} curriculum links (dates shifted by {shift.days} days)"
+            )
+        )
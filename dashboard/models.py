@@ -159,6 +159,32 @@ class Course(models.Model):
             if not Course.objects.filter(enrollment_code=code).exists():
                 return code
 
+    @classmethod
+    def generate_enrollment_codes(cls, count, rng=None):
+        """
+        Generate `count` unique enrollment codes for bulk inserts.
+        Candidates are checked against the table with one query per round
+        instead of one query per code.
+        """
+        import random
+        import string
+
+        rng = rng or random
+        alphabet = string.ascii_uppercase + string.digits
+        codes = set()
+        while len(codes) < count:
+            candidates = {
+                "".join(rng.choices(alphabet, k=8)) for _ in range(count - len(codes))
+            }
+            candidates -= codes
+            taken = set(
+                cls.objects.filter(enrollment_code__in=candidates).values_list(
+                    "enrollment_code", flat=True
+                )
+            )
+            codes |= candidates - taken
+        return sorted(codes)
+
     def save(self, *args, **kwargs):
         """Override save to generate enrollment code if not set."""
         if not self.enrollment_code:
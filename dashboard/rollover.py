@@ -0,0 +1,196 @@
+"""
+Academic-year rollover: clone courses into a new term.
+
+For the selected courses, copies
+- the Course rows (new enrollment codes, start/end dates shifted),
+- their weekly schedule (CourseSchedule and events.Session rows),
+- their lesson plans, dates shifted and reset to draft, with their
+  curriculum node links,
+with one bulk_create per table inside a single transaction. Enrollment
+codes for every new course are generated up front by
+Course.generate_enrollment_codes() (one existence check for the batch);
+because they are unique they also identify the new rows afterwards, which
+keeps the mapping old course -> new course working on MySQL, where
+bulk_create does not return primary keys. Plans are copied in (course, id)
+order, so the new plans of a course, read back by id, line up with the old
+ones; that mapping carries the curriculum links over.
+
+Dates move by a whole number of weeks by default, so a lesson planned for
+a Tuesday lands on a Tuesday again and still matches the weekly sessions.
+Students are not carried over.
+"""
+
+from datetime import timedelta
+
+from django.db import transaction
+
+from events.models import Session
+from lessons.models import LessonPlan
+
+from .models import Course, CourseSchedule
+
+COURSE_SKIP_FIELDS = {"id", "enrollment_code", "created_at", "updated_at"}
+BULK_BATCH_SIZE = 500
+
+
+class RolloverError(ValueError):
+    pass
+
+
+def rollover_shift(courses, new_start, align_to_week=True):
+    """
+    Days to move dates by so the earliest course start lands on
+    `new_start` (rounded to whole weeks unless align_to_week is False).
+    """
+    starts = [course.start_date for course in courses if course.start_date]
+    if not starts:
+        raise RolloverError(
+            "None of the courses has a start date; pass the shift in days"
+        )
+    days = (new_start - min(starts)).days
+    if align_to_week:
+        days = round(days / 7) * 7
+    return timedelta(days=days)
+
+
+def _shift(value, shift):
+    return value + shift if value is not None else None
+
+
+def _copy_fields(instance, skip):
+    return {
+        field.attname: getattr(instance, field.attname)
+        for field in instance._meta.concrete_fields
+        if field.name not in skip
+    }
+
+
+@transaction.atomic
+def rollover_courses(courses, shift, teacher=None):
+    """
+    Clone `courses` with their weekly sessions and lesson plans, moving
+    every date by `shift` (a timedelta). `teacher` reassigns the copies.
+    Returns {"courses": n, "schedules": n, "sessions": n, "lesson_plans": n,
+    "curriculum_links": n, "course_map": {old_id: new_id}}.
+    """
+    courses = list(courses)
+    if not courses:
+        return {
+            "courses": 0,
+            "schedules": 0,
+            "sessions": 0,
+            "lesson_plans": 0,
+            "curriculum_links": 0,
+            "course_map": {},
+        }
+
+    codes = Course.generate_enrollment_codes(len(courses))
+    code_by_course = dict(zip((course.pk for course in courses), codes))
+    clones = []
+    for course in courses:
+        fields = _copy_fields(course, COURSE_SKIP_FIELDS)
+        fields["start_date"] = _shift(course.start_date, shift)
+        fields["end_date"] = _shift(course.end_date, shift)
+        if teacher is not None:
+            fields["teacher_id"] = teacher.pk
+        clones.append(Course(enrollment_code=code_by_course[course.pk], **fields))
+    Course.objects.bulk_create(clones, batch_size=BULK_BATCH_SIZE)
+
+    new_ids = dict(
+        Course.objects.filter(enrollment_code__in=codes).values_list(
+            "enrollment_code", "pk"
+        )
+    )
+    course_map = {old: new_ids[code] for old, code in code_by_course.items()}
+    old_ids = list(course_map)
+
+    schedules = [
+        CourseSchedule(
+            course_id=course_map[schedule.course_id],
+            **_copy_fields(schedule, {"id", "course"}),
+        )
+        for schedule in CourseSchedule.objects.filter(course_id__in=old_ids)
+    ]
+    CourseSchedule.objects.bulk_create(schedules, batch_size=BULK_BATCH_SIZE)
+
+    sessions = [
+        Session(
+            course_id=course_map[session.course_id],
+            **_copy_fields(session, {"id", "course"}),
+        )
+        for session in Session.objects.filter(course_id__in=old_ids)
+    ]
+    Session.objects.bulk_create(sessions, batch_size=BULK_BATCH_SIZE)
+
+    # Plans carry large text columns: insert them batch by batch
+    plans, plans_count = [], 0
+    old_plan_ids = {}
+    for plan in (
+        LessonPlan.objects.filter(course_id__in=old_ids)
+        .order_by("course_id", "id")
+        .iterator(chunk_size=BULK_BATCH_SIZE)
+    ):
+        old_plan_ids.setdefault(plan.course_id, []).append(plan.pk)
+        fields = _copy_fields(plan, {"id", "course", "created_at", "updated_at"})
+        fields["lesson_date"] = _shift(plan.lesson_date, shift)
+        fields["status"] = "draft"
+        plans.append(LessonPlan(course_id=course_map[plan.course_id], **fields))
+        if len(plans) == BULK_BATCH_SIZE:
+            LessonPlan.objects.bulk_create(plans)
+            plans_count += len(plans)
+            plans = []
+    LessonPlan.objects.bulk_create(plans)
+    plans_count += len(plans)
+
+    new_plan_ids = {}
+    for plan_id, course_id in (
+        LessonPlan.objects.filter(course_id__in=course_map.values())
+        .order_by("id")
+        .values_list("id", "course_id")
+    ):
+        new_plan_ids.setdefault(course_id, []).append(plan_id)
+    plan_map = {}
+    for old_course_id, old_plans in old_plan_ids.items():
+        plan_map.update(zip(old_plans, new_plan_ids[course_map[old_course_id]]))
+
+    Link = LessonPlan.curriculum_nodes.through
+    links = [
+        Link(lessonplan_id=plan_map[plan_id], curriculumnode_id=node_id)
+        for plan_id, node_id in Link.objects.filter(
+            lessonplan__course_id__in=old_ids
+        ).values_list("lessonplan_id", "curriculumnode_id")
+    ]
+    Link.objects.bulk_create(links, batch_size=BULK_BATCH_SIZE)
+
+    _after_bulk_create(list(course_map.values()))
+
+    return {
+        "courses": len(clones),
+        "schedules": len(schedules),
+        "sessions": len(sessions),
+        "lesson_plans": plans_count,
+        "curriculum_links": len(links),
+        "course_map": course_map,
+    }
+
+
+def _after_bulk_create(course_ids):
+    """
+    bulk_create() sends no post_save or m2m_changed, so do what the
+    lessons, search, curriculum and events signals would: first revision
+    snapshots and search entries for the new plans, a curriculum coverage
+    invalidation and one next-session announcement.
+    """
+    from cadmus.pubsub import ALL_USERS, broker
+    from curriculum.coverage import invalidate_coverage
+    from lessons.revisions import record_initial_revisions
+    from search.documents import index_objects
+    from search.models import SearchEntry
+
+    from .views import next_session_payload
+
+    new_plans = list(LessonPlan.objects.filter(course_id__in=course_ids))
+    record_initial_revisions(new_plans)
+    index_objects(SearchEntry.KIND_LESSON_PLAN, [plan.pk for plan in new_plans])
+    transaction.on_commit(invalidate_coverage)
+    broker.publish_on_commit(ALL_USERS, "next_session", next_session_payload)
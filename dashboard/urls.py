@@ -8,4 +8,5 @@ urlpatterns = [
     path("schedule/", views.schedule_view, name="schedule"),
     path("create-course/", views.create_course, name="create_course"),
     path("my-courses/", views.my_courses_view, name="my_courses"),
+    path("rollover/", views.rollover_api, name="rollover"),
 ]
@@ -2,12 +2,15 @@ from django.contrib.auth.decorators import login_required
 from django.shortcuts import render
 from django.http import JsonResponse
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 from django.core.serializers.json import DjangoJSONEncoder
 from datetime import datetime, timedelta
 import json
 from .models import Course
+from .rollover import RolloverError, rollover_courses, rollover_shift
 from events.models import Event, Session
 from students.models import Student
+from cadmus.metrics import observe_rows
 
 
 def get_next_session():
@@ -75,6 +78,16 @@ def get_next_session():
     return None, 0
 
 
+def next_session_payload():
+    """Header countdown data: the next session plus minutes_to_start, or None."""
+    next_session, minutes_to_start = get_next_session()
+    if not next_session:
+        return None
+    next_session_data = next_session.to_dict()
+    next_session_data["minutes_to_start"] = minutes_to_start
+    return next_session_data
+
+
 @login_required
 def my_courses_view(request):
     """View to display all courses for the logged-in teacher."""
@@ -108,19 +121,15 @@ def dashboard_view(request):
     )[:10]
 
     # Get the closest upcoming session for the dashboard header countdown
-    next_session, minutes_to_start = get_next_session()
+    next_session_data = next_session_payload()
 
     # Serialize data to JSON for JavaScript (matching Flask's tojson filter)
     courses_data = [course.to_dict() for course in courses]
     students_data = [student.to_dict() for student in students]
     events_data = [event.to_dict() for event in upcoming_events]
-
-    # Add minutes_to_start to session data
-    if next_session:
-        next_session_data = next_session.to_dict()
-        next_session_data["minutes_to_start"] = minutes_to_start
-    else:
-        next_session_data = None
+    observe_rows("students_json", len(students_data))
+    observe_rows("events_json", len(events_data))
+    observe_rows("courses_json", len(courses_data))
 
     context = {
         "courses": courses,
@@ -231,3 +240,58 @@ def create_course(request):
     return JsonResponse(
         {"status": "error", "message": "Invalid request method"}, status=405
     )
+
+
+@login_required
+def rollover_api(request):
+    """
+    Clone the teacher's courses (or course_ids[]) with their weekly sessions
+    and lesson plans into a new term. POST start_date=YYYY-MM-DD (dates move
+    by whole weeks) or shift_days=N.
+    """
+    if request.method != "POST":
+        return JsonResponse(
+            {"status": "error", "message": "Invalid request method"}, status=405
+        )
+
+    courses = Course.objects.filter(teacher=request.user).order_by("pk")
+    course_ids = [
+        int(value)
+        for value in request.POST.getlist("course_ids[]")
+        if value.isdigit()
+    ]
+    if course_ids:
+        courses = courses.filter(pk__in=course_ids)
+    courses = list(courses)
+    if not courses:
+        return JsonResponse(
+            {"status": "error", "message": "No courses to roll over"}, status=400
+        )
+
+    try:
+        if request.POST.get("shift_days"):
+            shift = timedelta(days=int(request.POST["shift_days"]))
+        else:
+            start_date = parse_date(request.POST.get("start_date", ""))
+            if start_date is None:
+                raise RolloverError(
+                    "start_date (YYYY-MM-DD) or shift_days is required"
+                )
+            shift = rollover_shift(courses, start_date)
+    except (ValueError, RolloverError) as e:
+        return JsonResponse({"status": "error", "message": str(e)}, status=400)
+
+    result = rollover_courses(courses, shift)
+    return JsonResponse(
+        {
+            "status": "success",
+            "shift_days": shift.days,
+            "courses": result["courses"],
+            "sessions": result["sessions"],
+            "lesson_plans": result["lesson_plans"],
+            "curriculum_links": result["curriculum_links"],
+            "course_map": {
+                str(old): new for old, new in result["course_map"].items()
+            },
+        }
+    )
@@ -0,0 +1,23 @@
+"""
+Push next-session changes to open event streams (cadmus.pubsub).
+
+The dashboard countdown is global (dashboard.views.get_next_session), so
+any Session edit is announced to every connected user.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from cadmus.pubsub import ALL_USERS, broker
+
+from .models import Session
+
+
+@receiver(post_save, sender=Session)
+@receiver(post_delete, sender=Session)
+def announce_next_session(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    from dashboard.views import next_session_payload
+
+    broker.publish_on_commit(ALL_USERS, "next_session", next_session_payload)
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Forum, Discussion, Post
+from .models import Forum, Discussion, DiscussionReadMarker, Post, PostLike
 
 
 class PostInline(admin.TabularInline):
@@ -17,9 +17,10 @@ class ForumAdmin(admin.ModelAdmin):
 
 @admin.register(Discussion)
 class DiscussionAdmin(admin.ModelAdmin):
-    list_display = ("title", "forum", "created_at")
+    list_display = ("title", "forum", "post_count", "created_at")
     list_filter = ("forum", "is_pinned")
     search_fields = ("title",)
+    readonly_fields = ("post_count", "last_post")
     inlines = [PostInline]
 
 
@@ -31,3 +32,15 @@ class PostAdmin(admin.ModelAdmin):
 
     def short_body(self, obj):
         return obj.body[:50]
+
+
+@admin.register(DiscussionReadMarker)
+class DiscussionReadMarkerAdmin(admin.ModelAdmin):
+    list_display = ("user", "discussion", "last_read_post_id", "updated_at")
+    raw_id_fields = ("user", "discussion")
+
+
+@admin.register(PostLike)
+class PostLikeAdmin(admin.ModelAdmin):
+    list_display = ("post", "user", "student", "created_at")
+    raw_id_fields = ("post", "user", "student")
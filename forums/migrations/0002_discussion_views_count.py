@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 02:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forums', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='discussion',
+            name='views_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 4.2.30 on 2026-10-19 02:55
+
+from django.db import migrations, models
+
+DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+
+def segment(pk):
+    out = ''
+    while pk:
+        pk, remainder = divmod(pk, 36)
+        out = DIGITS[remainder] + out
+    return out.rjust(8, '0') + '/'
+
+
+def backfill_paths(apps, schema_editor):
+    """Fill path/depth level by level, starting from top-level posts."""
+    Post = apps.get_model('forums', 'Post')
+    parents = {}
+    level = Post.objects.filter(parent__isnull=True)
+    depth = 0
+    while True:
+        batch = list(level.only('id', 'parent_id'))
+        if not batch:
+            break
+        for post in batch:
+            post.depth = depth
+            post.path = parents.get(post.parent_id, '') + segment(post.id)
+        Post.objects.bulk_update(batch, ['path', 'depth'], batch_size=500)
+        parents = {post.id: post.path for post in batch}
+        level = Post.objects.filter(parent_id__in=list(parents))
+        depth += 1
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forums', '0002_discussion_views_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='path',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['discussion', 'depth', 'path'], name='forums_post_discuss_ea7eb5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['discussion', 'path'], name='forums_post_discuss_4167c8_idx'),
+        ),
+        migrations.RunPython(backfill_paths, migrations.RunPython.noop),
+    ]
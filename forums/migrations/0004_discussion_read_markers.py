@@ -0,0 +1,55 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:02
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_post_stats(apps, schema_editor):
+    Discussion = apps.get_model('forums', 'Discussion')
+    Post = apps.get_model('forums', 'Post')
+    posts = Post.objects.filter(discussion=OuterRef('pk')).order_by().values('discussion')
+    Discussion.objects.update(
+        post_count=Coalesce(
+            Subquery(posts.annotate(total=Count('pk')).values('total')), 0
+        ),
+        last_post_id=Subquery(posts.annotate(last=Max('pk')).values('last')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('forums', '0003_post_materialized_path'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='discussion',
+            name='last_post',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='forums.post'),
+        ),
+        migrations.AddField(
+            model_name='discussion',
+            name='post_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='DiscussionReadMarker',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_read_post_id', models.PositiveIntegerField(default=0)),
+                ('read_post_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('discussion', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='read_markers', to='forums.discussion')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='discussion_read_markers', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('user', 'discussion')},
+            },
+        ),
+        migrations.RunPython(backfill_post_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:02
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0003_interest_student_interests_json_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('forums', '0004_discussion_read_markers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostLike',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='likes', to='forums.post')),
+                ('student', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='post_likes', to='students.student')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='post_likes', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='postlike',
+            constraint=models.UniqueConstraint(fields=('user', 'post'), name='forums_postlike_unique_user'),
+        ),
+        migrations.AddConstraint(
+            model_name='postlike',
+            constraint=models.UniqueConstraint(fields=('student', 'post'), name='forums_postlike_unique_student'),
+        ),
+        migrations.AddConstraint(
+            model_name='postlike',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('student__isnull', True), ('user__isnull', False)), models.Q(('student__isnull', False), ('user__isnull', True)), _connector='OR'), name='forums_postlike_one_liker'),
+        ),
+    ]
@@ -1,8 +1,60 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
+from django.db.models import (
+    Count,
+    F,
+    FilteredRelation,
+    Max,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+)
+from django.db.models.functions import Coalesce, Greatest
 from students.models import Student
 
 
+class ForumQuerySet(models.QuerySet):
+    def visible_to(self, user):
+        """Shared forums plus forums of the user's own courses."""
+        if user.is_superuser:
+            return self
+        return self.filter(Q(course__isnull=True) | Q(course__teacher=user))
+
+    def with_activity(self, user):
+        """
+        Annotate discussion and unread counts for `user` in ONE grouped query
+        over discussions and the user's read markers (never over posts), so
+        the cost does not grow with the number of posts.
+        """
+        return self.annotate(
+            user_marker=FilteredRelation(
+                "discussions__read_markers",
+                condition=Q(discussions__read_markers__user=user),
+            )
+        ).annotate(
+            discussions_total=Count("discussions"),
+            unread_posts=Coalesce(
+                Sum(
+                    Greatest(
+                        F("discussions__post_count")
+                        - Coalesce(F("user_marker__read_post_count"), 0),
+                        0,
+                    )
+                ),
+                0,
+            ),
+            unread_discussions=Count(
+                "discussions",
+                filter=Q(
+                    discussions__last_post_id__gt=Coalesce(
+                        F("user_marker__last_read_post_id"), 0
+                    )
+                ),
+            ),
+        )
+
+
 class Forum(models.Model):
     """
     A discussion forum, usually linked to a Group or Course.
@@ -37,18 +89,54 @@ class Forum(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ForumQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
     @property
     def active_categories_count(self):
-        """Mock count for UI '12 active categories'"""
+        """Count for UI '12 active categories' (annotated by with_activity)"""
+        if hasattr(self, "discussions_total"):
+            return self.discussions_total
         return self.discussions.count()
 
     @property
     def new_posts_count(self):
-        """Mock count for UI '5 new'"""
-        return 5  # Placeholder
+        """Count for UI '5 new'; needs Forum.objects.with_activity(user)"""
+        return getattr(self, "unread_posts", 0)
+
+    def to_dict(self):
+        """Forum index entry; expects with_activity() annotations."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "icon_class": self.icon_class,
+            "course_id": self.course_id,
+            "group_id": self.group_id,
+            "active_categories_count": self.active_categories_count,
+            "new_posts_count": self.new_posts_count,
+            "unread_discussions": getattr(self, "unread_discussions", 0),
+        }
+
+
+class DiscussionQuerySet(models.QuerySet):
+    def refresh_post_stats(self):
+        """Recount post_count / last_post from the posts table (repairs drift)."""
+        return self.update(
+            post_count=Coalesce(
+                Subquery(
+                    Post.objects.filter(discussion=OuterRef("pk"))
+                    .order_by()
+                    .values("discussion")
+                    .annotate(total=Count("pk"))
+                    .values("total")
+                ),
+                0,
+            ),
+            last_post_id=Discussion.latest_post_subquery(),
+        )
 
 
 class Discussion(models.Model):
@@ -81,22 +169,83 @@ class Discussion(models.Model):
     is_pinned = models.BooleanField(default=False)
     is_closed = models.BooleanField(default=False)
 
+    # Written in batches by cadmus.counter_buffer, never per request
+    views_count = models.PositiveIntegerField(default=0)
+
+    # Maintained on post insert (Post.save) and delete (forums.signals)
+    post_count = models.PositiveIntegerField(default=0)
+    last_post = models.ForeignKey(
+        "Post",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = DiscussionQuerySet.as_manager()
+
     class Meta:
         ordering = ["-is_pinned", "-updated_at"]
 
     def __str__(self):
         return self.title
 
+    @staticmethod
+    def latest_post_subquery():
+        """Subquery for the id of the newest post of OuterRef("pk")."""
+        return Subquery(
+            Post.objects.filter(discussion=OuterRef("pk"))
+            .order_by()
+            .values("discussion")
+            .annotate(last=Max("pk"))
+            .values("last")
+        )
+
+    @property
+    def author_name(self):
+        if self.author_student:
+            return self.author_student.full_name
+        if self.author_user:
+            return self.author_user.full_name
+        return "Unknown"
+
+    def to_dict(self):
+        """Return a dictionary representation of the discussion."""
+        from cadmus.counter_buffer import view_counts
+
+        return {
+            "id": self.id,
+            "forum_id": self.forum_id,
+            "title": self.title,
+            "author_name": self.author_name,
+            "is_pinned": self.is_pinned,
+            "is_closed": self.is_closed,
+            "views_count": self.views_count + view_counts.pending(Discussion, self.id),
+            "post_count": self.post_count,
+            "last_post_id": self.last_post_id,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
 
 class Post(models.Model):
     """
     Individual posts/replies within a discussion.
     Supports threaded replies via 'parent'.
+
+    `path` is a materialized path: the post's ancestors' ids and its own,
+    each as a fixed-width base-36 segment (e.g. "0000002s/0000002x/").
+    Sorting by path gives depth-first thread order, and a top-level post's
+    whole subtree is one index range, so threads load without recursion
+    (see forums.threads).
     """
 
+    SEGMENT_WIDTH = 8  # base-36 digits per id (ids up to ~2.8 trillion)
+    MAX_DEPTH = 25  # (SEGMENT_WIDTH + 1) * MAX_DEPTH must fit in `path`
+
     discussion = models.ForeignKey(
         Discussion, on_delete=models.CASCADE, related_name="posts"
     )
@@ -122,7 +271,11 @@ class Post(models.Model):
 
     body = models.TextField()
 
-    # Engagement
+    # Thread position (set on insert; posts are never re-parented)
+    path = models.CharField(max_length=255, blank=True, editable=False)
+    depth = models.PositiveSmallIntegerField(default=0, editable=False)
+
+    # Engagement (likes_count follows PostLike rows; see PostLike.add/remove)
     likes_count = models.PositiveIntegerField(default=0)
     is_teacher_endorsed = models.BooleanField(
         default=False, help_text="Teacher: 1 points / Highlight"
@@ -133,10 +286,40 @@ class Post(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            models.Index(fields=["discussion", "depth", "path"]),
+            models.Index(fields=["discussion", "path"]),
+        ]
 
     def __str__(self):
         return f"Post by {self.author_name} in {self.discussion}"
 
+    @classmethod
+    def path_segment(cls, pk):
+        digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+        segment = ""
+        while pk:
+            pk, remainder = divmod(pk, 36)
+            segment = digits[remainder] + segment
+        return segment.rjust(cls.SEGMENT_WIDTH, "0") + "/"
+
+    def save(self, *args, **kwargs):
+        """Set path/depth once the new post has an id."""
+        # Replies past MAX_DEPTH hang off the deepest allowed ancestor
+        while self.parent is not None and self.parent.depth >= self.MAX_DEPTH - 1:
+            self.parent = self.parent.parent
+        super().save(*args, **kwargs)
+        if not self.path:
+            prefix = self.parent.path if self.parent is not None else ""
+            self.depth = self.parent.depth + 1 if self.parent is not None else 0
+            self.path = prefix + self.path_segment(self.pk)
+            Post.objects.filter(pk=self.pk).update(path=self.path, depth=self.depth)
+            Discussion.objects.filter(pk=self.discussion_id).update(
+                post_count=F("post_count") + 1,
+                last_post_id=self.pk,
+                updated_at=self.created_at,
+            )
+
     @property
     def author_name(self):
         if self.author_student:
@@ -153,6 +336,21 @@ class Post(models.Model):
             return self.author_user.avatar_url
         return None
 
+    def to_dict(self):
+        """Post representation for thread API responses (no replies)."""
+        return {
+            "id": self.id,
+            "parent_id": self.parent_id,
+            "depth": self.depth,
+            "body": self.body,
+            "author_name": self.author_name,
+            "author_avatar": self.author_avatar,
+            "author_role_label": self.author_role_label,
+            "likes_count": self.likes_count,
+            "is_teacher_endorsed": self.is_teacher_endorsed,
+            "created_at": self.created_at.isoformat(),
+        }
+
     @property
     def author_role_label(self):
         """Returns '(II-C)' for student or 'Teacher (II-C)'"""
@@ -164,3 +362,127 @@ class Post(models.Model):
             # Try to infer group from discussion context if needed, or just specific title
             return "Teacher"
         return ""
+
+
+class DiscussionReadMarker(models.Model):
+    """
+    How far a user has read a discussion: the last post id seen and the
+    discussion's post_count at that moment. Unread posts are then
+    post_count - read_post_count without touching the posts table.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="discussion_read_markers",
+    )
+    discussion = models.ForeignKey(
+        Discussion, on_delete=models.CASCADE, related_name="read_markers"
+    )
+    last_read_post_id = models.PositiveIntegerField(default=0)
+    read_post_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("user", "discussion")
+
+    def __str__(self):
+        return f"{self.user} read {self.discussion} up to #{self.last_read_post_id}"
+
+    @classmethod
+    def mark_read(cls, user, discussion):
+        """Move the user's marker up to the discussion's latest post."""
+        last_post_id = discussion.last_post_id or 0
+        updated = cls.objects.filter(
+            user=user, discussion=discussion, last_read_post_id__lt=last_post_id
+        ).update(last_read_post_id=last_post_id, read_post_count=discussion.post_count)
+        if not updated:
+            cls.objects.get_or_create(
+                user=user,
+                discussion=discussion,
+                defaults={
+                    "last_read_post_id": last_post_id,
+                    "read_post_count": discussion.post_count,
+                },
+            )
+
+
+class PostLike(models.Model):
+    """
+    One like of a post by a teacher (user) or a student. Unique constraints
+    on (user, post) and (student, post) allow each liker a single like per
+    post (NULLs never collide, on SQLite and MySQL alike), so concurrent
+    clicks cannot double count; likes_count moves only when a row is
+    actually inserted or deleted, with an F() update in the same
+    transaction.
+    """
+
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="likes")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="post_likes",
+    )
+    student = models.ForeignKey(
+        Student,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="post_likes",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "post"], name="forums_postlike_unique_user"
+            ),
+            models.UniqueConstraint(
+                fields=["student", "post"], name="forums_postlike_unique_student"
+            ),
+            models.CheckConstraint(
+                check=Q(user__isnull=False, student__isnull=True)
+                | Q(user__isnull=True, student__isnull=False),
+                name="forums_postlike_one_liker",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user or self.student} likes post #{self.post_id}"
+
+    @classmethod
+    def add(cls, post_id, user=None, student=None):
+        """Like a post; returns False if this liker already had."""
+        with transaction.atomic():
+            _, created = cls.objects.get_or_create(
+                post_id=post_id, user=user, student=student
+            )
+            if created:
+                Post.objects.filter(pk=post_id).update(
+                    likes_count=F("likes_count") + 1
+                )
+        return created
+
+    @classmethod
+    def remove(cls, post_id, user=None, student=None):
+        """Unlike a post; returns False if there was no like to remove."""
+        with transaction.atomic():
+            deleted, _ = cls.objects.filter(
+                post_id=post_id, user=user, student=student
+            ).delete()
+            if deleted:
+                Post.objects.filter(pk=post_id).update(
+                    likes_count=Greatest(F("likes_count") - 1, 0)
+                )
+        return bool(deleted)
+
+    @classmethod
+    def liked_post_ids(cls, post_ids, user=None, student=None):
+        """Which of `post_ids` this liker has liked (one query)."""
+        return set(
+            cls.objects.filter(
+                post_id__in=list(post_ids), user=user, student=student
+            ).values_list("post_id", flat=True)
+        )
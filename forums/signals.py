@@ -0,0 +1,21 @@
+"""
+Keep Discussion.post_count / last_post in step when posts are deleted.
+Inserts are handled in Post.save(); QuerySet.delete() still sends
+post_delete per row, QuerySet.update() and bulk_create() do not (use
+Discussion.objects.refresh_post_stats() after bulk writes).
+"""
+
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import Discussion, Post
+
+
+@receiver(post_delete, sender=Post, dispatch_uid="forums.post_deleted")
+def post_deleted(sender, instance, **kwargs):
+    Discussion.objects.filter(pk=instance.discussion_id).update(
+        post_count=Greatest(F("post_count") - 1, 0),
+        last_post_id=Discussion.latest_post_subquery(),
+    )
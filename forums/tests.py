@@ -1,3 +1,39 @@
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Discussion, Forum, Post
+from .threads import load_thread_page
+
+
+class LoadThreadPageTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        forum = Forum.objects.create(name="Philosophy")
+        cls.discussion = Discussion.objects.create(forum=forum, title="The Cave")
+
+    def post(self, body, parent=None):
+        return Post.objects.create(discussion=self.discussion, parent=parent, body=body)
+
+    def test_page_carries_only_its_roots_subtrees(self):
+        first = self.post("first")
+        second = self.post("second")
+        third = self.post("third")
+        reply = self.post("reply to first", parent=first)
+        third_reply = self.post("reply to third", parent=third)
+        nested = self.post("reply to reply", parent=reply)
+        late = self.post("late reply to second", parent=second)
+
+        tree, next_cursor = load_thread_page(self.discussion, limit=2)
+
+        self.assertEqual([root["body"] for root in tree], ["first", "second"])
+        self.assertEqual([node["id"] for node in tree[0]["replies"]], [reply.pk])
+        self.assertEqual(
+            [node["id"] for node in tree[0]["replies"][0]["replies"]], [nested.pk]
+        )
+        self.assertEqual([node["id"] for node in tree[1]["replies"]], [late.pk])
+
+        tree, _ = load_thread_page(self.discussion, cursor=next_cursor, limit=2)
+        self.assertEqual([root["body"] for root in tree], ["third"])
+        self.assertEqual([node["id"] for node in tree[0]["replies"]], [third_reply.pk])
+
+    def test_empty_discussion(self):
+        self.assertEqual(load_thread_page(self.discussion), ([], None))
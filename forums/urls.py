@@ -0,0 +1,20 @@
+from django.urls import path
+from . import views
+
+app_name = "forums"
+
+urlpatterns = [
+    path("", views.forum_index_api, name="forum_index"),
+    path(
+        "discussions/<int:discussion_id>",
+        views.discussion_detail_api,
+        name="discussion_detail",
+    ),
+    path(
+        "discussions/<int:discussion_id>/posts",
+        views.discussion_posts_api,
+        name="discussion_posts",
+    ),
+    path("posts/likes", views.post_likes_status_api, name="post_likes_status"),
+    path("posts/<int:post_id>/like", views.post_like_api, name="post_like"),
+]
@@ -1,3 +1,135 @@
-from django.shortcuts import render
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
 
-# Create your views here.
+from cadmus.counter_buffer import view_counts
+from core.pagination import InvalidCursor
+
+from .models import Discussion, DiscussionReadMarker, Forum, Post, PostLike
+from .threads import load_thread_page
+
+THREAD_PAGE_SIZE = 20
+THREAD_MAX_PAGE_SIZE = 100
+LIKES_STATUS_MAX_IDS = 500
+
+
+@login_required
+def forum_index_api(request):
+    """
+    Forums visible to the user with discussion and unread counts, from one
+    grouped query over discussions and the user's read markers.
+    """
+    forums = Forum.objects.visible_to(request.user).with_activity(request.user)
+    return JsonResponse(
+        {"status": "success", "forums": [forum.to_dict() for forum in forums]}
+    )
+
+
+@login_required
+def discussion_detail_api(request, discussion_id):
+    """
+    A discussion thread; the view is counted through the write-behind buffer
+    and the user's read marker moves up to the latest post.
+    """
+    discussion = (
+        Discussion.objects.filter(pk=discussion_id)
+        .select_related("author_user", "author_student")
+        .first()
+    )
+    if discussion is None:
+        return JsonResponse(
+            {"status": "error", "message": "Discussion not found"}, status=404
+        )
+    view_counts.increment(Discussion, discussion.pk)
+    DiscussionReadMarker.mark_read(request.user, discussion)
+    return JsonResponse({"status": "success", "discussion": discussion.to_dict()})
+
+
+@login_required
+def discussion_posts_api(request, discussion_id):
+    """
+    A page of a discussion thread: top-level posts with nested replies.
+    Paginated by top-level post; pass back `next_cursor` as ?cursor=.
+    """
+    discussion = Discussion.objects.filter(pk=discussion_id).first()
+    if discussion is None:
+        return JsonResponse(
+            {"status": "error", "message": "Discussion not found"}, status=404
+        )
+
+    try:
+        limit = int(request.GET.get("limit", THREAD_PAGE_SIZE))
+    except ValueError:
+        limit = THREAD_PAGE_SIZE
+    limit = max(1, min(limit, THREAD_MAX_PAGE_SIZE))
+
+    try:
+        posts, next_cursor = load_thread_page(
+            discussion,
+            cursor=request.GET.get("cursor"),
+            limit=limit,
+            user=request.user,
+        )
+    except InvalidCursor as e:
+        return JsonResponse({"status": "error", "message": str(e)}, status=400)
+
+    return JsonResponse(
+        {"status": "success", "posts": posts, "next_cursor": next_cursor}
+    )
+
+
+def _parse_ids(request):
+    """Read ids[] from an AJAX form post; invalid entries are ignored."""
+    return [int(value) for value in request.POST.getlist("ids[]") if value.isdigit()]
+
+
+@login_required
+def post_like_api(request, post_id):
+    """
+    Like (POST) or unlike (DELETE) a post as the current user. Repeated
+    requests are no-ops; returns the post's current likes_count.
+    """
+    if request.method not in ("POST", "DELETE"):
+        return JsonResponse(
+            {"status": "error", "message": "Invalid request method"}, status=405
+        )
+    if not Post.objects.filter(pk=post_id).exists():
+        return JsonResponse(
+            {"status": "error", "message": "Post not found"}, status=404
+        )
+
+    if request.method == "POST":
+        changed = PostLike.add(post_id, user=request.user)
+    else:
+        changed = PostLike.remove(post_id, user=request.user)
+    likes_count = Post.objects.filter(pk=post_id).values_list(
+        "likes_count", flat=True
+    ).first()
+    return JsonResponse(
+        {
+            "status": "success",
+            "post_id": post_id,
+            "liked_by_me": request.method == "POST",
+            "changed": changed,
+            "likes_count": likes_count or 0,
+        }
+    )
+
+
+@login_required
+def post_likes_status_api(request):
+    """
+    "Liked by me" flags for a page of posts in one query.
+    POST ids[]=... (posts rendered outside discussion_posts_api).
+    """
+    if request.method != "POST":
+        return JsonResponse(
+            {"status": "error", "message": "Invalid request method"}, status=405
+        )
+    post_ids = _parse_ids(request)[:LIKES_STATUS_MAX_IDS]
+    liked = PostLike.liked_post_ids(post_ids, user=request.user)
+    return JsonResponse(
+        {
+            "status": "success",
+            "liked": {str(post_id): post_id in liked for post_id in post_ids},
+        }
+    )
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import LessonPlan
+from .models import LessonPlan, LessonPlanRevision
 
 
 @admin.register(LessonPlan)
@@ -8,3 +8,14 @@ class LessonPlanAdmin(admin.ModelAdmin):
     list_filter = ["status", "course", "lesson_date"]
     search_fields = ["title", "objectives", "content"]
     ordering = ["-lesson_date", "-created_at"]
+
+    def save_model(self, request, obj, form, change):
+        obj._revision_author = request.user
+        super().save_model(request, obj, form, change)
+
+
+@admin.register(LessonPlanRevision)
+class LessonPlanRevisionAdmin(admin.ModelAdmin):
+    list_display = ["plan", "number", "is_snapshot", "author", "created_at"]
+    raw_id_fields = ["plan", "author"]
+    readonly_fields = ["data"]
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class LessonsConfig(AppConfig):
     name = 'lessons'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lessons', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lessonplan',
+            index=models.Index(fields=['course', 'lesson_date', 'created_at', 'id'], name='lessons_les_course__498b7b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lessonplan',
+            index=models.Index(fields=['course', 'status', 'lesson_date', 'created_at', 'id'], name='lessons_les_course__1923f2_idx'),
+        ),
+    ]
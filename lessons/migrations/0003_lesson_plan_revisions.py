@@ -0,0 +1,60 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:06
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+# plan_state() only reads attributes, so it works on the historical model and
+# the snapshots match the ones lessons.signals records
+from lessons.revisions import TRACKED_FIELDS, encode, plan_state
+
+
+def snapshot_existing_plans(apps, schema_editor):
+    """Revision 1 of every existing plan is a snapshot of its current state."""
+    LessonPlan = apps.get_model('lessons', 'LessonPlan')
+    LessonPlanRevision = apps.get_model('lessons', 'LessonPlanRevision')
+    batch = []
+    for plan in LessonPlan.objects.order_by('pk').iterator(chunk_size=500):
+        batch.append(LessonPlanRevision(
+            plan_id=plan.pk,
+            number=1,
+            is_snapshot=True,
+            data=encode(plan_state(plan)),
+            changed_fields=list(TRACKED_FIELDS),
+        ))
+        if len(batch) == 500:
+            LessonPlanRevision.objects.bulk_create(batch)
+            batch = []
+    LessonPlanRevision.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('lessons', '0002_lesson_plan_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LessonPlanRevision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveIntegerField()),
+                ('is_snapshot', models.BooleanField(default=False)),
+                ('data', models.BinaryField()),
+                ('changed_fields', models.JSONField(default=list)),
+                ('restored_from', models.PositiveIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('author', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='lesson_plan_revisions', to=settings.AUTH_USER_MODEL)),
+                ('plan', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revisions', to='lessons.lessonplan')),
+            ],
+            options={
+                'verbose_name': 'Lesson Plan Revision',
+                'verbose_name_plural': 'Lesson Plan Revisions',
+                'ordering': ['plan', '-number'],
+                'unique_together': {('plan', 'number')},
+            },
+        ),
+        migrations.RunPython(snapshot_existing_plans, migrations.RunPython.noop),
+    ]
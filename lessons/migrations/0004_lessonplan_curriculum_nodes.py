@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curriculum', '0001_initial'),
+        ('lessons', '0003_lesson_plan_revisions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lessonplan',
+            name='curriculum_nodes',
+            field=models.ManyToManyField(blank=True, related_name='lesson_plans', to='curriculum.curriculumnode'),
+        ),
+    ]
@@ -1,6 +1,39 @@
+from django.conf import settings
 from django.db import models
 
 
+class LessonPlanQuerySet(models.QuerySet):
+    # Free-text columns only needed when a single plan is opened
+    TEXT_FIELDS = ("objectives", "content", "materials", "homework", "notes")
+
+    def for_teacher(self, user):
+        return self.filter(course__teacher=user)
+
+    def listing(self):
+        """Rows for list views: course name joined, large text deferred."""
+        return self.select_related("course").only(
+            "id",
+            "title",
+            "course_id",
+            "course__name",
+            "lesson_date",
+            "status",
+            "created_at",
+            "updated_at",
+        )
+
+    def covering(self, node):
+        """Plans linked to `node` or to any node below it (closure lookup)."""
+        return self.filter(curriculum_nodes__ancestor_links__ancestor=node).distinct()
+
+    def matching(self, query):
+        """Plans whose title or text match `query` in the full-text index."""
+        from search.backends import get_backend
+        from search.models import SearchEntry
+
+        return get_backend().filter_objects(self, SearchEntry.KIND_LESSON_PLAN, query)
+
+
 class LessonPlan(models.Model):
     """
     Lesson plans for courses.
@@ -34,14 +67,28 @@ class LessonPlan(models.Model):
 
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="draft")
 
+    # Competencias / capacidades this lesson works on
+    curriculum_nodes = models.ManyToManyField(
+        "curriculum.CurriculumNode", blank=True, related_name="lesson_plans"
+    )
+
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = LessonPlanQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Lesson Plan"
         verbose_name_plural = "Lesson Plans"
         ordering = ["-lesson_date", "-created_at"]
+        indexes = [
+            # Keyset listing per course, optionally narrowed by status
+            models.Index(fields=["course", "lesson_date", "created_at", "id"]),
+            models.Index(
+                fields=["course", "status", "lesson_date", "created_at", "id"]
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.course.name}"
@@ -61,3 +108,72 @@ class LessonPlan(models.Model):
             "notes": self.notes,
             "status": self.status,
         }
+
+    def to_summary_dict(self):
+        """List representation (safe with LessonPlan.objects.listing())."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "course_id": self.course_id,
+            "course_name": self.course.name,
+            "lesson_date": self.lesson_date.isoformat() if self.lesson_date else None,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+
+class LessonPlanRevision(models.Model):
+    """
+    One saved version of a lesson plan.
+
+    Revisions are stored as zlib-compressed JSON: a full snapshot every
+    SNAPSHOT_INTERVAL revisions (numbers 1, 1 + N, 1 + 2N, ...) and a
+    line-level diff against the previous revision otherwise. Rebuilding any
+    version therefore reads at most SNAPSHOT_INTERVAL rows in one query
+    (see lessons.revisions).
+    """
+
+    SNAPSHOT_INTERVAL = 20
+
+    plan = models.ForeignKey(
+        LessonPlan, on_delete=models.CASCADE, related_name="revisions"
+    )
+    number = models.PositiveIntegerField()
+    is_snapshot = models.BooleanField(default=False)
+    data = models.BinaryField()
+    changed_fields = models.JSONField(default=list)
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="lesson_plan_revisions",
+    )
+    restored_from = models.PositiveIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Lesson Plan Revision"
+        verbose_name_plural = "Lesson Plan Revisions"
+        ordering = ["plan", "-number"]
+        unique_together = ("plan", "number")
+
+    def __str__(self):
+        return f"{self.plan_id} r{self.number}"
+
+    @classmethod
+    def snapshot_number(cls, number):
+        """Number of the snapshot a revision is rebuilt from."""
+        return number - (number - 1) % cls.SNAPSHOT_INTERVAL
+
+    def to_dict(self):
+        return {
+            "number": self.number,
+            "is_snapshot": self.is_snapshot,
+            "changed_fields": self.changed_fields,
+            "author_name": self.author.full_name if self.author else None,
+            "restored_from": self.restored_from,
+            "stored_bytes": len(self.data),
+            "created_at": self.created_at.isoformat(),
+        }
@@ -0,0 +1,188 @@
+"""
+Lesson plan revision storage.
+
+Each save of a LessonPlan records a LessonPlanRevision (lessons.signals)
+holding only what changed since the previous revision:
+- text fields as a line-level diff: a list of [start, end] ranges copied
+  from the previous text and strings inserted between them
+  (or the new value outright when that is shorter),
+- other fields (date, status) as their new value,
+all JSON-encoded and zlib-compressed. Every SNAPSHOT_INTERVAL-th revision
+stores the full state instead, so rebuilding a version applies at most
+SNAPSHOT_INTERVAL - 1 diffs, read in one query.
+"""
+
+import json
+import zlib
+from difflib import SequenceMatcher
+
+from django.db import transaction
+from django.db.models import Max
+from django.utils.dateparse import parse_date
+
+from .models import LessonPlan, LessonPlanRevision
+
+TEXT_FIELDS = ("title", "objectives", "content", "materials", "homework", "notes")
+TRACKED_FIELDS = TEXT_FIELDS + ("lesson_date", "status")
+
+
+def encode(payload):
+    return zlib.compress(json.dumps(payload, separators=(",", ":")).encode(), 9)
+
+
+def decode(data):
+    return json.loads(zlib.decompress(bytes(data)))
+
+
+def _date_value(value):
+    """ISO date string; views may assign the raw "YYYY-MM-DD" before saving."""
+    if isinstance(value, str):
+        value = parse_date(value) or value
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def plan_state(plan):
+    """
+    The tracked fields of a plan as JSON-ready values. Empty text is ""
+    whether the field holds None or "", so clearing a field is not a change.
+    """
+    state = {field: getattr(plan, field) for field in TRACKED_FIELDS}
+    for field in TEXT_FIELDS:
+        state[field] = state[field] or ""
+    state["lesson_date"] = _date_value(state["lesson_date"])
+    return state
+
+
+def diff_text(old, new):
+    old_lines, new_lines = old.splitlines(True), new.splitlines(True)
+    ops = []
+    matcher = SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif tag in ("replace", "insert"):
+            ops.append("".join(new_lines[j1:j2]))
+    return ops
+
+
+def apply_text(old, ops):
+    old_lines = old.splitlines(True)
+    return "".join(
+        "".join(old_lines[op[0] : op[1]]) if isinstance(op, list) else op
+        for op in ops
+    )
+
+
+def make_delta(previous, current):
+    """{field: {"d": ops} | {"v": value}} for the fields that changed."""
+    delta = {}
+    for field in TRACKED_FIELDS:
+        old, new = previous.get(field), current[field]
+        if field in TEXT_FIELDS:
+            # States recorded before plan_state() normalised text may hold None
+            old, new = old or "", new or ""
+        if old == new:
+            continue
+        if field in TEXT_FIELDS and old:
+            ops = diff_text(old, new)
+            if len(json.dumps(ops)) < len(json.dumps(new)):
+                delta[field] = {"d": ops}
+                continue
+        delta[field] = {"v": new}
+    return delta
+
+
+def apply_delta(state, delta):
+    state = dict(state)
+    for field, change in delta.items():
+        if "d" in change:
+            state[field] = apply_text(state.get(field) or "", change["d"])
+        else:
+            state[field] = change["v"]
+    return state
+
+
+def state_at(plan_id, number):
+    """Rebuild the tracked fields as of revision `number` (None if missing)."""
+    rows = list(
+        LessonPlanRevision.objects.filter(
+            plan_id=plan_id,
+            number__gte=LessonPlanRevision.snapshot_number(number),
+            number__lte=number,
+        )
+        .order_by("number")
+        .values_list("number", "is_snapshot", "data")
+    )
+    if not rows or not rows[0][1] or rows[-1][0] != number:
+        return None
+    state = decode(rows[0][2])
+    for _, _, data in rows[1:]:
+        state = apply_delta(state, decode(data))
+    return state
+
+
+def record_revision(plan, author=None, restored_from=None):
+    """
+    Store the plan's current state as its next revision. Saves that did not
+    touch a tracked field are skipped; returns the revision or None.
+    """
+    with transaction.atomic():
+        # Serialize concurrent saves of the same plan (no-op on SQLite,
+        # whose writers are already serialized)
+        LessonPlan.objects.select_for_update().filter(pk=plan.pk).exists()
+        last = plan.revisions.aggregate(last=Max("number"))["last"] or 0
+        current = plan_state(plan)
+        previous = state_at(plan.pk, last) if last else {}
+        delta = make_delta(previous, current)
+        if last and not delta:
+            return None
+
+        number = last + 1
+        is_snapshot = LessonPlanRevision.snapshot_number(number) == number
+        payload = current if is_snapshot else delta
+        return LessonPlanRevision.objects.create(
+            plan=plan,
+            number=number,
+            is_snapshot=is_snapshot,
+            data=encode(payload),
+            changed_fields=list(delta) if last else list(TRACKED_FIELDS),
+            author=author,
+            restored_from=restored_from,
+        )
+
+
+def record_initial_revisions(plans):
+    """Bulk-store revision 1 (a snapshot) for newly bulk_created plans."""
+    LessonPlanRevision.objects.bulk_create(
+        [
+            LessonPlanRevision(
+                plan_id=plan.pk,
+                number=1,
+                is_snapshot=True,
+                data=encode(plan_state(plan)),
+                changed_fields=list(TRACKED_FIELDS),
+            )
+            for plan in plans
+        ],
+        batch_size=500,
+    )
+
+
+def restore_revision(plan, number, author=None):
+    """
+    Put a plan back to revision `number`. The restore is saved as a new
+    revision, so history is never rewritten. Returns False if the revision
+    does not exist.
+    """
+    state = state_at(plan.pk, number)
+    if state is None:
+        return False
+    for field in TRACKED_FIELDS:
+        value = state.get(field)
+        if field == "lesson_date" and value:
+            value = parse_date(value)
+        setattr(plan, field, value)
+    plan._revision_author = author
+    plan._restored_from = number
+    plan.save()
+    return True
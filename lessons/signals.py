@@ -0,0 +1,22 @@
+"""
+Record a LessonPlanRevision on every save that changes a tracked field.
+Set `plan._revision_author` (and `_restored_from`) before save() to have
+them stored with the revision; QuerySet.update() records nothing.
+"""
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import LessonPlan
+from .revisions import record_revision
+
+
+@receiver(post_save, sender=LessonPlan, dispatch_uid="lessons.record_revision")
+def lesson_plan_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    record_revision(
+        instance,
+        author=getattr(instance, "_revision_author", None),
+        restored_from=getattr(instance, "_restored_from", None),
+    )
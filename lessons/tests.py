@@ -1,3 +1,53 @@
+from datetime import date
+from importlib import import_module
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-# Create your tests here.
+from dashboard.models import Course
+
+from .models import LessonPlan
+from .revisions import decode, plan_state, record_revision, state_at
+
+
+class RevisionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        teacher = get_user_model().objects.create_user("teacher@example.com", "x")
+        cls.course = Course.objects.create(name="Philosophy", teacher=teacher)
+
+    def setUp(self):
+        self.plan = LessonPlan.objects.create(
+            course=self.course,
+            title="Plato",
+            content="The cave\nThe forms\n",
+            lesson_date=date(2026, 3, 10),
+        )
+
+    def test_string_date_assigned_before_save(self):
+        self.plan.lesson_date = "2026-03-17"
+        self.plan.save()
+        self.assertEqual(plan_state(self.plan)["lesson_date"], "2026-03-17")
+        self.assertEqual(state_at(self.plan.pk, 2)["lesson_date"], "2026-03-17")
+
+    def test_none_text_is_not_a_change(self):
+        self.plan.notes = None
+        self.assertIsNone(record_revision(self.plan))
+        self.assertEqual(self.plan.revisions.count(), 1)
+
+    def test_text_changes_are_stored_as_diffs(self):
+        self.plan.content = "The cave\nThe divided line\nThe forms\n"
+        self.plan.save()
+        revision = self.plan.revisions.get(number=2)
+        self.assertEqual(revision.changed_fields, ["content"])
+        self.assertEqual(state_at(self.plan.pk, 2)["content"], self.plan.content)
+        self.assertEqual(state_at(self.plan.pk, 1)["content"], "The cave\nThe forms\n")
+
+    def test_backfill_snapshot_matches_recorded_state(self):
+        migration = import_module("lessons.migrations.0003_lesson_plan_revisions")
+        recorded = state_at(self.plan.pk, 1)
+        self.plan.revisions.all().delete()
+        migration.snapshot_existing_plans(apps, None)
+        self.assertEqual(decode(self.plan.revisions.get(number=1).data), recorded)
+        self.assertEqual(recorded, plan_state(self.plan))
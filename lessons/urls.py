@@ -5,4 +5,25 @@ app_name = "lessons"
 
 urlpatterns = [
     path("", views.lesson_plans_view, name="lesson_plans"),
+    path("api/plans", views.lesson_plans_api, name="lesson_plans_api"),
+    path(
+        "api/plans/<int:plan_id>/revisions",
+        views.lesson_plan_revisions_api,
+        name="lesson_plan_revisions",
+    ),
+    path(
+        "api/plans/<int:plan_id>/revisions/<int:number>",
+        views.lesson_plan_revision_api,
+        name="lesson_plan_revision",
+    ),
+    path(
+        "api/plans/<int:plan_id>/revisions/<int:number>/restore",
+        views.restore_lesson_plan_revision_api,
+        name="restore_lesson_plan_revision",
+    ),
+    path(
+        "api/plans/<int:plan_id>/curriculum",
+        views.lesson_plan_curriculum_api,
+        name="lesson_plan_curriculum",
+    ),
 ]
@@ -1,25 +1,236 @@
 from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
 from django.shortcuts import render
-from .models import LessonPlan
+from django.utils.dateparse import parse_date
+
+from core.pagination import InvalidCursor, keyset_page
+from curriculum.models import CurriculumNode
+from .models import LessonPlan, LessonPlanRevision
+from .revisions import restore_revision, state_at
 from dashboard.models import Course
 
+LESSON_PLAN_PAGE_SIZE = 25
+LESSON_PLAN_MAX_PAGE_SIZE = 100
+
+# Newest lesson first. Plans without a date sort after all dated ones
+# (as NULLs do in a descending ORDER BY), so they are paged separately
+# and cursors carry which of the two runs they point into.
+DATED_ORDER = ("lesson_date", "created_at", "id")
+UNDATED_ORDER = ("created_at", "id")
+DATED_CURSOR, UNDATED_CURSOR = "d.", "u."
+
+
+def _lesson_plan_filters(request, courses):
+    """
+    Apply ?course=, ?status=, ?date_from=, ?date_to= and ?q= to the
+    teacher's plans. Returns (queryset, error message or None).
+    """
+    plans = LessonPlan.objects.filter(course__in=courses)
+
+    course_id = request.GET.get("course")
+    if course_id:
+        if not course_id.isdigit() or not any(
+            course.pk == int(course_id) for course in courses
+        ):
+            return None, "Invalid course"
+        plans = plans.filter(course_id=int(course_id))
+
+    status = request.GET.get("status")
+    if status:
+        if status not in dict(LessonPlan.STATUS_CHOICES):
+            return None, "Invalid status"
+        plans = plans.filter(status=status)
+
+    for param, lookup in (("date_from", "gte"), ("date_to", "lte")):
+        value = request.GET.get(param)
+        if value:
+            date = parse_date(value)
+            if date is None:
+                return None, f"Invalid {param}"
+            plans = plans.filter(**{f"lesson_date__{lookup}": date})
+
+    query = request.GET.get("q", "").strip()
+    if query:
+        plans = plans.matching(query)
+    return plans.listing(), None
+
+
+def _lesson_plan_page(plans, cursor=None, limit=LESSON_PLAN_PAGE_SIZE):
+    """Keyset page over dated plans, then undated ones; (rows, next_cursor)."""
+    rows = []
+    if not cursor or cursor.startswith(DATED_CURSOR):
+        rows, next_cursor = keyset_page(
+            plans.filter(lesson_date__isnull=False),
+            DATED_ORDER,
+            cursor=cursor[len(DATED_CURSOR) :] if cursor else None,
+            limit=limit,
+        )
+        if next_cursor:
+            return rows, DATED_CURSOR + next_cursor
+        cursor = None
+    elif cursor.startswith(UNDATED_CURSOR):
+        cursor = cursor[len(UNDATED_CURSOR) :]
+    else:
+        raise InvalidCursor("Invalid cursor")
+
+    undated = plans.filter(lesson_date__isnull=True)
+    remaining = limit - len(rows)
+    if not remaining:
+        return rows, UNDATED_CURSOR if undated.exists() else None
+    more, next_cursor = keyset_page(
+        undated, UNDATED_ORDER, cursor=cursor, limit=remaining
+    )
+    return rows + more, UNDATED_CURSOR + next_cursor if next_cursor else None
+
 
 @login_required
 def lesson_plans_view(request):
-    """Lesson plans list view."""
+    """Lesson plans list view (first page; later pages via the API)."""
     # Get all courses for the teacher
-    courses = Course.objects.filter(teacher=request.user)
+    courses = list(Course.objects.filter(teacher=request.user))
 
-    # Get all lesson plans for teacher's courses
-    lesson_plans = (
-        LessonPlan.objects.filter(course__teacher=request.user)
-        .select_related("course")
-        .order_by("-lesson_date", "-created_at")
-    )
+    plans, error = _lesson_plan_filters(request, courses)
+    lesson_plans, next_cursor = [], None
+    if error is None:
+        lesson_plans, next_cursor = _lesson_plan_page(plans)
 
     context = {
         "courses": courses,
         "lesson_plans": lesson_plans,
+        "next_cursor": next_cursor,
+        "filter_error": error,
     }
 
     return render(request, "lessons/lesson_plans.html", context)
+
+
+@login_required
+def lesson_plans_api(request):
+    """
+    Paginated lesson plan list for the current teacher.
+    GET ?course=&status=&date_from=&date_to=&q=&cursor=&limit=
+    """
+    courses = list(Course.objects.filter(teacher=request.user).only("id"))
+    plans, error = _lesson_plan_filters(request, courses)
+    if error is not None:
+        return JsonResponse({"status": "error", "message": error}, status=400)
+
+    try:
+        limit = int(request.GET.get("limit", LESSON_PLAN_PAGE_SIZE))
+    except ValueError:
+        limit = LESSON_PLAN_PAGE_SIZE
+    limit = max(1, min(limit, LESSON_PLAN_MAX_PAGE_SIZE))
+
+    try:
+        rows, next_cursor = _lesson_plan_page(
+            plans, cursor=request.GET.get("cursor"), limit=limit
+        )
+    except InvalidCursor as e:
+        return JsonResponse({"status": "error", "message": str(e)}, status=400)
+
+    return JsonResponse(
+        {
+            "status": "success",
+            "lesson_plans": [plan.to_summary_dict() for plan in rows],
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+def _teacher_plan(request, plan_id):
+    return LessonPlan.objects.for_teacher(request.user).filter(pk=plan_id).first()
+
+
+def _plan_not_found():
+    return JsonResponse(
+        {"status": "error", "message": "Lesson plan not found"}, status=404
+    )
+
+
+@login_required
+def lesson_plan_revisions_api(request, plan_id):
+    """Revision history of a plan, newest first (metadata only)."""
+    plan = _teacher_plan(request, plan_id)
+    if plan is None:
+        return _plan_not_found()
+    revisions = (
+        LessonPlanRevision.objects.filter(plan=plan)
+        .select_related("author")
+        .order_by("-number")
+    )
+    return JsonResponse(
+        {
+            "status": "success",
+            "plan_id": plan.pk,
+            "revisions": [revision.to_dict() for revision in revisions],
+        }
+    )
+
+
+@login_required
+def lesson_plan_revision_api(request, plan_id, number):
+    """The plan's tracked fields as they were at revision `number`."""
+    plan = _teacher_plan(request, plan_id)
+    if plan is None:
+        return _plan_not_found()
+    state = state_at(plan.pk, number)
+    if state is None:
+        return JsonResponse(
+            {"status": "error", "message": "Revision not found"}, status=404
+        )
+    return JsonResponse({"status": "success", "number": number, "plan": state})
+
+
+@login_required
+def restore_lesson_plan_revision_api(request, plan_id, number):
+    """Restore a plan to revision `number`, recorded as a new revision."""
+    if request.method != "POST":
+        return JsonResponse(
+            {"status": "error", "message": "Invalid request method"}, status=405
+        )
+    plan = _teacher_plan(request, plan_id)
+    if plan is None:
+        return _plan_not_found()
+    if not restore_revision(plan, number, author=request.user):
+        return JsonResponse(
+            {"status": "error", "message": "Revision not found"}, status=404
+        )
+    return JsonResponse({"status": "success", "plan": plan.to_dict()})
+
+
+@login_required
+def lesson_plan_curriculum_api(request, plan_id):
+    """
+    GET: the curriculum nodes a plan is linked to.
+    POST node_ids[]: replace the links (an empty list clears them).
+    """
+    plan = _teacher_plan(request, plan_id)
+    if plan is None:
+        return _plan_not_found()
+
+    if request.method == "POST":
+        node_ids = {
+            int(value)
+            for value in request.POST.getlist("node_ids[]")
+            if value.isdigit()
+        }
+        nodes = list(CurriculumNode.objects.filter(pk__in=node_ids, is_active=True))
+        if len(nodes) != len(node_ids):
+            return JsonResponse(
+                {"status": "error", "message": "Unknown curriculum node"}, status=400
+            )
+        plan.curriculum_nodes.set(nodes)
+    elif request.method != "GET":
+        return JsonResponse(
+            {"status": "error", "message": "Invalid request method"}, status=405
+        )
+
+    return JsonResponse(
+        {
+            "status": "success",
+            "plan_id": plan.pk,
+            "curriculum_nodes": [
+                node.to_dict() for node in plan.curriculum_nodes.order_by("code")
+            ],
+        }
+    )
@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import SearchEntry
+
+
+@admin.register(SearchEntry)
+class SearchEntryAdmin(admin.ModelAdmin):
+    list_display = ("kind", "object_id", "heading", "course_id", "is_private")
+    list_filter = ("kind", "is_private")
+    readonly_fields = [field.name for field in SearchEntry._meta.fields]
@@ -0,0 +1,322 @@
+"""
+Full-text search backends.
+
+One interface, two engines, chosen by the default database's vendor:
+- SQLite (local): an FTS5 external-content table over SearchEntry.title /
+  SearchEntry.body, synced by triggers, ranked with bm25() (title matches
+  weigh more) and highlighted with highlight()/snippet().
+- MySQL (PythonAnywhere): a FULLTEXT index on (title, body), boolean-mode
+  MATCH ... AGAINST for relevance; highlighting is done in Python on the
+  page of rows returned.
+
+Both apply the permission filter and the kind filter inside the same
+statement and fetch one row past the page to report has_more, so a page
+costs one query no matter how many rows match. Index DDL lives here too
+and is run by search/migrations/0002_fulltext_index.py.
+
+User input never reaches the MATCH syntax directly: it is split into word
+terms, each quoted (all terms required, the last one as a prefix so partial
+words match while typing).
+"""
+
+import re
+from datetime import timezone as dt_timezone
+from html import escape
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import SearchEntry
+
+MAX_TERMS = 8
+SNIPPET_WORDS = 24
+HIGHLIGHT_OPEN, HIGHLIGHT_CLOSE = "\x02", "\x03"
+
+TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def parse_terms(query):
+    """Lowercased word terms of a user query (at most MAX_TERMS)."""
+    return TERM_RE.findall(query.lower())[:MAX_TERMS]
+
+
+def render_highlight(text):
+    """HTML-escape backend output, turning the markers into <mark> tags."""
+    return (
+        escape(text or "")
+        .replace(HIGHLIGHT_OPEN, "<mark>")
+        .replace(HIGHLIGHT_CLOSE, "</mark>")
+    )
+
+
+class SearchBackend:
+    table = SearchEntry._meta.db_table
+
+    def install(self, cursor):
+        raise NotImplementedError
+
+    def uninstall(self, cursor):
+        raise NotImplementedError
+
+    def optimize(self):
+        """Merge index segments after a bulk rebuild (optional)."""
+
+    def search(self, user, query, kinds=None, offset=0, limit=20):
+        """
+        Return (hits, has_more) for the page [offset, offset + limit).
+        Each hit is a dict with kind, id, container_id, heading, course_id,
+        created_at, score, and HTML-safe `title` / `snippet` with <mark> tags.
+        """
+        terms = parse_terms(query)
+        if not terms:
+            return [], False
+        where, params = self._filters(user, kinds)
+        rows = self._query(terms, where, params, offset, limit + 1)
+        hits = [self._hit(row, terms) for row in rows[:limit]]
+        return hits, len(rows) > limit
+
+    def filter_objects(self, queryset, kind, query):
+        """
+        Narrow a queryset of `kind` objects to those matching `query`, as a
+        subquery, so callers keep their own filters, ordering and paging.
+        """
+        terms = parse_terms(query)
+        if not terms:
+            return queryset.none()
+        sql, params = self._object_ids_sql(terms, kind)
+        return queryset.filter(pk__in=RawSQL(sql, params))
+
+    def _object_ids_sql(self, terms, kind):
+        raise NotImplementedError
+
+    def _filters(self, user, kinds):
+        """SQL conditions on alias `e` for the kind and permission filters."""
+        from dashboard.models import Course
+
+        where, params = [], []
+        if kinds:
+            where.append(f"e.kind IN ({', '.join(['%s'] * len(kinds))})")
+            params.extend(kinds)
+        if not user.is_superuser:
+            course_ids = list(
+                Course.objects.filter(teacher=user).values_list("pk", flat=True)
+            )
+            shared = "e.course_id IS NULL"
+            if course_ids:
+                shared = (
+                    f"(e.course_id IS NULL OR e.course_id IN "
+                    f"({', '.join(['%s'] * len(course_ids))}))"
+                )
+            where.append(f"(e.owner_id = %s OR (e.is_private = %s AND {shared}))")
+            params.extend([user.pk, False, *course_ids])
+        return where, params
+
+    def _query(self, terms, where, params, offset, limit):
+        raise NotImplementedError
+
+    def _hit(self, row, terms):
+        raise NotImplementedError
+
+
+class SQLiteFTS5Backend(SearchBackend):
+    fts_table = f"{SearchEntry._meta.db_table}_fts"
+    # bm25() weights for (title, body)
+    weights = (4.0, 1.0)
+
+    def install(self, cursor):
+        fts, table = self.fts_table, self.table
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"title, body, content='{table}', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2')"
+        )
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {fts}(rowid, title, body) "
+            f"VALUES (new.id, new.title, new.body); END"
+        )
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, title, body) "
+            f"VALUES ('delete', old.id, old.title, old.body); END"
+        )
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF title, body "
+            f"ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, title, body) "
+            f"VALUES ('delete', old.id, old.title, old.body); "
+            f"INSERT INTO {fts}(rowid, title, body) "
+            f"VALUES (new.id, new.title, new.body); END"
+        )
+        # Index whatever is already in the table
+        cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+    def uninstall(self, cursor):
+        fts = self.fts_table
+        for suffix in ("ai", "ad", "au"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+        cursor.execute(f"DROP TABLE IF EXISTS {fts}")
+
+    def optimize(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {self.fts_table}({self.fts_table}) VALUES ('optimize')"
+            )
+
+    def _match(self, terms):
+        quoted = [f'"{term}"' for term in terms]
+        quoted[-1] += "*"
+        return " ".join(quoted)
+
+    def _object_ids_sql(self, terms, kind):
+        fts = self.fts_table
+        return (
+            f"SELECT e.object_id FROM {fts} JOIN {self.table} e "
+            f"ON e.id = {fts}.rowid WHERE {fts} MATCH %s AND e.kind = %s",
+            [self._match(terms), kind],
+        )
+
+    def _query(self, terms, where, params, offset, limit):
+        fts = self.fts_table
+        marks = [HIGHLIGHT_OPEN, HIGHLIGHT_CLOSE]
+        sql = (
+            f"SELECT e.kind, e.object_id, e.container_id, e.heading, e.course_id, "
+            f"e.created_at, highlight({fts}, 0, %s, %s), "
+            f"snippet({fts}, 1, %s, %s, %s, {SNIPPET_WORDS}), "
+            f"bm25({fts}, {self.weights[0]}, {self.weights[1]}) AS score "
+            f"FROM {fts} JOIN {self.table} e ON e.id = {fts}.rowid "
+            f"WHERE {' AND '.join([f'{fts} MATCH %s', *where])} "
+            f"ORDER BY score, e.id LIMIT %s OFFSET %s"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql,
+                [*marks, *marks, "…", self._match(terms), *params, limit, offset],
+            )
+            return cursor.fetchall()
+
+    def _hit(self, row, terms):
+        kind, object_id, container_id, heading, course_id, created_at = row[:6]
+        title, snippet, score = row[6:]
+        return {
+            "kind": kind,
+            "id": object_id,
+            "container_id": container_id,
+            "heading": heading,
+            "course_id": course_id,
+            "created_at": _isoformat(created_at),
+            "title": render_highlight(title),
+            "snippet": render_highlight(snippet),
+            # bm25() is lower-is-better; flip it so higher means more relevant
+            "score": round(-score, 4),
+        }
+
+
+class MySQLFulltextBackend(SearchBackend):
+    index_name = "search_entry_fulltext"
+
+    def install(self, cursor):
+        cursor.execute(
+            f"ALTER TABLE {self.table} "
+            f"ADD FULLTEXT INDEX {self.index_name} (title, body)"
+        )
+
+    def uninstall(self, cursor):
+        cursor.execute(f"ALTER TABLE {self.table} DROP INDEX {self.index_name}")
+
+    def _against(self, terms):
+        # Terms are \w+ only, so no boolean-mode operators can sneak in.
+        # InnoDB ignores terms shorter than innodb_ft_min_token_size (3).
+        required = [f"+{term}" for term in terms]
+        required[-1] += "*"
+        return " ".join(required)
+
+    def _object_ids_sql(self, terms, kind):
+        return (
+            f"SELECT e.object_id FROM {self.table} e "
+            f"WHERE MATCH(e.title, e.body) AGAINST (%s IN BOOLEAN MODE) "
+            f"AND e.kind = %s",
+            [self._against(terms), kind],
+        )
+
+    def _query(self, terms, where, params, offset, limit):
+        against = self._against(terms)
+        match = "MATCH(e.title, e.body) AGAINST (%s IN BOOLEAN MODE)"
+        sql = (
+            f"SELECT e.kind, e.object_id, e.container_id, e.heading, e.course_id, "
+            f"e.created_at, e.title, e.body, {match} AS score "
+            f"FROM {self.table} e "
+            f"WHERE {' AND '.join([match, *where])} "
+            f"ORDER BY score DESC, e.id LIMIT %s OFFSET %s"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [against, against, *params, limit, offset])
+            return cursor.fetchall()
+
+    def _hit(self, row, terms):
+        kind, object_id, container_id, heading, course_id, created_at = row[:6]
+        title, body, score = row[6:]
+        return {
+            "kind": kind,
+            "id": object_id,
+            "container_id": container_id,
+            "heading": heading,
+            "course_id": course_id,
+            "created_at": _isoformat(created_at),
+            "title": render_highlight(_mark_terms(title, terms)),
+            "snippet": render_highlight(_snippet(body, terms)),
+            "score": round(float(score), 4),
+        }
+
+
+def _isoformat(value):
+    # Raw SQLite cursors return datetimes as text (stored in UTC)
+    if isinstance(value, str):
+        value = parse_datetime(value)
+        if value is not None and timezone.is_naive(value):
+            value = timezone.make_aware(value, dt_timezone.utc)
+    return value.isoformat() if value else None
+
+
+def _term_pattern(terms):
+    # Whole words, the last term as a prefix (mirrors the MATCH query)
+    alternatives = [rf"{re.escape(term)}\w*" for term in terms]
+    return re.compile(rf"\b(?:{'|'.join(alternatives)})", re.IGNORECASE)
+
+
+def _mark_terms(text, terms):
+    return _term_pattern(terms).sub(
+        lambda m: f"{HIGHLIGHT_OPEN}{m.group(0)}{HIGHLIGHT_CLOSE}", text or ""
+    )
+
+
+def _snippet(text, terms):
+    """About SNIPPET_WORDS words of `text` around the first matching term."""
+    words = (text or "").split()
+    pattern = _term_pattern(terms)
+    first = next((i for i, word in enumerate(words) if pattern.search(word)), 0)
+    start = max(0, first - SNIPPET_WORDS // 3)
+    window = words[start : start + SNIPPET_WORDS]
+    snippet = " ".join(window)
+    if start > 0:
+        snippet = "…" + snippet
+    if start + SNIPPET_WORDS < len(words):
+        snippet += "…"
+    return _mark_terms(snippet, terms)
+
+
+BACKENDS = {
+    "sqlite": SQLiteFTS5Backend,
+    "mysql": MySQLFulltextBackend,
+}
+
+
+def get_backend(vendor=None):
+    vendor = vendor or connection.vendor
+    try:
+        return BACKENDS[vendor]()
+    except KeyError:
+        raise ImproperlyConfigured(f"No full-text search backend for {vendor}")
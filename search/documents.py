@@ -0,0 +1,220 @@
+"""
+How each searchable model is flattened into SearchEntry rows.
+
+Every kind is one values() query (joins included), so the same code indexes
+a single object from a signal and streams a whole table for a rebuild.
+"""
+
+from django.db import transaction
+
+from action_center.models import ForumTopic
+from forums.models import Discussion, Post
+from lessons.models import LessonPlan
+from students.models import TeacherObservation
+
+from .models import SearchEntry
+
+REBUILD_CHUNK_SIZE = 1000
+
+
+class Source:
+    def __init__(self, kind, model, fields, build):
+        self.kind = kind
+        self.model = model
+        self.fields = ("pk",) + fields
+        self.build = build
+
+    def rows(self, pks=None):
+        queryset = self.model.objects.order_by().values(*self.fields)
+        if pks is not None:
+            queryset = queryset.filter(pk__in=pks)
+        return queryset
+
+    def entry(self, row):
+        return SearchEntry(kind=self.kind, object_id=row["pk"], **self.build(row))
+
+
+def _post(row):
+    return {
+        "container_id": row["discussion_id"],
+        "title": "",
+        "body": row["body"],
+        "heading": row["discussion__title"],
+        "owner_id": row["author_user_id"],
+        "course_id": row["discussion__forum__course_id"],
+        "is_private": False,
+        "created_at": row["created_at"],
+    }
+
+
+def _discussion(row):
+    return {
+        "container_id": row["forum_id"],
+        "title": row["title"],
+        "body": "",
+        "heading": row["forum__name"],
+        "owner_id": row["author_user_id"],
+        "course_id": row["forum__course_id"],
+        "is_private": False,
+        "created_at": row["created_at"],
+    }
+
+
+def _topic(row):
+    return {
+        "container_id": row["course_id"],
+        "title": row["title"],
+        "body": row["content"],
+        "heading": row["course__name"],
+        "owner_id": row["author_id"],
+        "course_id": row["course_id"],
+        "is_private": False,
+        "created_at": row["created_at"],
+    }
+
+
+def _observation(row):
+    return {
+        "container_id": row["student_id"],
+        "title": "",
+        "body": row["text"],
+        "heading": f"{row['student__first_name']} {row['student__last_name']}",
+        "owner_id": row["teacher_id"],
+        "course_id": row["course_id"],
+        "is_private": True,
+        "created_at": row["created_at"],
+    }
+
+
+def _lesson_plan(row):
+    return {
+        "container_id": row["course_id"],
+        "title": row["title"],
+        "body": "\n".join(
+            text
+            for text in (row["objectives"], row["content"], row["materials"])
+            if text
+        ),
+        "heading": row["course__name"],
+        "owner_id": row["course__teacher_id"],
+        "course_id": row["course_id"],
+        "is_private": True,
+        "created_at": row["created_at"],
+    }
+
+
+SOURCES = {
+    SearchEntry.KIND_POST: Source(
+        SearchEntry.KIND_POST,
+        Post,
+        (
+            "discussion_id",
+            "body",
+            "author_user_id",
+            "created_at",
+            "discussion__title",
+            "discussion__forum__course_id",
+        ),
+        _post,
+    ),
+    SearchEntry.KIND_DISCUSSION: Source(
+        SearchEntry.KIND_DISCUSSION,
+        Discussion,
+        (
+            "forum_id",
+            "title",
+            "author_user_id",
+            "created_at",
+            "forum__name",
+            "forum__course_id",
+        ),
+        _discussion,
+    ),
+    SearchEntry.KIND_TOPIC: Source(
+        SearchEntry.KIND_TOPIC,
+        ForumTopic,
+        ("course_id", "title", "content", "author_id", "created_at", "course__name"),
+        _topic,
+    ),
+    SearchEntry.KIND_OBSERVATION: Source(
+        SearchEntry.KIND_OBSERVATION,
+        TeacherObservation,
+        (
+            "student_id",
+            "text",
+            "teacher_id",
+            "course_id",
+            "created_at",
+            "student__first_name",
+            "student__last_name",
+        ),
+        _observation,
+    ),
+    SearchEntry.KIND_LESSON_PLAN: Source(
+        SearchEntry.KIND_LESSON_PLAN,
+        LessonPlan,
+        (
+            "course_id",
+            "title",
+            "objectives",
+            "content",
+            "materials",
+            "created_at",
+            "course__name",
+            "course__teacher_id",
+        ),
+        _lesson_plan,
+    ),
+}
+
+
+def index_object(kind, pk):
+    """Create, refresh or drop the entry for one object."""
+    source = SOURCES[kind]
+    row = source.rows([pk]).first()
+    if row is None:
+        remove_object(kind, pk)
+        return
+    SearchEntry.objects.update_or_create(
+        kind=kind, object_id=pk, defaults=source.build(row)
+    )
+
+
+def index_objects(kind, pks, chunk_size=REBUILD_CHUNK_SIZE):
+    """Bulk (re)index many objects of one kind, e.g. after bulk_create()."""
+    source = SOURCES[kind]
+    pks = list(pks)
+    for start in range(0, len(pks), chunk_size):
+        chunk = pks[start : start + chunk_size]
+        SearchEntry.objects.filter(kind=kind, object_id__in=chunk).delete()
+        SearchEntry.objects.bulk_create(
+            [source.entry(row) for row in source.rows(chunk)]
+        )
+
+
+def remove_object(kind, pk):
+    SearchEntry.objects.filter(kind=kind, object_id=pk).delete()
+
+
+@transaction.atomic
+def rebuild(kinds=None, chunk_size=REBUILD_CHUNK_SIZE):
+    """
+    Replace every entry of `kinds` (default: all) from the source tables.
+    Returns {kind: entries written}.
+    """
+    written = {}
+    for kind in kinds or SOURCES:
+        source = SOURCES[kind]
+        SearchEntry.objects.filter(kind=kind).delete()
+        batch = []
+        written[kind] = 0
+        for row in source.rows().iterator(chunk_size=chunk_size):
+            batch.append(source.entry(row))
+            if len(batch) >= chunk_size:
+                SearchEntry.objects.bulk_create(batch)
+                written[kind] += len(batch)
+                batch = []
+        if batch:
+            SearchEntry.objects.bulk_create(batch)
+            written[kind] += len(batch)
+    return written
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.30 on 2026-10-19 02:59
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('post', 'Forum Post'), ('discussion', 'Discussion'), ('topic', 'Course Topic'), ('observation', 'Teacher Observation')], max_length=20)),
+                ('object_id', models.PositiveIntegerField()),
+                ('container_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('title', models.CharField(blank=True, max_length=255)),
+                ('body', models.TextField(blank=True)),
+                ('heading', models.CharField(blank=True, max_length=255)),
+                ('course_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('is_private', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField()),
+                ('owner', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Search Entry',
+                'verbose_name_plural': 'Search Entries',
+                'indexes': [models.Index(fields=['kind', 'container_id'], name='search_sear_kind_c61f2e_idx'), models.Index(fields=['course_id'], name='search_sear_course__e1cf68_idx'), models.Index(fields=['owner'], name='search_sear_owner_i_729bb3_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='searchentry',
+            constraint=models.UniqueConstraint(fields=('kind', 'object_id'), name='search_entry_unique_object'),
+        ),
+    ]
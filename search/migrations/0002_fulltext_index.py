@@ -0,0 +1,30 @@
+from django.db import migrations
+
+from search.backends import BACKENDS
+
+
+def install_index(apps, schema_editor):
+    backend = BACKENDS.get(schema_editor.connection.vendor)
+    if backend is None:
+        return
+    with schema_editor.connection.cursor() as cursor:
+        backend().install(cursor)
+
+
+def uninstall_index(apps, schema_editor):
+    backend = BACKENDS.get(schema_editor.connection.vendor)
+    if backend is None:
+        return
+    with schema_editor.connection.cursor() as cursor:
+        backend().uninstall(cursor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("search", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(install_index, uninstall_index),
+    ]
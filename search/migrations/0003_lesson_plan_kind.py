@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0002_fulltext_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='searchentry',
+            name='kind',
+            field=models.CharField(choices=[('post', 'Forum Post'), ('discussion', 'Discussion'), ('topic', 'Course Topic'), ('observation', 'Teacher Observation'), ('lesson_plan', 'Lesson Plan')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,72 @@
+from django.conf import settings
+from django.db import models
+
+
+class SearchEntry(models.Model):
+    """
+    One searchable document: a forum post, discussion, course topic, teacher
+    observation or lesson plan, flattened into title/body text plus the
+    columns the permission filter needs.
+
+    The full-text index itself is backend specific (see search.backends):
+    an FTS5 external-content table kept in step by triggers on SQLite, a
+    FULLTEXT index on (title, body) on MySQL. Rows are written by
+    search.signals and rebuilt by `manage.py rebuild_search_index`.
+    """
+
+    KIND_POST = "post"
+    KIND_DISCUSSION = "discussion"
+    KIND_TOPIC = "topic"
+    KIND_OBSERVATION = "observation"
+    KIND_LESSON_PLAN = "lesson_plan"
+    KIND_CHOICES = [
+        (KIND_POST, "Forum Post"),
+        (KIND_DISCUSSION, "Discussion"),
+        (KIND_TOPIC, "Course Topic"),
+        (KIND_OBSERVATION, "Teacher Observation"),
+        (KIND_LESSON_PLAN, "Lesson Plan"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveIntegerField()
+    # Discussion for posts, forum for discussions, course for topics and
+    # lesson plans, student for observations
+    container_id = models.PositiveIntegerField(null=True, blank=True)
+
+    # Indexed text
+    title = models.CharField(max_length=255, blank=True)
+    body = models.TextField(blank=True)
+    # Display only (e.g. the discussion a post belongs to), not indexed
+    heading = models.CharField(max_length=255, blank=True)
+
+    # Permission filter: private rows are only visible to their owner,
+    # course rows to that course's teacher, the rest to every teacher
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_constraint=False,
+        related_name="+",
+    )
+    course_id = models.PositiveIntegerField(null=True, blank=True)
+    is_private = models.BooleanField(default=False)
+
+    created_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Search Entry"
+        verbose_name_plural = "Search Entries"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id"], name="search_entry_unique_object"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["kind", "container_id"]),
+            models.Index(fields=["course_id"]),
+            models.Index(fields=["owner"]),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.object_id}"
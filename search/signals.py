@@ -0,0 +1,103 @@
+"""
+Signal receivers that keep SearchEntry rows in step with the source tables.
+
+Saving or deleting an indexed object rewrites its own entry (the backend's
+full-text index follows through triggers / FULLTEXT maintenance). Changes
+to the rows an entry copies from (forum course, discussion title, course
+name and teacher, student names) are pushed down with one UPDATE each.
+QuerySet.update() and bulk_create() send no signals; run
+`manage.py rebuild_search_index` after bulk imports.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from action_center.models import ForumTopic
+from dashboard.models import Course
+from forums.models import Discussion, Forum, Post
+from lessons.models import LessonPlan
+from students.models import Student, TeacherObservation
+
+from .documents import index_object, remove_object
+from .models import SearchEntry
+
+INDEXED_MODELS = {
+    Post: SearchEntry.KIND_POST,
+    Discussion: SearchEntry.KIND_DISCUSSION,
+    ForumTopic: SearchEntry.KIND_TOPIC,
+    TeacherObservation: SearchEntry.KIND_OBSERVATION,
+    LessonPlan: SearchEntry.KIND_LESSON_PLAN,
+}
+
+
+def _indexed_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    index_object(INDEXED_MODELS[sender], instance.pk)
+
+
+def _indexed_deleted(sender, instance, **kwargs):
+    remove_object(INDEXED_MODELS[sender], instance.pk)
+
+
+for _model in INDEXED_MODELS:
+    post_save.connect(
+        _indexed_saved, sender=_model, dispatch_uid=f"search.index.{_model.__name__}"
+    )
+    post_delete.connect(
+        _indexed_deleted, sender=_model, dispatch_uid=f"search.remove.{_model.__name__}"
+    )
+
+
+@receiver(post_save, sender=Discussion, dispatch_uid="search.discussion_heading")
+def discussion_heading(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    SearchEntry.objects.filter(
+        kind=SearchEntry.KIND_POST, container_id=instance.pk
+    ).exclude(heading=instance.title).update(heading=instance.title)
+
+
+@receiver(post_save, sender=Forum, dispatch_uid="search.forum_scope")
+def forum_scope(sender, instance, created=False, raw=False, **kwargs):
+    if raw or created:
+        return
+    discussions = SearchEntry.objects.filter(
+        kind=SearchEntry.KIND_DISCUSSION, container_id=instance.pk
+    )
+    discussions.exclude(heading=instance.name).update(heading=instance.name)
+    posts = SearchEntry.objects.filter(
+        kind=SearchEntry.KIND_POST,
+        container_id__in=Discussion.objects.filter(forum=instance).values("pk"),
+    )
+    for entries in (discussions, posts):
+        if instance.course_id is None:
+            entries.filter(course_id__isnull=False).update(course_id=None)
+        else:
+            entries.exclude(course_id=instance.course_id).update(
+                course_id=instance.course_id
+            )
+
+
+@receiver(post_save, sender=Course, dispatch_uid="search.course_heading")
+def course_heading(sender, instance, created=False, raw=False, **kwargs):
+    if raw or created:
+        return
+    entries = SearchEntry.objects.filter(
+        kind__in=[SearchEntry.KIND_TOPIC, SearchEntry.KIND_LESSON_PLAN],
+        container_id=instance.pk,
+    )
+    entries.exclude(heading=instance.name).update(heading=instance.name)
+    # Lesson plans belong to whoever teaches the course
+    entries.filter(kind=SearchEntry.KIND_LESSON_PLAN).exclude(
+        owner_id=instance.teacher_id
+    ).update(owner_id=instance.teacher_id)
+
+
+@receiver(post_save, sender=Student, dispatch_uid="search.student_heading")
+def student_heading(sender, instance, created=False, raw=False, **kwargs):
+    if raw or created:
+        return
+    SearchEntry.objects.filter(
+        kind=SearchEntry.KIND_OBSERVATION, container_id=instance.pk
+    ).exclude(heading=instance.full_name).update(heading=instance.full_name)
@@ -0,0 +1,62 @@
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+
+from .backends import get_backend, parse_terms
+from .models import SearchEntry
+
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE_SIZE = 50
+# Deep offsets make the engine rank and skip every earlier match
+SEARCH_MAX_PAGE = 50
+
+
+def _int_param(request, name, default, low, high):
+    try:
+        value = int(request.GET.get(name, default))
+    except ValueError:
+        value = default
+    return max(low, min(value, high))
+
+
+@login_required
+def search_api(request):
+    """
+    Ranked full-text search over forum posts, discussions, course topics and
+    the teacher's own observations.
+
+    GET ?q=allegory cave&types=post,discussion&page=1&page_size=20
+    Results carry HTML-escaped `title` / `snippet` with <mark> highlights.
+    """
+    query = request.GET.get("q", "").strip()
+    if not parse_terms(query):
+        return JsonResponse(
+            {"status": "error", "message": "Search query is required"}, status=400
+        )
+
+    valid_kinds = {kind for kind, _ in SearchEntry.KIND_CHOICES}
+    kinds = [kind for kind in request.GET.get("types", "").split(",") if kind]
+    if any(kind not in valid_kinds for kind in kinds):
+        return JsonResponse(
+            {"status": "error", "message": "Invalid search type"}, status=400
+        )
+
+    page = _int_param(request, "page", 1, 1, SEARCH_MAX_PAGE)
+    page_size = _int_param(
+        request, "page_size", SEARCH_PAGE_SIZE, 1, SEARCH_MAX_PAGE_SIZE
+    )
+    results, has_more = get_backend().search(
+        request.user,
+        query,
+        kinds=kinds,
+        offset=(page - 1) * page_size,
+        limit=page_size,
+    )
+    return JsonResponse(
+        {
+            "status": "success",
+            "query": query,
+            "results": results,
+            "page": page,
+            "has_more": has_more and page < SEARCH_MAX_PAGE,
+        }
+    )
@@ -1,12 +1,15 @@
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render
 
+from action_center.models import UserCounters
+
 
 @login_required
 def settings_view(request):
     """Settings page view."""
     context = {
         "user": request.user,
+        "unread_messages": UserCounters.for_user(request.user).unread_messages,
     }
 
     return render(request, "settings/settings.html", context)
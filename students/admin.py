@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db import transaction
 from .models import (
     Student,
     StudentNote,
@@ -7,6 +8,7 @@ from .models import (
     AttendanceRecord,
     TeacherObservation,
     Task,
+    Friendship,
 )
 
 
@@ -108,3 +110,32 @@ class StudentNoteAdmin(admin.ModelAdmin):
     list_filter = ["teacher", "created_at"]
     search_fields = ["student__first_name", "student__last_name", "text"]
     ordering = ["-created_at"]
+
+
+@admin.register(Friendship)
+class FriendshipAdmin(admin.ModelAdmin):
+    """
+    View and delete only: friendships are edited through the student
+    friends API, and deletes go through Friendship.disconnect() so both
+    directions go and the cached group graphs are dropped.
+    """
+
+    list_display = ["student", "friend", "created_at"]
+    search_fields = ["student__first_name", "student__last_name"]
+    raw_id_fields = ["student", "friend"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def delete_model(self, request, obj):
+        Friendship.disconnect(obj.student_id, obj.friend_id)
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic():
+            for student_id, friend_id in queryset.values_list(
+                "student_id", "friend_id"
+            ):
+                Friendship.disconnect(student_id, friend_id)
@@ -1,10 +1,16 @@
 # API views for students app
 from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
-from .models import Student
+from django.views.decorators.http import require_http_methods
+from .models import Friendship, Student
+from .social_graph import group_graph_summary
+from cadmus.metrics import observe_rows
+from cadmus.routers import use_replica
+from dashboard.models import Course, Group
 
 
 @login_required
+@use_replica
 def top_students_api(request):
     """API endpoint to get top 10 students by average grade."""
     # Get top 10 students ordered by average grade
@@ -12,5 +18,71 @@ def top_students_api(request):
 
     # Serialize to JSON
     students_data = [student.to_dict() for student in top_students]
+    observe_rows("top_students_api", len(students_data))
 
     return JsonResponse(students_data, safe=False)
+
+
+@login_required
+def group_social_graph_api(request, group_id):
+    """
+    Friendship graph analytics for a group: per-student degree and
+    component, isolated students, components and suggested tutor pairs.
+    """
+    if not Group.objects.filter(pk=group_id).exists():
+        return JsonResponse(
+            {"status": "error", "message": "Group not found"}, status=404
+        )
+    return JsonResponse(
+        {"status": "success", "group_id": group_id, **group_graph_summary(group_id)}
+    )
+
+
+def _can_edit_friends(user, student):
+    """Staff, school admins and the teachers of the student's courses."""
+    if user.is_school_admin:
+        return True
+    return Course.objects.filter(teacher=user, students=student).exists()
+
+
+@login_required
+@require_http_methods(["GET", "POST"])
+def student_friends_api(request, student_id):
+    """
+    GET: a student's friends. POST ids[]: replace them (an empty list clears
+    them); friendships are symmetric, so the friends' lists change too.
+    Only staff and the student's teachers may POST.
+    """
+    student = Student.objects.filter(pk=student_id).first()
+    if student is None:
+        return JsonResponse(
+            {"status": "error", "message": "Student not found"}, status=404
+        )
+
+    if request.method == "POST":
+        if not _can_edit_friends(request.user, student):
+            return JsonResponse(
+                {"status": "error", "message": "Permission denied"}, status=403
+            )
+        friend_ids = {
+            int(value) for value in request.POST.getlist("ids[]") if value.isdigit()
+        }
+        if Student.objects.filter(pk__in=friend_ids).count() != len(friend_ids):
+            return JsonResponse(
+                {"status": "error", "message": "Unknown student"}, status=400
+            )
+        Friendship.set_friends(student.pk, friend_ids)
+
+    friends = Student.objects.filter(friendships__friend=student).order_by(
+        "last_name", "first_name"
+    )
+    return JsonResponse(
+        {
+            "status": "success",
+            "student_id": student.pk,
+            "friends": [
+                {"id": friend.pk, "name": friend.full_name, "group_id": friend.group_id}
+                for friend in friends
+            ],
+        }
+    )
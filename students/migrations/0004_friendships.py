@@ -0,0 +1,60 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def copy_social_circles(apps, schema_editor):
+    """One symmetric edge pair per id listed in social_circle (either side)."""
+    Student = apps.get_model('students', 'Student')
+    Friendship = apps.get_model('students', 'Friendship')
+    known = set(Student.objects.values_list('pk', flat=True))
+    edges = set()
+    rows = Student.objects.exclude(social_circle='').values_list('pk', 'social_circle')
+    for pk, social_circle in rows.iterator():
+        for value in social_circle.split(','):
+            value = value.strip()
+            if value.isdigit() and int(value) in known and int(value) != pk:
+                edges.add((pk, int(value)))
+                edges.add((int(value), pk))
+    Friendship.objects.bulk_create(
+        [Friendship(student_id=a, friend_id=b) for a, b in sorted(edges)],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0003_interest_student_interests_json_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='student',
+            name='social_circle',
+            field=models.TextField(blank=True, help_text='Comma-separated student IDs (friends, legacy: see Friendship)'),
+        ),
+        migrations.CreateModel(
+            name='Friendship',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('friend', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='students.student')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='friendships', to='students.student')),
+            ],
+            options={
+                'verbose_name': 'Friendship',
+                'verbose_name_plural': 'Friendships',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='friendship',
+            constraint=models.UniqueConstraint(fields=('student', 'friend'), name='students_friendship_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='friendship',
+            constraint=models.CheckConstraint(check=models.Q(('student', models.F('friend')), _negated=True), name='students_friendship_not_self'),
+        ),
+        migrations.RunPython(copy_social_circles, migrations.RunPython.noop),
+    ]
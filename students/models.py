@@ -7,6 +7,7 @@ Based on the Student Profile UI, this module contains:
 - Grade: Individual grades with numeric (0-20) and letter values
 - AttendanceRecord: Monthly attendance snapshots for charts
 - TeacherObservation: Timestamped teacher notes (alias for StudentNote)
+- Friendship: Symmetric friendship edges (replaces Student.social_circle)
 
 Peruvian Grading System (0-20):
 - AD (Logro Destacado): 18-20
@@ -15,7 +16,7 @@ Peruvian Grading System (0-20):
 - C (En Inicio): 0-10
 """
 
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 
 
@@ -144,7 +145,8 @@ class Student(models.Model):
         help_text='Legacy JSON format: {"music": ["K-Pop"], "sports": ["Soccer"]}',
     )
     social_circle = models.TextField(
-        blank=True, help_text="Comma-separated student IDs (friends)"
+        blank=True,
+        help_text="Comma-separated student IDs (friends, legacy: see Friendship)",
     )
 
     # Academic metrics
@@ -274,6 +276,102 @@ class Student(models.Model):
         return []
 
 
+# ============================================
+# FRIENDSHIP (Symmetric Edge Table)
+# ============================================
+
+
+class Friendship(models.Model):
+    """
+    One direction of a friendship between two students.
+
+    Friendships are symmetric and stored as two rows (a -> b and b -> a),
+    so "friends of X" is a single lookup on the (student, friend) unique
+    index and a group's whole graph is one query (students.social_graph).
+    Always write through connect() / disconnect() / set_friends(), which
+    keep both directions in step and drop the cached group graphs.
+    """
+
+    student = models.ForeignKey(
+        Student, on_delete=models.CASCADE, related_name="friendships"
+    )
+    friend = models.ForeignKey(Student, on_delete=models.CASCADE, related_name="+")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Friendship"
+        verbose_name_plural = "Friendships"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["student", "friend"], name="students_friendship_unique"
+            ),
+            models.CheckConstraint(
+                check=~models.Q(student=models.F("friend")),
+                name="students_friendship_not_self",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.student_id} <-> {self.friend_id}"
+
+    @classmethod
+    def _invalidate(cls, student_ids):
+        from .social_graph import invalidate_group_graphs
+
+        group_ids = set(
+            Student.objects.filter(pk__in=student_ids).values_list(
+                "group_id", flat=True
+            )
+        )
+        transaction.on_commit(lambda: invalidate_group_graphs(group_ids))
+
+    @classmethod
+    def connect(cls, student_id, friend_id):
+        """Make two students friends (both directions); no-op if already."""
+        if student_id == friend_id:
+            return
+        cls.objects.bulk_create(
+            [
+                cls(student_id=student_id, friend_id=friend_id),
+                cls(student_id=friend_id, friend_id=student_id),
+            ],
+            ignore_conflicts=True,
+        )
+        cls._invalidate([student_id, friend_id])
+
+    @classmethod
+    def disconnect(cls, student_id, friend_id):
+        cls.objects.filter(
+            models.Q(student_id=student_id, friend_id=friend_id)
+            | models.Q(student_id=friend_id, friend_id=student_id)
+        ).delete()
+        cls._invalidate([student_id, friend_id])
+
+    @classmethod
+    def set_friends(cls, student_id, friend_ids):
+        """Replace a student's friends with `friend_ids` (ids of students)."""
+        friend_ids = set(friend_ids) - {student_id}
+        current = set(
+            cls.objects.filter(student_id=student_id).values_list(
+                "friend_id", flat=True
+            )
+        )
+        removed, added = current - friend_ids, friend_ids - current
+        with transaction.atomic():
+            if removed:
+                cls.objects.filter(
+                    models.Q(student_id=student_id, friend_id__in=removed)
+                    | models.Q(student_id__in=removed, friend_id=student_id)
+                ).delete()
+            cls.objects.bulk_create(
+                [cls(student_id=student_id, friend_id=pk) for pk in added]
+                + [cls(student_id=pk, friend_id=student_id) for pk in added],
+                ignore_conflicts=True,
+            )
+        if removed or added:
+            cls._invalidate({student_id} | removed | added)
+
+
 # ============================================
 # GRADE (Numeric 0-20 + Letter)
 # ============================================
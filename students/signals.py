@@ -0,0 +1,39 @@
+"""
+Drop a group's cached friendship graph (students.social_graph) when one of
+its students is saved (grade, name or group may have changed) or deleted.
+A student moved to another group drops both graphs: the group it had when
+the save started is remembered in pre_save. Friendship rows invalidate
+through their own write helpers.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Student
+from .social_graph import invalidate_group_graphs
+
+
+@receiver(pre_save, sender=Student, dispatch_uid="students.graph_student_saving")
+def remember_group(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._previous_group_id = None
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and not {"group", "group_id"} & update_fields:
+        return
+    instance._previous_group_id = (
+        Student.objects.filter(pk=instance.pk)
+        .values_list("group_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Student, dispatch_uid="students.graph_student_saved")
+@receiver(post_delete, sender=Student, dispatch_uid="students.graph_student_deleted")
+def student_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    group_ids = {instance.group_id, getattr(instance, "_previous_group_id", None)}
+    group_ids.discard(None)
+    if group_ids:
+        transaction.on_commit(lambda: invalidate_group_graphs(group_ids))
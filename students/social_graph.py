@@ -0,0 +1,156 @@
+"""
+Friendship graph analytics per group.
+
+A group's graph is loaded with two queries (its students, then the
+Friendship rows between them) into compact arrays in CSR form: student i's
+friends are neighbours[offsets[i]:offsets[i + 1]], as indexes into the
+student arrays. analyze() then walks it once to get degrees, isolated
+students, connected components and tutor candidates, and pairs every
+at-risk student with the strongest available friend.
+
+Results are cached per group and dropped when friendships or the group's
+students change (Friendship write helpers, students.signals).
+"""
+
+from array import array
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Friendship, Grade, Student
+
+# Same thresholds as Student.is_at_risk and the "A" letter grade
+AT_RISK_GRADE = 11
+TUTOR_MIN_GRADE = 14
+TUTOR_MAX_MENTEES = 2
+
+
+def graph_cache_key(group_id):
+    return f"students:social_graph:{group_id}"
+
+
+def invalidate_group_graphs(group_ids):
+    cache.delete_many(
+        [graph_cache_key(group_id) for group_id in group_ids if group_id is not None]
+    )
+
+
+class GroupGraph:
+    """Students of one group and the friendships among them, as arrays."""
+
+    def __init__(self, students, edges):
+        self.ids = array("q", (student[0] for student in students))
+        self.names = [f"{first} {last}" for _, first, last, _ in students]
+        self.grades = array("d", (student[3] for student in students))
+        index = {pk: position for position, pk in enumerate(self.ids)}
+
+        degree = [0] * len(self.ids)
+        pairs = []
+        for student_id, friend_id in edges:
+            pair = (index[student_id], index[friend_id])
+            degree[pair[0]] += 1
+            pairs.append(pair)
+        self.offsets = array("l", [0])
+        for count in degree:
+            self.offsets.append(self.offsets[-1] + count)
+        self.neighbours = array("l", [0]) * len(pairs)
+        fill = array("l", self.offsets[:-1])
+        for source, target in pairs:
+            self.neighbours[fill[source]] = target
+            fill[source] += 1
+
+    @classmethod
+    def load(cls, group_id):
+        students = list(
+            Student.objects.filter(group_id=group_id)
+            .order_by("id")
+            .values_list("id", "first_name", "last_name", "average_grade")
+        )
+        edges = Friendship.objects.filter(
+            student__group_id=group_id, friend__group_id=group_id
+        ).values_list("student_id", "friend_id")
+        return cls(students, edges)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def friends(self, position):
+        return self.neighbours[self.offsets[position] : self.offsets[position + 1]]
+
+
+def analyze(graph):
+    """
+    Degrees, isolated students, connected components and tutor pairings of
+    a GroupGraph, in one walk over the arrays. JSON-ready.
+    """
+    size = len(graph)
+    component = array("l", [-1]) * size
+    components = []
+    students, at_risk = [], []
+
+    for position in range(size):
+        if component[position] == -1:
+            label, members, stack = len(components), [], [position]
+            component[position] = label
+            while stack:
+                current = stack.pop()
+                members.append(graph.ids[current])
+                for friend in graph.friends(current):
+                    if component[friend] == -1:
+                        component[friend] = label
+                        stack.append(friend)
+            components.append(members)
+
+        grade = graph.grades[position]
+        friends = graph.friends(position)
+        if grade < AT_RISK_GRADE:
+            tutors = sorted(
+                (
+                    friend
+                    for friend in friends
+                    if graph.grades[friend] >= TUTOR_MIN_GRADE
+                ),
+                key=lambda friend: -graph.grades[friend],
+            )
+            at_risk.append((position, tutors))
+        students.append(
+            {
+                "id": graph.ids[position],
+                "name": graph.names[position],
+                "average_grade": round(grade, 1),
+                "letter_grade": Grade.numeric_to_letter(grade),
+                "degree": len(friends),
+                "component": component[position],
+            }
+        )
+
+    # Students with the fewest candidate tutors choose first
+    mentees = [0] * size
+    pairs, unpaired = [], []
+    for position, tutors in sorted(at_risk, key=lambda item: len(item[1])):
+        tutor = next(
+            (tutor for tutor in tutors if mentees[tutor] < TUTOR_MAX_MENTEES), None
+        )
+        if tutor is None:
+            unpaired.append(graph.ids[position])
+            continue
+        mentees[tutor] += 1
+        pairs.append({"student_id": graph.ids[position], "tutor_id": graph.ids[tutor]})
+
+    return {
+        "students": students,
+        "edges": len(graph.neighbours) // 2,
+        "isolated": [student["id"] for student in students if not student["degree"]],
+        "components": sorted(components, key=len, reverse=True),
+        "tutor_pairs": pairs,
+        "unpaired_at_risk": unpaired,
+    }
+
+
+def group_graph_summary(group_id):
+    """analyze() of a group's graph, through the cache."""
+    return cache.get_or_set(
+        graph_cache_key(group_id),
+        lambda: analyze(GroupGraph.load(group_id)),
+        getattr(settings, "SOCIAL_GRAPH_TTL", 300),
+    )
@@ -1,3 +1,121 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from dashboard.models import Course, Group
+
+from .models import Friendship, Student
+from .social_graph import GroupGraph, analyze, graph_cache_key, group_graph_summary
+
+User = get_user_model()
+
+
+def graph(grades, friendships):
+    """GroupGraph of students 1..n with `grades` and symmetric friendships."""
+    students = [
+        (pk, "Student", str(pk), grade) for pk, grade in enumerate(grades, start=1)
+    ]
+    edges = [(a, b) for a, b in friendships] + [(b, a) for a, b in friendships]
+    return GroupGraph(students, edges)
+
+
+class AnalyzeTests(SimpleTestCase):
+    def test_degrees_components_and_isolated(self):
+        result = analyze(graph([15, 12, 13, 16, 12], [(1, 2), (2, 3), (4, 5)]))
+        self.assertEqual([s["degree"] for s in result["students"]], [1, 2, 1, 1, 1])
+        self.assertEqual(result["edges"], 3)
+        self.assertEqual(result["components"], [[1, 2, 3], [4, 5]])
+        self.assertEqual(result["isolated"], [])
+
+        result = analyze(graph([15, 12, 13], [(1, 2)]))
+        self.assertEqual(result["isolated"], [3])
+        self.assertEqual(result["components"], [[1, 2], [3]])
+
+    def test_tutor_pairs(self):
+        # 2 and 3 are at risk; only 1 and 4 are strong enough to tutor, and
+        # 5 has no strong friend
+        result = analyze(graph([15, 9, 10, 18, 8], [(1, 2), (2, 4), (3, 1), (5, 3)]))
+        self.assertCountEqual(
+            result["tutor_pairs"],
+            [{"student_id": 2, "tutor_id": 4}, {"student_id": 3, "tutor_id": 1}],
+        )
+        self.assertEqual(result["unpaired_at_risk"], [5])
+
+    def test_tutors_take_at_most_two_mentees(self):
+        result = analyze(graph([18, 5, 6, 7], [(1, 2), (1, 3), (1, 4)]))
+        self.assertEqual(len(result["tutor_pairs"]), 2)
+        self.assertEqual(len(result["unpaired_at_risk"]), 1)
+
+    def test_empty_group(self):
+        result = analyze(graph([], []))
+        self.assertEqual(result["students"], [])
+        self.assertEqual(result["components"], [])
+
+
+class FriendsApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user("teacher@example.com", "x")
+        cls.other_teacher = User.objects.create_user("other@example.com", "x")
+        cls.student = Student.objects.create(first_name="Ana", last_name="Quispe")
+        cls.friend = Student.objects.create(first_name="Luis", last_name="Mamani")
+        course = Course.objects.create(name="Philosophy", teacher=cls.teacher)
+        course.students.add(cls.student)
+
+    def _post(self, user, ids):
+        self.client.force_login(user)
+        return self.client.post(
+            reverse("students:api_student_friends", args=[self.student.pk]),
+            {"ids[]": ids},
+        )
+
+    def test_teacher_of_the_student_can_replace_friends(self):
+        response = self._post(self.teacher, [self.friend.pk])
+        self.assertEqual(response.status_code, 200)
+        friends = response.json()["friends"]
+        self.assertEqual([friend["id"] for friend in friends], [self.friend.pk])
+        self.assertTrue(
+            Friendship.objects.filter(student=self.friend, friend=self.student).exists()
+        )
+
+    def test_other_teachers_cannot_write(self):
+        response = self._post(self.other_teacher, [self.friend.pk])
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Friendship.objects.exists())
+
+    def test_staff_can_write(self):
+        staff = User.objects.create_user("staff@example.com", "x", is_staff=True)
+        self.assertEqual(self._post(staff, [self.friend.pk]).status_code, 200)
+
+    def test_other_methods_are_rejected(self):
+        self.client.force_login(self.teacher)
+        response = self.client.delete(
+            reverse("students:api_student_friends", args=[self.student.pk])
+        )
+        self.assertEqual(response.status_code, 405)
+
+
+class GraphCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.group_a = Group.objects.create(name="III A")
+        self.group_b = Group.objects.create(name="III B")
+        self.student = Student.objects.create(
+            first_name="Ana", last_name="Quispe", group=self.group_a
+        )
+
+    def test_moving_a_student_drops_both_group_graphs(self):
+        group_graph_summary(self.group_a.pk)
+        group_graph_summary(self.group_b.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.student.group = self.group_b
+            self.student.save()
+
+        self.assertIsNone(cache.get(graph_cache_key(self.group_a.pk)))
+        self.assertIsNone(cache.get(graph_cache_key(self.group_b.pk)))
+        self.assertEqual(
+            [s["id"] for s in group_graph_summary(self.group_b.pk)["students"]],
+            [self.student.pk],
+        )
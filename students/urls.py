@@ -15,4 +15,18 @@ urlpatterns = [
         ).top_students_api(request),
         name="api_top_students",
     ),
+    path(
+        "api/groups/<int:group_id>/social-graph/",
+        lambda request, group_id: __import__(
+            "students.api", fromlist=["group_social_graph_api"]
+        ).group_social_graph_api(request, group_id),
+        name="api_group_social_graph",
+    ),
+    path(
+        "api/<int:student_id>/friends/",
+        lambda request, student_id: __import__(
+            "students.api", fromlist=["student_friends_api"]
+        ).student_friends_api(request, student_id),
+        name="api_student_friends",
+    ),
 ]
@@ -5,9 +5,12 @@ import json
 from .models import Student
 from dashboard.models import Group, Course
 from events.models import Event
+from cadmus.metrics import observe_rows
+from cadmus.routers import use_replica
 
 
 @login_required
+@use_replica
 def students_view(request):
     """Students list view with JSON data for JavaScript."""
     # Get all students with their groups
@@ -28,6 +31,9 @@ def students_view(request):
     students_data = [student.to_profile_dict() for student in students_list]
     courses_data = [course.to_dict() for course in courses]
     events_data = [event.to_dict() for event in events]
+    observe_rows("students_json", len(students_data))
+    observe_rows("events_json", len(events_data))
+    observe_rows("courses_json", len(courses_data))
 
     context = {
         "students": students_list,
@@ -42,6 +48,7 @@ def students_view(request):
 
 
 @login_required
+@use_replica
 def grades_view(request):
     """Grades interface view with JSON data for JavaScript."""
     # Get all students
@@ -55,6 +62,8 @@ def grades_view(request):
     # Serialize data to JSON for JavaScript
     students_data = [student.to_dict() for student in students_list]
     courses_data = [course.to_dict() for course in courses]
+    observe_rows("students_json", len(students_data))
+    observe_rows("courses_json", len(courses_data))
 
     context = {
         "students": students_list,